@@ -0,0 +1,43 @@
+"""Add revenue rollup tables
+
+Revision ID: c41d7e2a9b30
+Revises: a209a0443695
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c41d7e2a9b30"
+down_revision = "a209a0443695"
+branch_labels = None
+depends_on = None
+
+ROLLUP_TABLES = ("revenue_rollup_daily", "revenue_rollup_monthly")
+
+
+def upgrade() -> None:
+    for table in ROLLUP_TABLES:
+        op.create_table(
+            table,
+            sa.Column("period", sa.Date(), nullable=False),
+            sa.Column("status", sa.String(50), nullable=False),
+            sa.Column("customer_id", sa.String(36), nullable=False),
+            sa.Column("invoice_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("subtotal", sa.Numeric(14, 2), nullable=False, server_default="0"),
+            sa.Column("tax_amount", sa.Numeric(14, 2), nullable=False, server_default="0"),
+            sa.Column("discount_amount", sa.Numeric(14, 2), nullable=False, server_default="0"),
+            sa.Column("total_amount", sa.Numeric(14, 2), nullable=False, server_default="0"),
+            sa.PrimaryKeyConstraint("period", "status", "customer_id"),
+        )
+        op.create_index(f"ix_{table}_customer_id", table, ["customer_id"])
+
+    # Existing invoices are aggregated by `python manage.py rebuild-rollups`
+
+
+def downgrade() -> None:
+    for table in reversed(ROLLUP_TABLES):
+        op.drop_index(f"ix_{table}_customer_id", table_name=table)
+        op.drop_table(table)
@@ -0,0 +1,33 @@
+"""Add partial index on unpaid invoices
+
+Revision ID: 5e8a1f0c7d21
+Revises: c41d7e2a9b30
+Create Date: 2026-10-18 09:30:00.000000+00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5e8a1f0c7d21"
+down_revision = "c41d7e2a9b30"
+branch_labels = None
+depends_on = None
+
+UNPAID_PREDICATE = sa.text("deleted_at IS NULL AND status IN ('sent', 'overdue')")
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_invoices_unpaid_due",
+        "invoices",
+        ["customer_id", "due_date"],
+        postgresql_where=UNPAID_PREDICATE,
+        postgresql_include=["total_amount"],
+        sqlite_where=UNPAID_PREDICATE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invoices_unpaid_due", table_name="invoices")
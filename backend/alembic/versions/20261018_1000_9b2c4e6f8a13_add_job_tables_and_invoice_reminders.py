@@ -0,0 +1,53 @@
+"""Add job bookkeeping tables and invoice reminders
+
+Revision ID: 9b2c4e6f8a13
+Revises: 5e8a1f0c7d21
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "9b2c4e6f8a13"
+down_revision = "5e8a1f0c7d21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_locks",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column("owner", sa.String(255), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.create_table(
+        "job_runs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("job_name", sa.String(100), nullable=False, index=True),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_ms", sa.Integer(), nullable=False),
+        sa.Column("stats", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+    op.create_table(
+        "invoice_reminders",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("invoice_id", sa.String(36), sa.ForeignKey("invoices.id"), nullable=False, index=True),
+        sa.Column("level", sa.Integer(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True, index=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("invoice_reminders")
+    op.drop_table("job_runs")
+    op.drop_table("job_locks")
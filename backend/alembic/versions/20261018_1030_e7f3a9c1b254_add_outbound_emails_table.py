@@ -0,0 +1,47 @@
+"""Add outbound emails table
+
+Revision ID: e7f3a9c1b254
+Revises: 9b2c4e6f8a13
+Create Date: 2026-10-18 10:30:00.000000+00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e7f3a9c1b254"
+down_revision = "9b2c4e6f8a13"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbound_emails",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("to_address", sa.String(255), nullable=False),
+        sa.Column("subject", sa.String(255), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("kind", sa.String(50), nullable=True, index=True),
+        sa.Column("reference_id", sa.String(36), nullable=True, index=True),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    # The worker only ever polls pending messages
+    op.create_index(
+        "ix_outbound_emails_pending",
+        "outbound_emails",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbound_emails_pending", table_name="outbound_emails")
+    op.drop_table("outbound_emails")
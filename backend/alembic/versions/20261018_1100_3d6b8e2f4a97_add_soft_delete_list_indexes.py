@@ -0,0 +1,65 @@
+"""Add partial composite indexes for soft-delete list queries
+
+Revision ID: 3d6b8e2f4a97
+Revises: e7f3a9c1b254
+Create Date: 2026-10-18 11:00:00.000000+00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3d6b8e2f4a97"
+down_revision = "e7f3a9c1b254"
+branch_labels = None
+depends_on = None
+
+LIVE_ROWS = sa.text("deleted_at IS NULL")
+
+# (index name, table, columns) - each matches the WHERE/ORDER BY of a list endpoint
+LIVE_INDEXES = [
+    ("ix_parts_live_name", "parts", ["name", "id"]),
+    ("ix_parts_live_category_name", "parts", ["category", "name", "id"]),
+    ("ix_builds_live_name", "builds", ["name", "id"]),
+    ("ix_builds_live_status_name", "builds", ["status", "name", "id"]),
+    ("ix_customers_live_name", "customers", ["name", "id"]),
+    ("ix_customers_live_type_name", "customers", ["customer_type", "name", "id"]),
+    ("ix_suppliers_live_name", "suppliers", ["name", "id"]),
+    ("ix_deliveries_live_created", "deliveries",
+     [sa.text("created_at DESC"), sa.text("id DESC")]),
+    ("ix_deliveries_live_status_created", "deliveries",
+     ["status", sa.text("created_at DESC"), sa.text("id DESC")]),
+    ("ix_deliveries_live_customer_created", "deliveries",
+     ["customer_id", sa.text("created_at DESC"), sa.text("id DESC")]),
+    ("ix_invoices_live_created", "invoices",
+     [sa.text("created_at DESC"), sa.text("id DESC")]),
+    ("ix_invoices_live_status_created", "invoices",
+     ["status", sa.text("created_at DESC"), sa.text("id DESC")]),
+    ("ix_invoices_live_customer_created", "invoices",
+     ["customer_id", sa.text("created_at DESC"), sa.text("id DESC")]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build on
+    # PostgreSQL; it cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in LIVE_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=LIVE_ROWS,
+                postgresql_concurrently=True,
+                sqlite_where=LIVE_ROWS,
+            )
+    if op.get_bind().dialect.name == "postgresql":
+        for table in sorted({table for _, table, _ in LIVE_INDEXES}):
+            op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(LIVE_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,67 @@
+"""Add cold archive tables for soft-deleted rows
+
+Revision ID: 8c1e5a7d2f46
+Revises: 3d6b8e2f4a97
+Create Date: 2026-10-18 11:30:00.000000+00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8c1e5a7d2f46"
+down_revision = "3d6b8e2f4a97"
+branch_labels = None
+depends_on = None
+
+ARCHIVED_TABLES = [
+    "suppliers",
+    "customers",
+    "parts",
+    "builds",
+    "build_parts",
+    "deliveries",
+    "invoices",
+    "invoice_reminders",
+]
+
+
+def upgrade() -> None:
+    # Each archive table mirrors the hot table's columns as they exist at
+    # this revision, without foreign keys, unique constraints or defaults.
+    inspector = sa.inspect(op.get_bind())
+    for table in ARCHIVED_TABLES:
+        primary_key = set(inspector.get_pk_constraint(table)["constrained_columns"])
+        foreign_keys = {
+            column
+            for fk in inspector.get_foreign_keys(table)
+            for column in fk["constrained_columns"]
+        }
+        columns = [
+            sa.Column(
+                column["name"],
+                column["type"],
+                primary_key=column["name"] in primary_key,
+                nullable=column["nullable"],
+            )
+            for column in inspector.get_columns(table)
+        ]
+        op.create_table(
+            f"{table}_archive",
+            *columns,
+            sa.Column("archived_at", sa.DateTime(timezone=True),
+                      server_default=sa.func.now(), nullable=False),
+        )
+        op.create_index(
+            op.f(f"ix_{table}_archive_archived_at"), f"{table}_archive", ["archived_at"]
+        )
+        for column in sorted(foreign_keys):
+            op.create_index(
+                op.f(f"ix_{table}_archive_{column}"), f"{table}_archive", [column]
+            )
+
+
+def downgrade() -> None:
+    for table in reversed(ARCHIVED_TABLES):
+        op.drop_table(f"{table}_archive")
@@ -0,0 +1,38 @@
+"""Add slow queries table
+
+Revision ID: a4f2c9e81b35
+Revises: 8c1e5a7d2f46
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a4f2c9e81b35"
+down_revision = "8c1e5a7d2f46"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "slow_queries",
+        sa.Column("fingerprint", sa.String(16), primary_key=True),
+        sa.Column("statement", sa.Text(), nullable=False),
+        sa.Column("parameter_shape", sa.JSON(), nullable=True),
+        sa.Column("endpoint", sa.String(255), nullable=True),
+        sa.Column("plan", sa.Text(), nullable=True),
+        sa.Column("calls", sa.Integer(), nullable=False),
+        sa.Column("total_ms", sa.Float(), nullable=False),
+        sa.Column("max_ms", sa.Float(), nullable=False),
+        sa.Column("first_seen", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_seen", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(op.f("ix_slow_queries_last_seen"), "slow_queries", ["last_seen"])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_slow_queries_last_seen"), table_name="slow_queries")
+    op.drop_table("slow_queries")
@@ -0,0 +1,70 @@
+"""Store SQLite UUIDs as 16-byte blobs
+
+Revision ID: d5a8c3f1b962
+Revises: a4f2c9e81b35
+Create Date: 2026-10-18 12:30:00.000000+00:00
+
+UUID columns now use ``app.db.types.UUID``, which stores 16-byte blobs on
+SQLite instead of hex strings. This converts existing SQLite data in
+place; the declared column types are left alone, as SQLite stores blobs
+unchanged whatever the column affinity. PostgreSQL is unaffected.
+"""
+
+import uuid
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d5a8c3f1b962"
+down_revision = "a4f2c9e81b35"
+branch_labels = None
+depends_on = None
+
+UUID_COLUMNS = {
+    "users": ["id"],
+    "parts": ["id"],
+    "suppliers": ["id"],
+    "customers": ["id"],
+    "builds": ["id"],
+    "build_parts": ["id", "build_id", "part_id"],
+    "deliveries": ["id", "customer_id", "build_id"],
+    "invoices": ["id", "customer_id", "delivery_id"],
+    "invoice_reminders": ["id", "invoice_id"],
+    "revenue_rollup_daily": ["customer_id"],
+    "revenue_rollup_monthly": ["customer_id"],
+    "job_runs": ["id"],
+    "outbound_emails": ["id", "reference_id"],
+    "suppliers_archive": ["id"],
+    "customers_archive": ["id"],
+    "parts_archive": ["id"],
+    "builds_archive": ["id"],
+    "build_parts_archive": ["id", "build_id", "part_id"],
+    "deliveries_archive": ["id", "customer_id", "build_id"],
+    "invoices_archive": ["id", "customer_id", "delivery_id"],
+    "invoice_reminders_archive": ["id", "invoice_id"],
+}
+
+
+def _convert(stored_type: str, convert) -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+    for table, columns in UUID_COLUMNS.items():
+        for column in columns:
+            rows = bind.exec_driver_sql(
+                f"SELECT rowid, {column} FROM {table} WHERE typeof({column}) = '{stored_type}'"
+            ).fetchall()
+            if rows:
+                bind.exec_driver_sql(
+                    f"UPDATE {table} SET {column} = ? WHERE rowid = ?",
+                    [(convert(value), rowid) for rowid, value in rows],
+                )
+
+
+def upgrade() -> None:
+    # Hex strings (with or without dashes) become 16-byte blobs
+    _convert("text", lambda value: uuid.UUID(value).bytes)
+
+
+def downgrade() -> None:
+    _convert("blob", lambda value: uuid.UUID(bytes=bytes(value)).hex)
@@ -0,0 +1,100 @@
+"""Add part specification search indexes
+
+Revision ID: 6b1d4f7a2c58
+Revises: d5a8c3f1b962
+Create Date: 2026-10-18 13:00:00.000000+00:00
+
+``part_spec_values`` holds every top-level scalar of ``parts.specifications``
+as typed key/value rows for range filters, and is filled from the existing
+parts here. On PostgreSQL ``specifications`` becomes JSONB (also in
+``parts_archive``) with a GIN index for containment filters.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "6b1d4f7a2c58"
+down_revision = "d5a8c3f1b962"
+branch_labels = None
+depends_on = None
+
+BACKFILL_SQL = {
+    "postgresql": """
+        INSERT INTO part_spec_values (part_id, key, num_value, text_value)
+        SELECT p.id, e.key,
+               CASE WHEN jsonb_typeof(e.value) = 'number' THEN (e.value #>> '{}')::float8 END,
+               CASE WHEN length(e.value #>> '{}') <= 255 THEN e.value #>> '{}' END
+        FROM parts p, jsonb_each(p.specifications) e
+        WHERE jsonb_typeof(p.specifications) = 'object'
+          AND jsonb_typeof(e.value) IN ('string', 'number', 'boolean')
+          AND length(e.key) <= 100
+    """,
+    "sqlite": """
+        INSERT INTO part_spec_values (part_id, key, num_value, text_value)
+        SELECT p.id, e.key,
+               CASE WHEN e.type IN ('integer', 'real') THEN e.value END,
+               CASE WHEN e.type = 'true' THEN 'true'
+                    WHEN e.type = 'false' THEN 'false'
+                    WHEN length(CAST(e.value AS TEXT)) <= 255 THEN CAST(e.value AS TEXT) END
+        FROM parts p, json_each(p.specifications) e
+        WHERE json_type(p.specifications) = 'object'
+          AND e.type IN ('text', 'integer', 'real', 'true', 'false')
+          AND length(e.key) <= 100
+    """,
+}
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for table in ("parts", "parts_archive"):
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN specifications TYPE JSONB "
+                "USING specifications::jsonb"
+            )
+
+    op.create_table(
+        "part_spec_values",
+        sa.Column("part_id", sa.UUID(),
+                  sa.ForeignKey("parts.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("key", sa.String(100), primary_key=True),
+        sa.Column("num_value", sa.Float(), nullable=True),
+        sa.Column("text_value", sa.String(255), nullable=True),
+    )
+    op.create_index("ix_part_spec_values_key_num", "part_spec_values", ["key", "num_value", "part_id"])
+    op.create_index("ix_part_spec_values_key_text", "part_spec_values", ["key", "text_value", "part_id"])
+    if dialect in BACKFILL_SQL:
+        op.execute(BACKFILL_SQL[dialect])
+
+    if dialect == "postgresql":
+        # CONCURRENTLY keeps parts writable while the index builds
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_parts_specifications",
+                "parts",
+                ["specifications"],
+                postgresql_using="gin",
+                postgresql_ops={"specifications": "jsonb_path_ops"},
+                postgresql_concurrently=True,
+            )
+        op.execute("ANALYZE parts")
+        op.execute("ANALYZE part_spec_values")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index("ix_parts_specifications", table_name="parts", postgresql_concurrently=True)
+
+    op.drop_index("ix_part_spec_values_key_text", table_name="part_spec_values")
+    op.drop_index("ix_part_spec_values_key_num", table_name="part_spec_values")
+    op.drop_table("part_spec_values")
+
+    if dialect == "postgresql":
+        for table in ("parts", "parts_archive"):
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN specifications TYPE JSON "
+                "USING specifications::json"
+            )
@@ -0,0 +1,53 @@
+"""Add generated stock status columns to parts
+
+Revision ID: f2a7c4e9d186
+Revises: 6b1d4f7a2c58
+Create Date: 2026-10-18 13:30:00.000000+00:00
+
+``is_low_stock`` and ``stock_status`` are computed by the database from
+``current_stock`` and ``minimum_stock``. PostgreSQL stores them (adding
+them rewrites ``parts`` under an exclusive lock); SQLite can only add
+virtual generated columns, which it computes on read and can index all
+the same. ``ix_parts_live_low_stock`` covers only live low-stock rows.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "f2a7c4e9d186"
+down_revision = "6b1d4f7a2c58"
+branch_labels = None
+depends_on = None
+
+IS_LOW_STOCK = "current_stock < minimum_stock"
+STOCK_STATUS = (
+    "CASE WHEN current_stock = 0 THEN 'out_of_stock' "
+    "WHEN current_stock < minimum_stock THEN 'low_stock' "
+    "ELSE 'in_stock' END"
+)
+
+
+def upgrade() -> None:
+    op.add_column("parts", sa.Column("is_low_stock", sa.Boolean(), sa.Computed(IS_LOW_STOCK)))
+    op.add_column("parts", sa.Column("stock_status", sa.String(20), sa.Computed(STOCK_STATUS)))
+
+    # CONCURRENTLY keeps parts writable while the index builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_parts_live_low_stock",
+            "parts",
+            ["name", "id"],
+            postgresql_where=sa.text("deleted_at IS NULL AND is_low_stock"),
+            postgresql_concurrently=True,
+            sqlite_where=sa.text("deleted_at IS NULL AND is_low_stock = 1"),
+        )
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("ANALYZE parts")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_parts_live_low_stock", table_name="parts", postgresql_concurrently=True)
+    op.drop_column("parts", "stock_status")
+    op.drop_column("parts", "is_low_stock")
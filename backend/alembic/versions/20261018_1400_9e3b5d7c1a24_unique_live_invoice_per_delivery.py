@@ -0,0 +1,52 @@
+"""Allow at most one live invoice per delivery
+
+Revision ID: 9e3b5d7c1a24
+Revises: f2a7c4e9d186
+Create Date: 2026-10-18 14:00:00.000000+00:00
+
+Backs the billing run's "not yet invoiced" check with a partial unique
+index, so two transactions can never both bill the same delivery.
+Existing duplicates must be resolved (cancelled and soft-deleted) first;
+the upgrade stops and lists them instead of picking a winner.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "9e3b5d7c1a24"
+down_revision = "f2a7c4e9d186"
+branch_labels = None
+depends_on = None
+
+LIVE_ROWS = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT delivery_id FROM invoices "
+        "WHERE deleted_at IS NULL AND delivery_id IS NOT NULL "
+        "GROUP BY delivery_id HAVING count(*) > 1"
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            "Deliveries with more than one live invoice: "
+            + ", ".join(str(delivery_id) for delivery_id in duplicates)
+        )
+
+    # CONCURRENTLY keeps invoices writable while the index builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_invoices_live_delivery",
+            "invoices",
+            ["delivery_id"],
+            unique=True,
+            postgresql_where=LIVE_ROWS,
+            postgresql_concurrently=True,
+            sqlite_where=LIVE_ROWS,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ux_invoices_live_delivery", table_name="invoices", postgresql_concurrently=True)
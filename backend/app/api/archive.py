@@ -0,0 +1,60 @@
+"""Endpoints for restoring records from the cold archive tables."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from uuid import UUID
+
+from app.db import get_db
+from app.api.deps import get_current_active_superuser
+from app.models.user import User
+from app.services.archival import ARCHIVE_ORDER, ArchiveConflict, restore
+from app.schemas.archive import ArchiveRestoreResult
+
+router = APIRouter(prefix="/archive", tags=["archive"])
+
+
+@router.post("/{table}/{record_id}/restore", response_model=ArchiveRestoreResult)
+def restore_record(
+    table: str,
+    record_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """Move an archived record back into its live table.
+
+    The record is restored undeleted, together with its archived build
+    parts or invoice reminders. Records it references must be live.
+
+    Args:
+        table: Table name (invoices, deliveries, builds, parts, customers, suppliers)
+        record_id: ID of the archived record
+        db: Database session
+        current_user: Current superuser
+
+    Returns:
+        Number of rows restored per table
+
+    Raises:
+        HTTPException: If the record is not archived or cannot be restored
+    """
+    if table not in ARCHIVE_ORDER:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown table '{table}'",
+        )
+
+    try:
+        restored = restore(db, table, record_id)
+    except ArchiveConflict as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+        )
+
+    if restored is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archived record not found",
+        )
+
+    return ArchiveRestoreResult(table=table, id=record_id, restored=restored)
@@ -2,9 +2,10 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy import or_, select
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from math import ceil
 
@@ -18,12 +19,62 @@ from app.schemas.build import (
     BuildCreate,
     BuildUpdate,
     BuildList,
+    BuildPartCreate,
     BuildPartResponse,
 )
 
 router = APIRouter(prefix="/builds", tags=["builds"])
 
 
+def load_parts(db: Session, part_items: List[BuildPartCreate]) -> List[Part]:
+    """Fetch the parts referenced by a build in one query.
+
+    Args:
+        db: Database session
+        part_items: Requested parts and quantities
+
+    Returns:
+        The distinct parts, in request order
+
+    Raises:
+        HTTPException: If a part does not exist
+    """
+    part_ids = list(dict.fromkeys(item.part_id for item in part_items))
+    if not part_ids:
+        return []
+    found = {
+        part.id: part
+        for part in db.query(Part).filter(Part.id.in_(part_ids), Part.deleted_at.is_(None))
+    }
+    for part_id in part_ids:
+        if part_id not in found:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Part with ID {part_id} not found",
+            )
+    return [found[part_id] for part_id in part_ids]
+
+
+def add_parts(db: Session, build: Build, part_items: List[BuildPartCreate], parts: List[Part]) -> None:
+    """Insert a build's bill of materials in one statement.
+
+    The build's ``parts`` collection is set from ``parts`` directly, so the
+    response needs no reload after commit.
+
+    Args:
+        db: Database session
+        build: Flushed build
+        part_items: Requested parts and quantities
+        parts: The parts, as returned by ``load_parts``
+    """
+    if part_items:
+        db.execute(build_parts.insert(), [
+            {"build_id": build.id, "part_id": item.part_id, "quantity": item.quantity}
+            for item in part_items
+        ])
+    set_committed_value(build, "parts", parts)
+
+
 @router.get("/", response_model=BuildList)
 def list_builds(
     page: int = Query(1, ge=1, description="Page number"),
@@ -73,29 +124,30 @@ def list_builds(
 
     # Apply pagination
     offset = (page - 1) * per_page
-    builds = query.order_by(Build.name).offset(offset).limit(per_page).all()
+    builds = query.order_by(Build.name, Build.id).offset(offset).limit(per_page).all()
+
+    # Parts with quantities of every build on the page, in one query
+    part_responses = {build.id: [] for build in builds}
+    if builds:
+        stmt = (
+            select(build_parts.c.build_id, build_parts.c.part_id, build_parts.c.quantity,
+                   Part.name, Part.sku)
+            .join(Part, Part.id == build_parts.c.part_id)
+            .where(build_parts.c.build_id.in_(part_responses))
+        )
+        for build_id, part_id, quantity, part_name, part_sku in db.execute(stmt):
+            part_responses[build_id].append(BuildPartResponse(
+                part_id=part_id,
+                quantity=quantity,
+                part_name=part_name,
+                part_sku=part_sku
+            ))
 
     # Convert builds to response format with part details
     builds_with_parts = []
     for build in builds:
         build_dict = BuildSchema.model_validate(build).model_dump()
-
-        # Get parts with quantities from junction table
-        stmt = select(build_parts.c.part_id, build_parts.c.quantity).where(build_parts.c.build_id == build.id)
-        result = db.execute(stmt).all()
-
-        part_responses = []
-        for part_id, quantity in result:
-            part = db.query(Part).filter(Part.id == part_id).first()
-            if part:
-                part_responses.append(BuildPartResponse(
-                    part_id=part_id,
-                    quantity=quantity,
-                    part_name=part.name,
-                    part_sku=part.sku
-                ))
-
-        build_dict['parts'] = part_responses
+        build_dict['parts'] = part_responses[build.id]
         builds_with_parts.append(build_dict)
 
     return BuildList(
@@ -137,13 +189,7 @@ def create_build(
             )
 
     # Validate that all parts exist
-    for part_item in build_data.parts:
-        part = db.query(Part).filter(Part.id == part_item.part_id, Part.deleted_at.is_(None)).first()
-        if not part:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Part with ID {part_item.part_id} not found",
-            )
+    parts = load_parts(db, build_data.parts)
 
     # Create build (exclude parts from initial creation)
     build_dict = build_data.model_dump(exclude={'parts'})
@@ -152,16 +198,9 @@ def create_build(
     db.flush()  # Get the build ID before adding parts
 
     # Add parts to build via junction table
-    for part_item in build_data.parts:
-        stmt = build_parts.insert().values(
-            build_id=build.id,
-            part_id=part_item.part_id,
-            quantity=part_item.quantity
-        )
-        db.execute(stmt)
+    add_parts(db, build, build_data.parts, parts)
 
     db.commit()
-    db.refresh(build)
 
     return build
 
@@ -256,29 +295,16 @@ def update_build(
     # Update parts if provided
     if build_data.parts is not None:
         # Validate all parts exist
-        for part_item in build_data.parts:
-            part = db.query(Part).filter(Part.id == part_item.part_id, Part.deleted_at.is_(None)).first()
-            if not part:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Part with ID {part_item.part_id} not found",
-                )
+        parts = load_parts(db, build_data.parts)
 
         # Delete existing parts relationships
         delete_stmt = build_parts.delete().where(build_parts.c.build_id == build.id)
         db.execute(delete_stmt)
 
         # Add new parts
-        for part_item in build_data.parts:
-            stmt = build_parts.insert().values(
-                build_id=build.id,
-                part_id=part_item.part_id,
-                quantity=part_item.quantity
-            )
-            db.execute(stmt)
+        add_parts(db, build, build_data.parts, parts)
 
     db.commit()
-    db.refresh(build)
 
     return build
 
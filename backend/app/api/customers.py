@@ -73,7 +73,7 @@ def list_customers(
 
     # Apply pagination
     offset = (page - 1) * per_page
-    customers = query.order_by(Customer.name).offset(offset).limit(per_page).all()
+    customers = query.order_by(Customer.name, Customer.id).offset(offset).limit(per_page).all()
 
     return CustomerList(
         items=customers,
@@ -117,7 +117,6 @@ def create_customer(
     customer = Customer(**customer_data.model_dump())
     db.add(customer)
     db.commit()
-    db.refresh(customer)
 
     return customer
 
@@ -193,7 +192,6 @@ def update_customer(
         setattr(customer, field, value)
 
     db.commit()
-    db.refresh(customer)
 
     return customer
 
@@ -0,0 +1,32 @@
+"""Dashboard endpoints."""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.db import get_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.schemas.dashboard import DashboardSummary
+from app.services import dashboard as dashboard_service
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("/summary", response_model=DashboardSummary)
+def get_dashboard_summary(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get aggregate counts for parts, deliveries and invoices.
+
+    Each section is computed with a single grouped query and cached until
+    its source table is written to or the cache TTL expires.
+
+    Args:
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Dashboard summary
+    """
+    return dashboard_service.get_summary(db)
@@ -1,19 +1,21 @@
 """Delivery management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, or_, select
 from uuid import UUID
 from typing import Optional
 from datetime import datetime
 from math import ceil
 
-from app.db import get_db
-from app.api.deps import get_current_user
+from app.db import get_db, replicas
+from app.api.deps import get_current_user, keyset_page
 from app.models.user import User
 from app.models.delivery import Delivery
 from app.models.customer import Customer
 from app.models.build import Build
+from app.services import documents
+from app.services.notifications import queue_delivery_note_email
 from app.schemas.delivery import (
     Delivery as DeliverySchema,
     DeliveryCreate,
@@ -23,21 +25,33 @@ from app.schemas.delivery import (
 
 router = APIRouter(prefix="/deliveries", tags=["deliveries"])
 
+DELIVERY_PREFIX = "DEL-"
+
+# Arbitrary constant identifying the delivery-number advisory lock
+DELIVERY_NUMBER_LOCK_KEY = 4_720_002
+
 
 def generate_delivery_number(db: Session) -> str:
-    """Generate unique delivery number."""
-    # Get last delivery number
-    last_delivery = db.query(Delivery).order_by(Delivery.created_at.desc()).first()
-    if last_delivery and last_delivery.delivery_number:
-        try:
-            last_num = int(last_delivery.delivery_number.split('-')[1])
-            new_num = last_num + 1
-        except (IndexError, ValueError):
-            new_num = 1
-    else:
-        new_num = 1
-    
-    return f"DEL-{new_num:06d}"
+    """Generate unique delivery number.
+
+    The number is read under a lock held until the caller commits, so
+    concurrent requests cannot hand out the same number.
+    """
+    # The write lock on SQLite, an advisory lock on PostgreSQL
+    replicas.use_primary(db)
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(DELIVERY_NUMBER_LOCK_KEY)))
+
+    # Numbers are zero-padded, so the string maximum is the numeric maximum
+    last_number = db.query(func.max(Delivery.delivery_number)).filter(
+        Delivery.delivery_number.like(f"{DELIVERY_PREFIX}%")
+    ).scalar()
+    try:
+        last = int(last_number[len(DELIVERY_PREFIX):]) if last_number else 0
+    except ValueError:
+        last = 0
+
+    return f"{DELIVERY_PREFIX}{last + 1:06d}"
 
 
 @router.get("/", response_model=DeliveryList)
@@ -47,6 +61,7 @@ def list_deliveries(
     search: Optional[str] = Query(None, description="Search by delivery number or tracking number"),
     status: Optional[str] = Query(None, description="Filter by status"),
     customer_id: Optional[UUID] = Query(None, description="Filter by customer"),
+    after: Optional[UUID] = Query(None, description="Continue after this delivery (keyset pagination instead of page)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -69,17 +84,22 @@ def list_deliveries(
         )
 
     total = query.count()
-    total_pages = ceil(total / per_page)
+
+    if after:
+        # Seek past the previous page's last row on the (created_at, id) index
+        deliveries = keyset_page(db, query, Delivery, after, per_page)
+        # Page numbers have no meaning when seeking by cursor
+        return DeliveryList(items=deliveries, total=total, per_page=per_page)
 
     offset = (page - 1) * per_page
-    deliveries = query.order_by(Delivery.created_at.desc()).offset(offset).limit(per_page).all()
+    deliveries = query.order_by(Delivery.created_at.desc(), Delivery.id.desc()).offset(offset).limit(per_page).all()
 
     return DeliveryList(
         items=deliveries,
         total=total,
         page=page,
         per_page=per_page,
-        total_pages=total_pages,
+        total_pages=ceil(total / per_page),
     )
 
 
@@ -120,7 +140,6 @@ def create_delivery(
     delivery = Delivery(**delivery_dict, delivery_number=delivery_number)
     db.add(delivery)
     db.commit()
-    db.refresh(delivery)
 
     return delivery
 
@@ -170,7 +189,6 @@ def update_delivery(
         setattr(delivery, field, value)
 
     db.commit()
-    db.refresh(delivery)
 
     return delivery
 
@@ -195,3 +213,66 @@ def delete_delivery(
 
     delivery.deleted_at = datetime.utcnow()
     db.commit()
+
+
+@router.post(
+    "/{delivery_id}/send-note",
+    response_model=DeliverySchema,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def send_delivery_note(
+    delivery_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Queue the delivery note email to the customer.
+
+    The email is delivered asynchronously by the outbox worker.
+    """
+    delivery = db.query(Delivery).filter(
+        Delivery.id == delivery_id,
+        Delivery.deleted_at.is_(None),
+    ).first()
+
+    if not delivery:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Delivery not found",
+        )
+
+    if not delivery.customer.email:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Customer has no email address",
+        )
+
+    queue_delivery_note_email(db, delivery)
+    db.commit()
+
+    return delivery
+
+
+@router.get("/{delivery_id}/pdf", response_class=Response)
+def get_delivery_note_pdf(
+    delivery_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Download the delivery note as PDF (rendered once per delivery revision)."""
+    delivery = db.query(Delivery).filter(
+        Delivery.id == delivery_id,
+        Delivery.deleted_at.is_(None),
+    ).first()
+
+    if not delivery:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Delivery not found",
+        )
+
+    payload = documents.delivery_payload(delivery)
+    return Response(
+        content=documents.get_document(payload),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'inline; filename="{payload["filename"]}"'},
+    )
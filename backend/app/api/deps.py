@@ -1,10 +1,11 @@
 """API dependencies for dependency injection."""
 
-from typing import Generator, Optional
+from typing import Any, Generator, List, Optional
 from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Query, Session, aliased
 from app.db import get_db
 from app.core.security import decode_token
 from app.models.user import User
@@ -99,3 +100,37 @@ def get_current_active_superuser(
             detail="Not enough permissions"
         )
     return current_user
+
+
+def keyset_page(db: Session, query: Query, model: Any, after: UUID, limit: int) -> List[Any]:
+    """Rows of ``query`` that follow row ``after`` in ``(created_at, id)`` descending order.
+
+    The cursor's sort key is compared inside the database (so timestamps
+    never round-trip through Python). A soft-deleted row still marks its
+    position in the list, so clients can page past rows deleted meanwhile.
+
+    Args:
+        db: Database session
+        query: Filtered list query on ``model``
+        model: Listed model (with ``created_at`` and ``id``)
+        after: ID of the last row of the previous page
+        limit: Page size
+
+    Returns:
+        Up to ``limit`` rows
+
+    Raises:
+        HTTPException: If the cursor row does not exist (never created or archived)
+    """
+    anchor = aliased(model)
+    cursor = select(anchor.created_at, anchor.id).where(anchor.id == after).scalar_subquery()
+    rows = query.filter(tuple_(model.created_at, model.id) < cursor).order_by(
+        model.created_at.desc(), model.id.desc()
+    ).limit(limit).all()
+    # An empty page is either the end of the list or an unknown cursor
+    if not rows and db.query(model.id).filter(model.id == after).first() is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown cursor: no {model.__tablename__} row with id {after}"
+        )
+    return rows
@@ -0,0 +1,141 @@
+"""Performance diagnostics endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+from math import ceil
+
+from app.core import profiling
+from app.db import get_db
+from app.api.deps import get_current_active_superuser
+from app.models.user import User
+from app.models.slow_query import SlowQuery
+from app.schemas.diagnostics import ProfileSummary, SlowQuery as SlowQuerySchema, SlowQueryList
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+SLOW_QUERY_ORDER = {
+    "total": SlowQuery.total_ms.desc(),
+    "max": SlowQuery.max_ms.desc(),
+    "calls": SlowQuery.calls.desc(),
+    "recent": SlowQuery.last_seen.desc(),
+}
+
+
+@router.get("/slow-queries", response_model=SlowQueryList)
+def list_slow_queries(
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(50, ge=1, le=100, description="Items per page"),
+    order_by: str = Query("total", pattern="^(total|max|calls|recent)$",
+                          description="Sort by total time, max time, calls or last seen"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """List slow statements aggregated by fingerprint, worst first.
+
+    Args:
+        page: Page number (starts at 1)
+        per_page: Number of items per page
+        order_by: total, max, calls or recent
+        db: Database session
+        current_user: Current superuser
+
+    Returns:
+        Paginated list of slow statements with their plans
+    """
+    query = db.query(SlowQuery)
+
+    total = query.count()
+    total_pages = ceil(total / per_page)
+
+    offset = (page - 1) * per_page
+    rows = query.order_by(SLOW_QUERY_ORDER[order_by]).offset(offset).limit(per_page).all()
+
+    items = [
+        SlowQuerySchema(
+            fingerprint=row.fingerprint,
+            statement=row.statement,
+            parameter_shape=row.parameter_shape,
+            endpoint=row.endpoint,
+            plan=row.plan,
+            calls=row.calls,
+            total_ms=row.total_ms,
+            max_ms=row.max_ms,
+            mean_ms=row.total_ms / row.calls if row.calls else 0.0,
+            first_seen=row.first_seen,
+            last_seen=row.last_seen,
+        )
+        for row in rows
+    ]
+
+    return SlowQueryList(
+        items=items,
+        total=total,
+        page=page,
+        per_page=per_page,
+        total_pages=total_pages,
+    )
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """Reset the slow query log, e.g. after deploying a fix."""
+    db.query(SlowQuery).delete(synchronize_session=False)
+    db.commit()
+
+
+@router.get("/profiles", response_model=list[ProfileSummary])
+def list_profiles(
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """List request profiles in this worker's rolling store, newest first.
+
+    Args:
+        current_user: Current superuser
+
+    Returns:
+        Stored profiles without their samples
+    """
+    return [
+        ProfileSummary(
+            id=profile.id,
+            endpoint=profile.endpoint,
+            started_at=profile.started_at,
+            duration_ms=profile.duration_ms,
+            status_code=profile.status_code,
+            samples=len(profile.samples),
+        )
+        for profile in profiling.stored_profiles()
+    ]
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(
+    profile_id: str,
+    format: str = Query("speedscope", pattern="^(speedscope|collapsed)$",
+                        description="speedscope JSON or collapsed stacks"),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """Download a stored request profile.
+
+    Args:
+        profile_id: Profile ID (also sent in the X-Profile-Id header)
+        format: speedscope or collapsed
+        current_user: Current superuser
+
+    Returns:
+        The profile, ready for speedscope.app or flamegraph.pl
+
+    Raises:
+        HTTPException: If the profile is not in the store
+    """
+    profile = profiling.get_profile(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    body, content_type = profile.render(format)
+    return Response(content=body, media_type=content_type)
@@ -0,0 +1,79 @@
+"""Bulk document rendering endpoints."""
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Literal, Optional
+from datetime import date, datetime, time
+
+from app.db import get_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.invoice import Invoice
+from app.models.delivery import Delivery
+from app.services import documents
+
+router = APIRouter(prefix="/documents", tags=["documents"])
+
+
+@router.get("/bulk")
+def bulk_documents(
+    start: date = Query(..., description="First day (inclusive)"),
+    end: date = Query(..., description="Last day (inclusive)"),
+    kind: Literal["invoice", "delivery_note"] = Query("invoice", description="Document type"),
+    status: Optional[str] = Query(None, description="Filter by record status"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream a ZIP with the PDFs of all invoices or deliveries in a date range.
+
+    Invoices are selected by invoice date, deliveries by creation date.
+    Documents are rendered in parallel by the render pool; cached ones are
+    reused.
+
+    Args:
+        start: First day of the range
+        end: Last day of the range
+        kind: "invoice" or "delivery_note"
+        status: Only include records with this status
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Streaming ZIP archive
+    """
+    range_start = datetime.combine(start, time.min)
+    range_end = datetime.combine(end, time.max)
+
+    if kind == "invoice":
+        query = db.query(Invoice).filter(
+            Invoice.deleted_at.is_(None),
+            Invoice.invoice_date >= range_start,
+            Invoice.invoice_date <= range_end,
+        )
+        if status:
+            query = query.filter(Invoice.status == status)
+        payloads = [
+            documents.invoice_payload(invoice)
+            for invoice in query.order_by(Invoice.invoice_number).all()
+        ]
+    else:
+        query = db.query(Delivery).filter(
+            Delivery.deleted_at.is_(None),
+            Delivery.created_at >= range_start,
+            Delivery.created_at <= range_end,
+        )
+        if status:
+            query = query.filter(Delivery.status == status)
+        payloads = [
+            documents.delivery_payload(delivery)
+            for delivery in query.order_by(Delivery.delivery_number).all()
+        ]
+
+    # Payloads are plain dicts, so the session can close before streaming
+    filename = f"{kind}s_{start.isoformat()}_{end.isoformat()}.zip"
+    return StreamingResponse(
+        documents.iter_zip(payloads),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,8 +1,9 @@
 """Invoice management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from uuid import UUID
 from typing import Optional
 from datetime import datetime
@@ -10,34 +11,55 @@ from math import ceil
 from decimal import Decimal
 
 from app.db import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, keyset_page
 from app.models.user import User
 from app.models.invoice import Invoice
 from app.models.customer import Customer
 from app.models.delivery import Delivery
+from app.services import documents, revenue_rollups
+from app.services.billing import allocate_invoice_numbers, run_billing
+from app.services.notifications import queue_invoice_email
 from app.schemas.invoice import (
     Invoice as InvoiceSchema,
     InvoiceCreate,
     InvoiceUpdate,
     InvoiceList,
+    BillingRunRequest,
+    BillingRunResult,
 )
 
 router = APIRouter(prefix="/invoices", tags=["invoices"])
 
+# Unique index allowing one live invoice per delivery
+LIVE_DELIVERY_INDEX = "ux_invoices_live_delivery"
+
 
 def generate_invoice_number(db: Session) -> str:
     """Generate unique invoice number."""
-    last_invoice = db.query(Invoice).order_by(Invoice.created_at.desc()).first()
-    if last_invoice and last_invoice.invoice_number:
-        try:
-            last_num = int(last_invoice.invoice_number.split('-')[1])
-            new_num = last_num + 1
-        except (IndexError, ValueError):
-            new_num = 1
-    else:
-        new_num = 1
-    
-    return f"INV-{new_num:06d}"
+    return allocate_invoice_numbers(db, 1)[0]
+
+
+def _is_delivery_invoiced(exc: IntegrityError) -> bool:
+    """Whether ``exc`` violates the one-live-invoice-per-delivery index."""
+    diag = getattr(exc.orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name == LIVE_DELIVERY_INDEX
+    # SQLite names the indexed columns instead of the index
+    return str(exc.orig) == "UNIQUE constraint failed: invoices.delivery_id"
+
+
+def flush_invoice(db: Session) -> None:
+    """Flush a new or changed invoice; 409 if its delivery is already invoiced."""
+    try:
+        db.flush()
+    except IntegrityError as exc:
+        db.rollback()
+        if not _is_delivery_invoiced(exc):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Delivery already has an invoice"
+        )
 
 
 @router.get("/", response_model=InvoiceList)
@@ -47,6 +69,7 @@ def list_invoices(
     search: Optional[str] = Query(None, description="Search by invoice number"),
     status: Optional[str] = Query(None, description="Filter by status"),
     customer_id: Optional[UUID] = Query(None, description="Filter by customer"),
+    after: Optional[UUID] = Query(None, description="Continue after this invoice (keyset pagination instead of page)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -64,17 +87,22 @@ def list_invoices(
         query = query.filter(Invoice.invoice_number.ilike(search_term))
 
     total = query.count()
-    total_pages = ceil(total / per_page)
+
+    if after:
+        # Seek past the previous page's last row on the (created_at, id) index
+        invoices = keyset_page(db, query, Invoice, after, per_page)
+        # Page numbers have no meaning when seeking by cursor
+        return InvoiceList(items=invoices, total=total, per_page=per_page)
 
     offset = (page - 1) * per_page
-    invoices = query.order_by(Invoice.created_at.desc()).offset(offset).limit(per_page).all()
+    invoices = query.order_by(Invoice.created_at.desc(), Invoice.id.desc()).offset(offset).limit(per_page).all()
 
     return InvoiceList(
         items=invoices,
         total=total,
         page=page,
         per_page=per_page,
-        total_pages=total_pages,
+        total_pages=ceil(total / per_page),
     )
 
 
@@ -124,12 +152,42 @@ def create_invoice(
         status='draft'
     )
     db.add(invoice)
+    flush_invoice(db)
+    revenue_rollups.record_change(db, None, revenue_rollups.contribution_of(invoice))
     db.commit()
-    db.refresh(invoice)
 
     return invoice
 
 
+@router.post("/billing-run", response_model=BillingRunResult)
+def billing_run(
+    run_data: BillingRunRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Create draft invoices for all delivered, not yet invoiced deliveries in a date range."""
+    if run_data.end < run_data.start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must not be before start"
+        )
+    try:
+        return run_billing(
+            db,
+            run_data.start,
+            run_data.end,
+            due_in_days=run_data.due_in_days,
+            tax_rate=run_data.tax_rate,
+            dry_run=run_data.dry_run,
+        )
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Invoices were created concurrently, please retry"
+        )
+
+
 @router.get("/{invoice_id}", response_model=InvoiceSchema)
 def get_invoice(
     invoice_id: UUID,
@@ -170,8 +228,9 @@ def update_invoice(
             detail="Invoice not found",
         )
 
+    before = revenue_rollups.contribution_of(invoice)
     update_data = invoice_data.model_dump(exclude_unset=True)
-    
+
     # Recalculate if amounts change
     if 'subtotal' in update_data or 'tax_rate' in update_data or 'discount_amount' in update_data:
         subtotal = update_data.get('subtotal', invoice.subtotal)
@@ -187,8 +246,9 @@ def update_invoice(
     for field, value in update_data.items():
         setattr(invoice, field, value)
 
+    flush_invoice(db)
+    revenue_rollups.record_change(db, before, revenue_rollups.contribution_of(invoice))
     db.commit()
-    db.refresh(invoice)
 
     return invoice
 
@@ -211,5 +271,75 @@ def delete_invoice(
             detail="Invoice not found",
         )
 
+    before = revenue_rollups.contribution_of(invoice)
     invoice.deleted_at = datetime.utcnow()
+    revenue_rollups.record_change(db, before, None)
     db.commit()
+
+
+@router.post(
+    "/{invoice_id}/send",
+    response_model=InvoiceSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def send_invoice(
+    invoice_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Queue the invoice email to the customer and mark draft invoices sent.
+
+    The email is delivered asynchronously by the outbox worker.
+    """
+    invoice = db.query(Invoice).filter(
+        Invoice.id == invoice_id,
+        Invoice.deleted_at.is_(None),
+    ).first()
+
+    if not invoice:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Invoice not found",
+        )
+
+    if not invoice.customer.email:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Customer has no email address",
+        )
+
+    if invoice.status == 'draft':
+        before = revenue_rollups.contribution_of(invoice)
+        invoice.status = 'sent'
+        revenue_rollups.record_change(db, before, revenue_rollups.contribution_of(invoice))
+
+    queue_invoice_email(db, invoice)
+    db.commit()
+
+    return invoice
+
+
+@router.get("/{invoice_id}/pdf", response_class=Response)
+def get_invoice_pdf(
+    invoice_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Download the invoice as PDF (rendered once per invoice revision)."""
+    invoice = db.query(Invoice).filter(
+        Invoice.id == invoice_id,
+        Invoice.deleted_at.is_(None),
+    ).first()
+
+    if not invoice:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Invoice not found",
+        )
+
+    payload = documents.invoice_payload(invoice)
+    return Response(
+        content=documents.get_document(payload),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'inline; filename="{payload["filename"]}"'},
+    )
@@ -0,0 +1,59 @@
+"""Background job monitoring endpoints."""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from math import ceil
+
+from app.db import get_db
+from app.api.deps import get_current_active_superuser
+from app.models.user import User
+from app.models.job import JobRun
+from app.schemas.job import JobRunList
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("/runs", response_model=JobRunList)
+def list_job_runs(
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(50, ge=1, le=100, description="Items per page"),
+    job_name: Optional[str] = Query(None, description="Filter by job name"),
+    status: Optional[str] = Query(None, description="Filter by run status"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """List recorded background job runs, newest first.
+
+    Args:
+        page: Page number (starts at 1)
+        per_page: Number of items per page
+        job_name: Only runs of this job
+        status: Only runs with this status (success, failed)
+        db: Database session
+        current_user: Current superuser
+
+    Returns:
+        Paginated list of job runs
+    """
+    query = db.query(JobRun)
+
+    if job_name:
+        query = query.filter(JobRun.job_name == job_name)
+
+    if status:
+        query = query.filter(JobRun.status == status)
+
+    total = query.count()
+    total_pages = ceil(total / per_page)
+
+    offset = (page - 1) * per_page
+    runs = query.order_by(JobRun.started_at.desc()).offset(offset).limit(per_page).all()
+
+    return JobRunList(
+        items=runs,
+        total=total,
+        page=page,
+        per_page=per_page,
+        total_pages=total_pages,
+    )
@@ -1,9 +1,9 @@
 """Parts management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, func
-from typing import Optional
+from typing import Any, List, Optional
 from uuid import UUID
 from datetime import datetime
 from app.db import get_db
@@ -13,17 +13,73 @@ from app.schemas.part import (
     PartCreate,
     PartUpdate,
     PartList,
+    PartFacets,
     StockAdjustment
 )
 from app.api.deps import get_current_user
 from app.models.user import User
 from app.core.config import settings
+from app.services import part_facets, part_specs
 
 router = APIRouter(prefix="/parts", tags=["parts"])
 
 
+def part_filters(
+    request: Request,
+    db: Session,
+    search: Optional[str],
+    category: Optional[str],
+    low_stock_only: bool,
+) -> List[Any]:
+    """Build the filter conditions shared by the list and facets endpoints.
+
+    Args:
+        request: Current request (for the ``spec.`` filters)
+        db: Database session
+        search: Search in SKU, name, or description
+        category: Filter by category
+        low_stock_only: Only parts below minimum stock
+
+    Returns:
+        Conditions on parts, without the soft-delete filter
+
+    Raises:
+        HTTPException: If a specification filter is malformed
+    """
+    try:
+        spec_filters = part_specs.parse_filters(request.url.query)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
+
+    conditions = []
+    if search:
+        search_term = f"%{search}%"
+        conditions.append(
+            or_(
+                PartModel.sku.ilike(search_term),
+                PartModel.name.ilike(search_term),
+                PartModel.description.ilike(search_term)
+            )
+        )
+
+    if category:
+        conditions.append(PartModel.category == category)
+
+    if low_stock_only:
+        conditions.append(PartModel.is_low_stock)
+
+    dialect = db.get_bind().dialect.name
+    for spec_filter in spec_filters:
+        conditions.append(part_specs.filter_clause(spec_filter, dialect))
+    return conditions
+
+
 @router.get("/", response_model=PartList)
 def list_parts(
+    request: Request,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
     search: Optional[str] = None,
@@ -34,7 +90,12 @@ def list_parts(
 ):
     """List all parts with pagination and filtering.
 
+    Specification filters are given as extra query parameters
+    ``spec.<key><op><value>`` with ``op`` one of ``=``, ``>``, ``>=``,
+    ``<``, ``<=``, e.g. ``spec.material=brass&spec.length_mm>=100``.
+
     Args:
+        request: Current request (for the ``spec.`` filters)
         page: Page number (starts at 1)
         per_page: Items per page
         search: Search in SKU, name, or description
@@ -45,25 +106,14 @@ def list_parts(
 
     Returns:
         Paginated list of parts
-    """
-    query = db.query(PartModel).filter(PartModel.deleted_at.is_(None))
 
-    # Apply filters
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                PartModel.sku.ilike(search_term),
-                PartModel.name.ilike(search_term),
-                PartModel.description.ilike(search_term)
-            )
-        )
-
-    if category:
-        query = query.filter(PartModel.category == category)
-
-    if low_stock_only:
-        query = query.filter(PartModel.current_stock < PartModel.minimum_stock)
+    Raises:
+        HTTPException: If a specification filter is malformed
+    """
+    query = db.query(PartModel).filter(
+        PartModel.deleted_at.is_(None),
+        *part_filters(request, db, search, category, low_stock_only),
+    )
 
     # Get total count
     total = query.count()
@@ -73,7 +123,7 @@ def list_parts(
     offset = (page - 1) * per_page
 
     # Get paginated results
-    parts = query.order_by(PartModel.name).offset(offset).limit(per_page).all()
+    parts = query.order_by(PartModel.name, PartModel.id).offset(offset).limit(per_page).all()
 
     return {
         "items": parts,
@@ -84,6 +134,40 @@ def list_parts(
     }
 
 
+@router.get("/facets", response_model=PartFacets)
+def get_part_facets(
+    request: Request,
+    search: Optional[str] = None,
+    category: Optional[str] = None,
+    low_stock_only: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Count parts per category and per stock status.
+
+    Takes the same filters as the parts list (including ``spec.``
+    filters) and computes every facet in one grouped query. Counts for
+    the whole catalog are served from a cache that part writes keep
+    current.
+
+    Args:
+        request: Current request (for the ``spec.`` filters)
+        search: Search in SKU, name, or description
+        category: Filter by category
+        low_stock_only: Only parts below minimum stock
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Total number of matching parts and counts per facet value
+
+    Raises:
+        HTTPException: If a specification filter is malformed
+    """
+    conditions = part_filters(request, db, search, category, low_stock_only)
+    return part_facets.get_facets(db, conditions)
+
+
 @router.get("/{part_id}", response_model=Part)
 def get_part(
     part_id: UUID,
@@ -151,8 +235,9 @@ def create_part(
     # Create new part
     new_part = PartModel(**part_data.model_dump())
     db.add(new_part)
+    db.flush()
+    part_specs.sync(db, new_part, created=True)
     db.commit()
-    db.refresh(new_part)
 
     return new_part
 
@@ -208,8 +293,11 @@ def update_part(
     for field, value in update_data.items():
         setattr(part, field, value)
 
+    if 'specifications' in update_data:
+        db.flush()
+        part_specs.sync(db, part)
+
     db.commit()
-    db.refresh(part)
 
     return part
 
@@ -290,7 +378,6 @@ def adjust_stock(
     # Update stock
     part.current_stock = new_stock
     db.commit()
-    db.refresh(part)
 
     return part
 
@@ -307,11 +394,6 @@ def list_categories(
         current_user: Current authenticated user
 
     Returns:
-        List of unique categories
+        List of unique categories (from the cached facet counts)
     """
-    categories = db.query(PartModel.category).filter(
-        PartModel.deleted_at.is_(None),
-        PartModel.category.isnot(None)
-    ).distinct().all()
-
-    return [cat[0] for cat in categories if cat[0]]
+    return part_facets.categories(db)
@@ -0,0 +1,104 @@
+"""Financial reporting endpoints.
+
+Revenue reports read only from precomputed rollup tables, never from
+``invoices``.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from uuid import UUID
+from typing import Literal, Optional
+from datetime import date
+
+from app.db import get_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.revenue_rollup import RevenueRollupDaily, RevenueRollupMonthly
+from app.schemas.report import AgingReport, RevenueReport
+from app.services import receivables
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+@router.get("/revenue", response_model=RevenueReport)
+def revenue_report(
+    granularity: Literal["day", "month"] = Query("month", description="Period size"),
+    start: Optional[date] = Query(None, description="First period (inclusive)"),
+    end: Optional[date] = Query(None, description="Last period (inclusive)"),
+    status: Optional[str] = Query(None, description="Filter by invoice status"),
+    customer_id: Optional[UUID] = Query(None, description="Filter by customer"),
+    by_status: bool = Query(False, description="Break totals down by invoice status"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get revenue, VAT and discount totals per day or month.
+
+    Args:
+        granularity: Aggregate per "day" or "month"
+        start: First period to include
+        end: Last period to include
+        status: Only include invoices with this status
+        customer_id: Only include invoices of this customer
+        by_status: Return one row per period and status
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Revenue totals ordered by period
+    """
+    model = RevenueRollupDaily if granularity == "day" else RevenueRollupMonthly
+    if granularity == "month" and start:
+        start = start.replace(day=1)
+
+    group_columns = [model.period]
+    if by_status:
+        group_columns.append(model.status)
+
+    query = db.query(
+        *group_columns,
+        func.sum(model.invoice_count).label("invoice_count"),
+        func.sum(model.subtotal).label("subtotal"),
+        func.sum(model.tax_amount).label("tax_amount"),
+        func.sum(model.discount_amount).label("discount_amount"),
+        func.sum(model.total_amount).label("total_amount"),
+    )
+
+    if start:
+        query = query.filter(model.period >= start)
+
+    if end:
+        query = query.filter(model.period <= end)
+
+    if status:
+        query = query.filter(model.status == status)
+
+    if customer_id:
+        query = query.filter(model.customer_id == customer_id)
+
+    rows = query.group_by(*group_columns).order_by(*group_columns).all()
+
+    return RevenueReport(
+        granularity=granularity,
+        items=[dict(row._mapping) for row in rows],
+    )
+
+
+@router.get("/aging", response_model=AgingReport)
+def aging_report(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get accounts-receivable aging buckets per customer.
+
+    Unpaid invoice totals are grouped into 0-30, 31-60, 61-90 and 90+ days
+    past their due date. The report is cached for the rest of the day.
+
+    Args:
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Aging report ordered by outstanding total
+    """
+    return receivables.get_aging(db)
@@ -67,7 +67,7 @@ def list_suppliers(
 
     # Apply pagination
     offset = (page - 1) * per_page
-    suppliers = query.order_by(Supplier.name).offset(offset).limit(per_page).all()
+    suppliers = query.order_by(Supplier.name, Supplier.id).offset(offset).limit(per_page).all()
 
     return SupplierList(
         items=suppliers,
@@ -110,7 +110,6 @@ def create_supplier(
     supplier = Supplier(**supplier_data.model_dump())
     db.add(supplier)
     db.commit()
-    db.refresh(supplier)
 
     return supplier
 
@@ -186,7 +185,6 @@ def update_supplier(
         setattr(supplier, field, value)
 
     db.commit()
-    db.refresh(supplier)
 
     return supplier
 
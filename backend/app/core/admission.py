@@ -0,0 +1,200 @@
+"""Admission control: per route group concurrency limits and load shedding.
+
+Handlers are sync functions run in the threadpool, so during a spike
+requests pile up waiting for a thread until clients time out. The
+middleware instead admits at most ``ADMISSION_<GROUP>_CONCURRENCY``
+requests per route group at a time:
+
+* ``auth``: everything under ``/auth`` (password hashing)
+* ``exports``: reports, documents and invoice PDFs
+* ``writes``: other POST, PUT, PATCH and DELETE requests
+* ``reads``: other API requests
+
+Further requests wait in a FIFO queue for at most
+``ADMISSION_QUEUE_TIMEOUT_MS``. A request is refused straight away with
+``503`` and ``Retry-After`` when the expected wait (queue length times
+the group's average service time) already exceeds that budget, and after
+the budget if it still has no slot. Admitted requests report their queue
+time as ``Server-Timing: queue;dur=...``. Paths outside the API prefix
+(health checks, metrics) are never queued.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from starlette.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.metrics import ADMISSION_QUEUE_WAIT, ADMISSION_QUEUED, ADMISSION_REJECTED
+
+# Path prefixes (below the API prefix) and suffixes of export endpoints
+EXPORT_PREFIXES = ("/reports/", "/documents/")
+EXPORT_SUFFIXES = ("/pdf",)
+
+# Weight of the newest request in a group's average service time
+SERVICE_TIME_SMOOTHING = 0.1
+
+
+class Rejected(Exception):
+    """The request was not admitted; ``reason`` is ``overloaded`` or ``timeout``."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionGroup:
+    """Concurrency slots and wait queue of one route group.
+
+    Args:
+        name: Group name, used as metrics label
+        limit: Requests served at the same time
+        queue_timeout: Longest a request may wait for a slot, in seconds
+    """
+
+    def __init__(self, name: str, limit: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.service_time: Optional[float] = None
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def estimated_wait(self) -> float:
+        """Seconds a request arriving now would wait for a slot."""
+        if self.active < self.limit and not self._waiters:
+            return 0.0
+        return (len(self._waiters) + 1) * (self.service_time or 0.0) / self.limit
+
+    async def acquire(self) -> float:
+        """Wait for a slot.
+
+        Returns:
+            Seconds spent queued
+
+        Raises:
+            Rejected: The queue is over its budget or the wait timed out
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return 0.0
+
+        expected = self.estimated_wait()
+        if expected > self.queue_timeout:
+            raise Rejected("overloaded", expected)
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        # True: a released slot was handed over; False: the budget ran out
+        timer = loop.call_later(self.queue_timeout, lambda: waiter.done() or waiter.set_result(False))
+        self._waiters.append(waiter)
+        ADMISSION_QUEUED.labels(self.name).inc()
+        started = time.perf_counter()
+        try:
+            granted = await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.result():
+                self.release()
+            raise
+        finally:
+            timer.cancel()
+            ADMISSION_QUEUED.labels(self.name).dec()
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        if not granted:
+            raise Rejected("timeout", self.estimated_wait())
+        return time.perf_counter() - started
+
+    def release(self, service_time: Optional[float] = None) -> None:
+        """Free a slot, handing it to the oldest waiting request.
+
+        Args:
+            service_time: How long the finished request held the slot, in seconds
+        """
+        if service_time is not None:
+            if self.service_time is None:
+                self.service_time = service_time
+            else:
+                self.service_time += SERVICE_TIME_SMOOTHING * (service_time - self.service_time)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+        self.active -= 1
+
+
+def route_group(scope) -> Optional[str]:
+    """Route group of a request, or None for paths outside the API."""
+    prefix = settings.API_PREFIX
+    path = scope["path"]
+    if not path.startswith(prefix + "/"):
+        return None
+    path = path[len(prefix):]
+    if path.startswith("/auth/"):
+        return "auth"
+    if path.startswith(EXPORT_PREFIXES) or path.endswith(EXPORT_SUFFIXES):
+        return "exports"
+    if scope["method"] in ("GET", "HEAD"):
+        return "reads"
+    return "writes"
+
+
+def _groups() -> Dict[str, AdmissionGroup]:
+    limits = {
+        "auth": settings.ADMISSION_AUTH_CONCURRENCY,
+        "reads": settings.ADMISSION_READS_CONCURRENCY,
+        "writes": settings.ADMISSION_WRITES_CONCURRENCY,
+        "exports": settings.ADMISSION_EXPORTS_CONCURRENCY,
+    }
+    timeout = settings.ADMISSION_QUEUE_TIMEOUT_MS / 1000
+    # A limit of 0 leaves the group unrestricted
+    return {name: AdmissionGroup(name, limit, timeout) for name, limit in limits.items() if limit > 0}
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying the route group limits."""
+
+    def __init__(self, app):
+        self.app = app
+        self.groups = _groups()
+
+    async def __call__(self, scope, receive, send):
+        group = self.groups.get(route_group(scope)) if scope["type"] == "http" else None
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            waited = await group.acquire()
+        except Rejected as exc:
+            ADMISSION_REJECTED.labels(group.name, exc.reason).inc()
+            response = JSONResponse(
+                {"detail": "Server is busy, please retry later"},
+                status_code=503,
+                headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+            )
+            await response(scope, receive, send)
+            return
+        ADMISSION_QUEUE_WAIT.labels(group.name).observe(waited)
+
+        async def send_with_queue_time(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", f"queue;dur={waited * 1000:.1f}".encode()))
+                message["headers"] = headers
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_queue_time)
+        finally:
+            group.release(time.perf_counter() - started)
@@ -0,0 +1,172 @@
+"""In-process cache for computed read models (dashboards, reports)."""
+
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.metrics import CACHE_REQUESTS
+
+
+class TTLCache:
+    """Thread-safe key/value cache with per-entry expiry.
+
+    Entries are computed lazily by ``get_or_set`` and dropped either when
+    they expire or when ``invalidate`` is called after the underlying data
+    changes. The cache is local to one worker process.
+
+    Every invalidation or ``update`` is stamped with a version. A value
+    loaded from data read before that version is not stored, so a slow
+    load that raced a write cannot put pre-write results back in the cache.
+    Stamps are only kept while a load that started before them (a held
+    version, see ``hold_version``) is still running. Cached values are
+    shared between threads and must not be mutated.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        # Version counter and the version at which keys/prefixes were last changed
+        self._clock = 0
+        self._key_versions: Dict[str, int] = {}
+        self._prefix_versions: Dict[str, int] = {}
+        # Versions held by loads (and sessions) in flight, with their count
+        self._held: Counter = Counter()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key`` or None if missing/expired."""
+        namespace = key.split(":", 1)[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                CACHE_REQUESTS.labels(namespace, "miss").inc()
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                CACHE_REQUESTS.labels(namespace, "miss").inc()
+                return None
+            self.hits += 1
+            CACHE_REQUESTS.labels(namespace, "hit").inc()
+            return value
+
+    def hold_version(self) -> int:
+        """Take the current version; hold it until the data read after it is loaded.
+
+        Changes stamped after a held version are remembered until it is
+        released with ``release_version``.
+        """
+        with self._lock:
+            self._held[self._clock] += 1
+            return self._clock
+
+    def release_version(self, version: int) -> None:
+        """Release a version from ``hold_version`` and forget stamps no load needs."""
+        with self._lock:
+            self._held[version] -= 1
+            if self._held[version] <= 0:
+                del self._held[version]
+            oldest = min(self._held) if self._held else self._clock
+            for versions in (self._key_versions, self._prefix_versions):
+                for name in [name for name, changed in versions.items() if changed <= oldest]:
+                    del versions[name]
+
+    def _changed_since(self, key: str, version: int) -> bool:
+        if self._key_versions.get(key, 0) > version:
+            return True
+        return any(
+            changed > version
+            for prefix, changed in self._prefix_versions.items()
+            if key.startswith(prefix)
+        )
+
+    def _stamp(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def set(self, key: str, value: Any, ttl: float, version: Optional[int] = None) -> bool:
+        """Store ``value`` under ``key`` for ``ttl`` seconds.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime in seconds
+            version: Version held (``hold_version``) since before ``value``
+                was loaded; the value is discarded if ``key`` changed since
+
+        Returns:
+            Whether the value was stored
+        """
+        with self._lock:
+            if version is not None and self._changed_since(key, version):
+                return False
+            self._entries[key] = (time.monotonic() + ttl, value)
+            return True
+
+    def get_or_set(
+        self, key: str, loader: Callable[[], Any], ttl: float, version: Optional[int] = None
+    ) -> Any:
+        """Return the cached value, computing it with ``loader`` on a miss.
+
+        Args:
+            key: Cache key
+            loader: Computes the value
+            ttl: Lifetime in seconds
+            version: Version held since before the data ``loader`` reads was
+                snapshotted (e.g. by the session, see ``app.db.cache_version``);
+                by default one is held from now until the load finishes
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        if version is not None:
+            value = loader()
+            self.set(key, value, ttl, version=version)
+            return value
+        version = self.hold_version()
+        try:
+            value = loader()
+            self.set(key, value, ttl, version=version)
+        finally:
+            self.release_version(version)
+        return value
+
+    def update(self, key: str, change: Callable[[Any], Any]) -> None:
+        """Replace a cached value with ``change(value)``, keeping its expiry.
+
+        Loads in progress are discarded as for ``invalidate``; nothing is
+        stored if the key is not cached.
+        """
+        with self._lock:
+            self._key_versions[key] = self._stamp()
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                self._entries[key] = (expires_at, change(value))
+
+    def invalidate(self, key: str) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            self._key_versions[key] = self._stamp()
+            self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every entry whose key starts with ``prefix``."""
+        with self._lock:
+            self._prefix_versions[prefix] = self._stamp()
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._prefix_versions[""] = self._stamp()
+            self._entries.clear()
+
+
+# Global cache instance
+cache = TTLCache()
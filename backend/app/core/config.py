@@ -1,6 +1,6 @@
 """Application configuration using Pydantic settings."""
 
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import EmailStr, field_validator
 
@@ -18,6 +18,26 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "postgresql://gmtc:@localhost:5432/gmtc_crm"
 
+    # SQLite file databases: pragmas applied on connect and the size of the
+    # read-only connection pool next to the single writer connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_READER_POOL_SIZE: int = 8
+
+    # Read replicas (comma-separated URLs, empty = primary only) for GET requests
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_STICKY_SECONDS: float = 5.0
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_CHECK_SECONDS: float = 5.0
+
+    @field_validator("DATABASE_REPLICA_URLS")
+    @classmethod
+    def parse_replica_urls(cls, v: str) -> List[str]:
+        """Parse comma-separated replica URLs."""
+        return [url.strip() for url in v.split(",") if url.strip()]
+
     # Application
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
@@ -50,15 +70,92 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     SMTP_FROM: EmailStr = "office@gm-tc.tech"
     SMTP_FROM_NAME: str = "GM-TC CRM"
+    SMTP_USE_TLS: bool = True
+    SMTP_TIMEOUT_SECONDS: int = 30
+
+    # Outbound email queue
+    EMAIL_QUEUE_INTERVAL_SECONDS: int = 30
+    EMAIL_BATCH_SIZE: int = 50
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BASE_SECONDS: int = 60
 
     # File Upload
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
     UPLOAD_DIR: str = "./uploads"
 
+    # Documents (invoice / delivery note PDFs)
+    COMPANY_NAME: str = "GM-TC"
+    DOCUMENT_RENDER_WORKERS: int = 2
+    DOCUMENT_CACHE_DIR: str = "./uploads/documents"
+
     # Pagination
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 100
 
+    # Caching
+    DASHBOARD_CACHE_TTL_SECONDS: int = 300
+    # Unfiltered parts facet counts; writes in the same worker update them at once
+    PART_FACETS_CACHE_TTL_SECONDS: int = 300
+
+    # SQL instrumentation (Server-Timing headers, N+1 warnings)
+    SQL_INSTRUMENTATION_ENABLED: bool = True
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Prometheus metrics (/metrics); set a directory when running several workers
+    METRICS_ENABLED: bool = True
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+
+    # Slow query log (slow_queries table, GET /diagnostics/slow-queries)
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+
+    # On-demand request profiling (X-Profile header, GET /diagnostics/profiles);
+    # PROFILE_SAMPLE_EVERY=N also profiles every Nth request per route (0 = off)
+    PROFILING_ENABLED: bool = True
+    PROFILE_INTERVAL_MS: float = 5.0
+    PROFILE_SAMPLE_EVERY: int = 0
+    PROFILE_STORE_SIZE: int = 50
+
+    # Fast start: import API routers on first use, serve OpenAPI from a disk cache
+    FAST_START: bool = False
+    OPENAPI_CACHE_DIR: str = "var/cache"
+
+    # Production server (gunicorn -c gunicorn.conf.py); 0 workers = one per CPU core
+    SERVER_WORKERS: int = 0
+    SERVER_PRELOAD: bool = True
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30
+    SERVER_TIMEOUT_SECONDS: int = 60
+
+    # Admission control: requests served at once per route group (0 = no limit),
+    # the longest one may queue before a 503, and threads for sync handlers
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_AUTH_CONCURRENCY: int = 4
+    ADMISSION_READS_CONCURRENCY: int = 24
+    ADMISSION_WRITES_CONCURRENCY: int = 8
+    ADMISSION_EXPORTS_CONCURRENCY: int = 2
+    ADMISSION_QUEUE_TIMEOUT_MS: float = 500.0
+    THREADPOOL_SIZE: int = 40
+
+    # Readiness probe (/health/ready); the database ping is re-run at most this often
+    READINESS_CACHE_SECONDS: float = 5.0
+
+    # Background jobs
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TICK_SECONDS: float = 5.0
+    JOB_LOCK_TTL_SECONDS: int = 600
+
+    # Dunning
+    DUNNING_INTERVAL_SECONDS: int = 900
+    DUNNING_BATCH_SIZE: int = 500
+    DUNNING_REMINDER_INTERVAL_DAYS: int = 7
+    DUNNING_MAX_REMINDERS: int = 3
+
+    # Archival of soft-deleted rows
+    ARCHIVE_INTERVAL_SECONDS: int = 86400
+    ARCHIVE_AFTER_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 500
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
@@ -0,0 +1,158 @@
+"""Fast-start mode: lazily imported routers and an on-disk OpenAPI cache.
+
+Most of a worker's start-up time goes into importing the API modules,
+which builds their pydantic schemas and FastAPI routes. With
+``FAST_START`` enabled, ``main`` registers a ``LazyRouter`` placeholder
+per API module instead. The module is imported the first time a request
+arrives under its prefix; its routes then replace the placeholder and
+the request is dispatched to them.
+
+The OpenAPI document normally needs every route. In fast-start mode it
+is served from ``OPENAPI_CACHE_DIR``, keyed by a hash of the application
+source, so only the first worker after a deploy imports all routers to
+generate it.
+"""
+
+import asyncio
+import hashlib
+import importlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import fastapi
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import BaseRoute, Match
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+class LazyRouter(BaseRoute):
+    """Placeholder route that imports an API module on its first request.
+
+    Args:
+        app: Application the module's router is added to
+        module: Module defining ``router``, e.g. ``app.api.parts``
+        prefix: The router's own prefix, e.g. ``/parts``
+        api_prefix: Prefix the router is included under
+    """
+
+    def __init__(self, app: FastAPI, module: str, prefix: str, api_prefix: str):
+        self.app = app
+        self.module = module
+        self.prefix = prefix
+        self.api_prefix = api_prefix
+        self.path = api_prefix + prefix
+        self._lock = asyncio.Lock()
+
+    def matches(self, scope) -> Tuple[Match, Dict[str, Any]]:
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path == self.path or path.startswith(self.path + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def load(self) -> None:
+        """Import the module and swap this placeholder for its routes."""
+        if self not in self.app.router.routes:
+            return
+        router = importlib.import_module(self.module).router
+        if router.prefix != self.prefix:
+            raise RuntimeError(
+                f"{self.module}.router has prefix {router.prefix!r}, registered as {self.prefix!r}"
+            )
+        routes = self.app.router.routes
+        count = len(routes)
+        self.app.include_router(router, prefix=self.api_prefix)
+        added = routes[count:]
+        del routes[count:]
+        # Take the placeholder's position, so later routes still match later
+        position = routes.index(self)
+        routes[position:position + 1] = added
+
+    async def handle(self, scope, receive, send) -> None:
+        async with self._lock:
+            if self in self.app.router.routes:
+                # Importing is blocking work; keep the event loop free meanwhile
+                await run_in_threadpool(importlib.import_module, self.module)
+                self.load()
+        await self.app.router.app(scope, receive, send)
+
+
+def include_lazy_routers(app: FastAPI, routers: List[Tuple[str, str]], prefix: str) -> None:
+    """Register a placeholder per API module instead of importing it.
+
+    Args:
+        app: FastAPI application
+        routers: (module, router prefix) pairs
+        prefix: API prefix the routers are included under
+    """
+    for module, router_prefix in routers:
+        app.router.routes.append(LazyRouter(app, module, router_prefix, prefix))
+
+
+def load_all(app: FastAPI) -> None:
+    """Import every router that is still a placeholder."""
+    for route in list(app.router.routes):
+        if isinstance(route, LazyRouter):
+            route.load()
+
+
+def code_version() -> str:
+    """Hash of the application source and framework version."""
+    digest = hashlib.sha256(f"{settings.VERSION}:{fastapi.__version__}".encode())
+    for path in sorted([BACKEND_DIR / "main.py", *(BACKEND_DIR / "app").rglob("*.py")]):
+        digest.update(str(path.relative_to(BACKEND_DIR)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def cache_openapi(app: FastAPI) -> None:
+    """Serve the OpenAPI document from ``OPENAPI_CACHE_DIR`` when it is current.
+
+    On a cache miss all lazy routers are loaded, the document is generated
+    as usual and written atomically for the next worker.
+    """
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema:
+            return app.openapi_schema
+
+        cache_dir = Path(settings.OPENAPI_CACHE_DIR)
+        path = cache_dir / f"openapi-{code_version()}.json"
+        try:
+            app.openapi_schema = json.loads(path.read_text())
+            return app.openapi_schema
+        except (OSError, ValueError):
+            pass
+
+        load_all(app)
+        schema = get_openapi(
+            title=app.title,
+            version=app.version,
+            openapi_version=app.openapi_version,
+            description=app.description,
+            routes=app.routes,
+            servers=app.servers,
+        )
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as handle:
+                json.dump(schema, handle)
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning("Could not write OpenAPI cache to %s", cache_dir, exc_info=True)
+        app.openapi_schema = schema
+        return schema
+
+    app.openapi = openapi
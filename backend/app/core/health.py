@@ -0,0 +1,110 @@
+"""Readiness checks for ``/health/ready``.
+
+``/health`` is liveness: the process is up and serving. Readiness also
+needs the database, and is checked in two separate parts:
+
+* ``pool``: a connection can be checked out without waiting, i.e. the
+  worker is not saturated (checked from the pool's counters, no I/O)
+* ``database``: a ``SELECT 1`` round trip succeeds; the result is reused
+  for ``READINESS_CACHE_SECONDS`` so frequent probes from several load
+  balancers do not each cost a query
+
+When the pool is exhausted the ping is skipped rather than queued behind
+requests, and the last ping result is reported. Read replicas are listed
+for information only: reads fall back to the primary without them.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.db import engine, read_engine, replicas
+
+
+@dataclass
+class _Ping:
+    ok: bool
+    latency_ms: float
+    checked_at: float
+    error: Optional[str] = None
+
+
+_last_ping: Optional[_Ping] = None
+_ping_lock = threading.Lock()
+
+
+def pool_status() -> Dict[str, Any]:
+    """Connections in use and whether one is free for a new request."""
+    # SQLite has a single writer connection; requests mostly wait on readers
+    pool = (read_engine or engine).pool
+    if not isinstance(pool, QueuePool):
+        return {"ok": True, "checked_out": None, "capacity": None}
+    max_overflow = pool._max_overflow
+    capacity = None if max_overflow < 0 else pool.size() + max_overflow
+    checked_out = pool.checkedout()
+    return {
+        "ok": capacity is None or checked_out < capacity,
+        "checked_out": checked_out,
+        "capacity": capacity,
+    }
+
+
+def _ping() -> _Ping:
+    started = time.perf_counter()
+    try:
+        with (read_engine or engine).connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
+        error = None
+    except SQLAlchemyError as exc:
+        error = type(exc).__name__
+    return _Ping(
+        ok=error is None,
+        latency_ms=round((time.perf_counter() - started) * 1000, 2),
+        checked_at=time.monotonic(),
+        error=error,
+    )
+
+
+def database_status(refresh: bool = True) -> Dict[str, Any]:
+    """Result of the most recent database ping, re-running it when stale.
+
+    Args:
+        refresh: Ping again if the cached result is older than
+            ``READINESS_CACHE_SECONDS``
+
+    Returns:
+        Ping outcome, latency and age of the result in seconds
+    """
+    global _last_ping
+    with _ping_lock:
+        stale = _last_ping is None or time.monotonic() - _last_ping.checked_at >= settings.READINESS_CACHE_SECONDS
+        if refresh and stale:
+            _last_ping = _ping()
+        ping = _last_ping
+    if ping is None:
+        return {"ok": False, "latency_ms": None, "age_seconds": None, "error": "not checked"}
+    return {
+        "ok": ping.ok,
+        "latency_ms": ping.latency_ms,
+        "age_seconds": round(time.monotonic() - ping.checked_at, 2),
+        "error": ping.error,
+    }
+
+
+def readiness() -> Dict[str, Any]:
+    """Whether this worker should receive traffic, with per-check details."""
+    pool = pool_status()
+    database = database_status(refresh=pool["ok"])
+    return {
+        "ready": pool["ok"] and database["ok"],
+        "checks": {
+            "database": database,
+            "pool": pool,
+            "replicas": [replica.status() for replica in replicas.replicas],
+        },
+    }
@@ -0,0 +1,178 @@
+"""Per-request SQL instrumentation and N+1 detection.
+
+SQLAlchemy ``before/after_cursor_execute`` listeners time every statement
+and add it to the statistics of the request being served (tracked in a
+context variable) and to any active ``capture_queries()`` block. The
+middleware reports the totals in a ``Server-Timing`` header and logs
+statements that ran repeatedly with different parameters, the usual
+signature of an N+1 query.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """SQL statements executed during one request or capture block."""
+
+    # ASGI scope of the request; routing fills in the matched route later
+    scope: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+    # statement -> hashes of the distinct parameter sets it ran with
+    executions: Dict[str, Set[int]] = field(default_factory=dict)
+
+    @property
+    def endpoint(self) -> Optional[str]:
+        """Method and route template (or raw path before routing), e.g. ``GET /api/v1/parts/{part_id}``."""
+        if self.scope is None:
+            return None
+        route = self.scope.get("route")
+        return f"{self.scope['method']} {getattr(route, 'path', None) or self.scope['path']}"
+
+    def record(self, statement: str, parameters, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+        self.executions.setdefault(statement, set()).add(hash(repr(parameters)))
+
+    def n_plus_one(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Statements repeated with at least ``threshold`` different parameter sets.
+
+        Returns:
+            (statement, distinct parameter sets) pairs, most repeated first
+        """
+        threshold = threshold or settings.SQL_N_PLUS_ONE_THRESHOLD
+        repeated = [
+            (statement, len(params))
+            for statement, params in self.executions.items()
+            if len(params) >= threshold
+        ]
+        return sorted(repeated, key=lambda item: item[1], reverse=True)
+
+    def server_timing(self) -> str:
+        """Format the totals as a ``Server-Timing`` header value."""
+        metrics = [
+            f'db;dur={self.total_ms:.2f};desc="{self.count} queries"',
+            f"db-slowest;dur={self.slowest_ms:.2f}",
+        ]
+        suspects = self.n_plus_one()
+        if suspects:
+            metrics.append(f'db-n-plus-one;desc="{len(suspects)} repeated statements"')
+        return ", ".join(metrics)
+
+
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+_captures: List[QueryStats] = []
+
+# Called as observer(conn, statement, parameters, executemany, elapsed_ms)
+StatementObserver = Callable[[Any, str, Any, bool, float], None]
+_observers: List[StatementObserver] = []
+
+
+def add_statement_observer(observer: StatementObserver) -> None:
+    """Register a callback that receives every timed statement.
+
+    Args:
+        observer: Called after each statement with its duration in ms
+    """
+    _observers.append(observer)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Statistics of the request being served, if any."""
+    return _request_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and (_observers or _captures or _request_stats.get() is not None):
+        context._query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    request_stats = _request_stats.get()
+    if request_stats is not None:
+        request_stats.record(statement, parameters, elapsed_ms)
+    for stats in _captures:
+        stats.record(statement, parameters, elapsed_ms)
+    for observer in _observers:
+        observer(conn, statement, parameters, executemany, elapsed_ms)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """Collect every statement executed in this process while the block runs.
+
+    Unlike request statistics this is not bound to a context, so it also
+    sees queries made by ``TestClient`` requests served on another thread.
+
+    Yields:
+        Statistics filled in as statements execute
+    """
+    stats = QueryStats()
+    _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        _captures.remove(stats)
+
+
+class SQLInstrumentationMiddleware:
+    """ASGI middleware that reports per-request SQL statistics.
+
+    Adds a ``Server-Timing`` header with query count, total DB time and the
+    slowest statement, and logs probable N+1 queries.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope=scope)
+        token = _request_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            for statement, repeats in stats.n_plus_one():
+                logger.warning(
+                    "Probable N+1 in %s: statement ran %d times with different "
+                    "parameters: %s",
+                    stats.endpoint,
+                    repeats,
+                    " ".join(statement.split())[:300],
+                )
@@ -0,0 +1,176 @@
+"""Prometheus metrics exposed at ``/metrics``.
+
+Metrics are plain ``prometheus_client`` collectors updated in-process
+(increments only, no locks held across requests). With several uvicorn
+workers set ``METRICS_MULTIPROC_DIR``: every process then writes its
+values to memory-mapped files in that directory and ``/metrics`` merges
+all of them, so each scrape sees totals for the whole server no matter
+which worker answers. The directory must be emptied before the server
+starts.
+
+Cache hit ratio is ``rate(cache_requests_total{result="hit"}[5m]) /
+rate(cache_requests_total[5m])``.
+"""
+
+import os
+import time
+from typing import Optional, Tuple
+
+from app.core.config import settings
+
+# prometheus_client picks its storage backend on import
+if settings.METRICS_MULTIPROC_DIR:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.METRICS_MULTIPROC_DIR)
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.pool import Pool  # noqa: E402
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status code",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "Database connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts",
+    "Database connections checked out of the pool",
+)
+DB_SESSION_ROUTES = Counter(
+    "db_session_routes",
+    "Request sessions by database (primary, replica) and reason",
+    ["target", "reason"],
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests",
+    "In-process cache lookups by key namespace and result (hit, miss)",
+    ["namespace", "result"],
+)
+BCRYPT_IN_PROGRESS = Gauge(
+    "bcrypt_operations_in_progress",
+    "Password hashes being computed or verified (work queued on the threadpool)",
+    ["operation"],
+    multiprocess_mode="livesum",
+)
+BCRYPT_DURATION = Histogram(
+    "bcrypt_duration_seconds",
+    "Time spent hashing or verifying a password",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 1, 2),
+)
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "Background job run time by job and outcome",
+    ["job", "status"],
+    buckets=(0.1, 0.5, 1, 5, 15, 60, 300, 900),
+)
+ADMISSION_QUEUE_WAIT = Histogram(
+    "admission_queue_wait_seconds",
+    "Time admitted requests waited for a concurrency slot, by route group",
+    ["group"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+ADMISSION_QUEUED = Gauge(
+    "admission_requests_queued",
+    "Requests waiting for a concurrency slot, by route group",
+    ["group"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_REJECTED = Counter(
+    "admission_rejected",
+    "Requests shed with 503 by route group and reason (overloaded, timeout)",
+    ["group", "reason"],
+)
+
+
+@event.listens_for(Pool, "checkout")
+def _pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_CHECKED_OUT.inc()
+    DB_POOL_CHECKOUTS.inc()
+
+
+@event.listens_for(Pool, "checkin")
+def _pool_checkin(dbapi_connection, connection_record):
+    DB_POOL_CHECKED_OUT.dec()
+
+
+def render() -> Tuple[bytes, str]:
+    """Serialize all metrics (merged across worker processes if enabled).
+
+    Returns:
+        Response body and content type
+    """
+    registry = REGISTRY
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """Drop a worker's live gauges from the shared directory.
+
+    Args:
+        pid: Worker process ID (defaults to the current process)
+    """
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency and in-flight requests.
+
+    Requests are labelled with the matched route template, so paths with
+    IDs do not create new time series; unmatched paths share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                scope["method"],
+                getattr(route, "path", None) or "<unmatched>",
+                str(status_code),
+            ).observe(time.perf_counter() - started)
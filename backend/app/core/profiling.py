@@ -0,0 +1,326 @@
+"""On-demand sampling profiler for single requests.
+
+A superuser sends ``X-Profile: speedscope`` (or ``collapsed``), or adds
+``?profile=speedscope``, and gets the request's profile back instead of
+its normal response. With ``PROFILE_SAMPLE_EVERY`` set, every Nth request
+per route is profiled as well, without changing its response. All
+profiles go into a rolling in-memory store listed at
+``GET /diagnostics/profiles``.
+
+Route handlers are sync and run on threadpool threads, so a profiler
+hooked into the request's own thread would see nothing. A background
+thread instead reads every thread's stack with ``sys._current_frames()``
+each ``PROFILE_INTERVAL_MS``. A stack belongs to the profiled request
+when the thread runs inside a copy of the request's context (the
+threadpool keeps that copy in a ``context`` local of its worker loop).
+Samples taken while no thread works for the request are recorded as
+``<awaiting>``, so the profile covers the request's whole wall time.
+"""
+
+import itertools
+import json
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from contextvars import Context, ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Match
+
+from app.core.config import settings
+from app.db import SessionLocal
+from app.models.user import User
+
+FORMATS = ("speedscope", "collapsed")
+
+PROFILE_HEADER = "x-profile"
+
+# (function, file, first line) from the outermost frame to the innermost
+Stack = Tuple[Tuple[str, str, int], ...]
+
+AWAITING: Stack = (("<awaiting>", "", 0),)
+
+
+@dataclass(eq=False)
+class Profile:
+    """Stack samples of one request."""
+
+    endpoint: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    duration_ms: float = 0.0
+    status_code: Optional[int] = None
+    # (stack, milliseconds since the previous sample) in sampling order
+    samples: List[Tuple[Stack, float]] = field(default_factory=list, repr=False)
+
+    def collapsed(self) -> str:
+        """Folded stacks (``a;b;c <ms>``) for flamegraph.pl, speedscope and friends."""
+        totals: Counter = Counter()
+        for stack, weight in self.samples:
+            totals[";".join(name for name, _, _ in stack)] += weight
+        return "".join(f"{stack} {round(weight)}\n" for stack, weight in totals.most_common())
+
+    def speedscope(self) -> Dict[str, Any]:
+        """Sampled profile in speedscope's file format (https://www.speedscope.app)."""
+        frames: Dict[Tuple[str, str, int], int] = {}
+        samples = []
+        for stack, _ in self.samples:
+            samples.append([frames.setdefault(frame, len(frames)) for frame in stack])
+        weights = [round(weight, 3) for _, weight in self.samples]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": f"{self.endpoint} ({self.id})",
+            "exporter": settings.PROJECT_NAME,
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [
+                    {"name": name, "file": file, "line": line}
+                    for name, file, line in frames
+                ],
+            },
+            "profiles": [{
+                "type": "sampled",
+                "name": self.endpoint,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(sum(weights), 3),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+    def render(self, fmt: str) -> Tuple[bytes, str]:
+        """Serialize the profile.
+
+        Args:
+            fmt: speedscope or collapsed
+
+        Returns:
+            Body and content type
+        """
+        if fmt == "collapsed":
+            return self.collapsed().encode(), "text/plain; charset=utf-8"
+        return json.dumps(self.speedscope()).encode(), "application/json"
+
+
+_profile_var: ContextVar[Optional[Profile]] = ContextVar("request_profile", default=None)
+
+_active: Dict[str, Profile] = {}
+_active_lock = threading.Lock()
+_sampler: Optional[threading.Thread] = None
+
+_store: Deque[Profile] = deque(maxlen=settings.PROFILE_STORE_SIZE)
+_route_counters: Dict[str, "itertools.count[int]"] = {}
+
+
+def _profile_of(frame: FrameType) -> Optional[Profile]:
+    """The profile whose context ``frame`` runs in, if any (outermost frame first)."""
+    if "context" in frame.f_code.co_varnames:
+        context = frame.f_locals.get("context")
+        if isinstance(context, Context):
+            return context.get(_profile_var)
+    return None
+
+
+def _stack(leaf: FrameType) -> Tuple[Optional[Profile], Stack]:
+    """Walk a thread's frames and return its profile and the stack above the context switch."""
+    frames = []
+    frame: Optional[FrameType] = leaf
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    for depth, frame in enumerate(frames):
+        profile = _profile_of(frame)
+        if profile is not None:
+            return profile, tuple(
+                (
+                    f"{f.f_globals.get('__name__', '?')}.{f.f_code.co_qualname}",
+                    f.f_code.co_filename,
+                    f.f_code.co_firstlineno,
+                )
+                for f in frames[depth + 1:]
+            )
+    return None, ()
+
+
+def _sample_loop() -> None:
+    global _sampler
+    interval = settings.PROFILE_INTERVAL_MS / 1000
+    own_thread = threading.get_ident()
+    last = time.perf_counter()
+    while True:
+        time.sleep(interval)
+        now = time.perf_counter()
+        elapsed_ms = (now - last) * 1000
+        last = now
+        with _active_lock:
+            if not _active:
+                _sampler = None
+                return
+            waiting = set(_active.values())
+            for thread_id, leaf in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                profile, stack = _stack(leaf)
+                if profile is not None and profile in waiting and stack:
+                    profile.samples.append((stack, elapsed_ms))
+                    waiting.discard(profile)
+            for profile in waiting:
+                profile.samples.append((AWAITING, elapsed_ms))
+
+
+def _start(profile: Profile) -> None:
+    global _sampler
+    with _active_lock:
+        _active[profile.id] = profile
+        if _sampler is None:
+            _sampler = threading.Thread(target=_sample_loop, name="request-profiler", daemon=True)
+            _sampler.start()
+
+
+def _stop(profile: Profile) -> None:
+    with _active_lock:
+        _active.pop(profile.id, None)
+    _store.append(profile)
+
+
+def stored_profiles() -> List[Profile]:
+    """Profiles in the rolling store, newest first."""
+    return list(reversed(_store))
+
+
+def get_profile(profile_id: str) -> Optional[Profile]:
+    """Look up a stored profile by ID."""
+    for profile in _store:
+        if profile.id == profile_id:
+            return profile
+    return None
+
+
+def _is_superuser(token: str) -> bool:
+    """Check a bearer token the way ``get_current_active_superuser`` does."""
+    # Imported here so the JWT/crypto libraries do not slow down worker start
+    from app.core.security import decode_token
+
+    payload = decode_token(token)
+    if payload is None or payload.get("type") != "access" or not payload.get("sub"):
+        return False
+    try:
+        user_id = uuid.UUID(payload["sub"])
+    except (ValueError, AttributeError):
+        return False
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.id == user_id).first()
+        return bool(user and user.is_active and user.is_superuser)
+    finally:
+        db.close()
+
+
+def _requested_format(scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == PROFILE_HEADER.encode():
+            return value.decode("latin-1").strip().lower() or "speedscope"
+    for pair in scope.get("query_string", b"").decode("latin-1").split("&"):
+        name, _, value = pair.partition("=")
+        if name == "profile":
+            return value.lower() or "speedscope"
+    return None
+
+
+def _bearer_token(scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token.strip()
+    return None
+
+
+def _route_path(scope) -> Optional[str]:
+    """Template of the route that will serve the request (routing has not run yet)."""
+    for route in scope["app"].routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return None
+
+
+def _sampled(scope) -> bool:
+    """Whether this request is its route's Nth since the last sampled one."""
+    every = settings.PROFILE_SAMPLE_EVERY
+    if every <= 0:
+        return False
+    route_path = _route_path(scope)
+    if route_path is None:
+        return False
+    counter = _route_counters.setdefault(f"{scope['method']} {route_path}", itertools.count(1))
+    return next(counter) % every == 0
+
+
+class ProfilingMiddleware:
+    """ASGI middleware running flagged or sampled requests under the profiler.
+
+    A superuser's flagged request gets the profile as its response (the
+    handler's own status is in ``X-Profile-Status``); for anyone else the
+    flag is ignored. Sampled requests keep their response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        fmt = _requested_format(scope)
+        if fmt is not None:
+            token = _bearer_token(scope)
+            if fmt not in FORMATS or token is None or not await run_in_threadpool(_is_superuser, token):
+                fmt = None
+        if fmt is None and not _sampled(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = Profile(endpoint=f"{scope['method']} {scope['path']}")
+        token = _profile_var.set(profile)
+
+        async def send_or_swallow(message):
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+            if fmt is None:
+                await send(message)
+
+        started = time.perf_counter()
+        _start(profile)
+        try:
+            await self.app(scope, receive, send_or_swallow)
+        finally:
+            profile.duration_ms = (time.perf_counter() - started) * 1000
+            _stop(profile)
+            _profile_var.reset(token)
+            route = scope.get("route")
+            if route is not None:
+                profile.endpoint = f"{scope['method']} {route.path}"
+
+        if fmt is not None:
+            body, content_type = profile.render(fmt)
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", content_type.encode()),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"x-profile-id", profile.id.encode()),
+                    (b"x-profile-status", str(profile.status_code).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any
 from jose import JWTError, jwt
 import bcrypt
 from app.core.config import settings
+from app.core.metrics import BCRYPT_DURATION, BCRYPT_IN_PROGRESS
 
 
 def hash_password(password: str) -> str:
@@ -19,7 +20,9 @@ def hash_password(password: str) -> str:
     # Convert password to bytes and hash
     password_bytes = password.encode('utf-8')
     salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    with BCRYPT_IN_PROGRESS.labels("hash").track_inprogress(), \
+            BCRYPT_DURATION.labels("hash").time():
+        hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
 
@@ -35,7 +38,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     password_bytes = plain_password.encode('utf-8')
     hashed_bytes = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    with BCRYPT_IN_PROGRESS.labels("verify").track_inprogress(), \
+            BCRYPT_DURATION.labels("verify").time():
+        return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
 def create_access_token(
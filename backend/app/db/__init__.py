@@ -1,5 +1,17 @@
 """Database package."""
 
-from app.db.base import Base, engine, get_db, SessionLocal
+from app.db.base import Base, engine, get_db, read_engine, SessionLocal
+from app.db.events import cache_version, on_tables_changed, mark_tables_changed
+from app.db.indexes import live_index
 
-__all__ = ["Base", "engine", "get_db", "SessionLocal"]
+__all__ = [
+    "Base",
+    "engine",
+    "read_engine",
+    "get_db",
+    "SessionLocal",
+    "cache_version",
+    "on_tables_changed",
+    "mark_tables_changed",
+    "live_index",
+]
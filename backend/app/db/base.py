@@ -1,31 +1,92 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
+from decimal import ROUND_HALF_UP, Decimal
+
+from fastapi import Request
+from sqlalchemy import Numeric, create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Mapper, sessionmaker
 from app.core.config import settings
+from app.db import replicas, sqlite
+
+SQLITE_FILE = sqlite.is_file_database(settings.DATABASE_URL)
 
-# Create database engine
+# Create database engine (for SQLite: the single writer connection)
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
     echo=settings.DEBUG,
+    **(sqlite.engine_options(read_only=False) if SQLITE_FILE else {}),
 )
 
+# SQLite: pool of read-only connections to the same file for GET requests
+read_engine = None
+if SQLITE_FILE:
+    sqlite.configure(engine, read_only=False)
+    read_engine = create_engine(
+        settings.DATABASE_URL,
+        pool_pre_ping=True,
+        echo=settings.DEBUG,
+        **sqlite.engine_options(read_only=True),
+    )
+    sqlite.configure(read_engine, read_only=True)
+    replicas.use_local_reader(read_engine)
+
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    class_=replicas.RoutingSession, autocommit=False, autoflush=False, bind=engine,
+)
+
+
+class _ModelBase:
+    # Read server-generated values (created_at, updated_at, ...) back with
+    # INSERT/UPDATE ... RETURNING during flush instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
 
 # Base class for all models
-Base = declarative_base()
+Base = declarative_base(cls=_ModelBase)
 
 
-def get_db():
+@event.listens_for(Mapper, "mapper_configured")
+def _round_numeric_attributes(mapper, class_):
+    """Round Decimal attributes to their column's scale when set.
+
+    Committed objects are returned without being reloaded, so values
+    computed in Python (tax, totals) must already match what the database
+    stores.
+    """
+    if not issubclass(class_, Base):
+        return
+    for prop in mapper.column_attrs:
+        column_type = prop.columns[0].type
+        if not isinstance(column_type, Numeric) or column_type.scale is None:
+            continue
+        exponent = Decimal(1).scaleb(-column_type.scale)
+
+        def _round(target, value, oldvalue, initiator, exponent=exponent):
+            if isinstance(value, Decimal):
+                return value.quantize(exponent, rounding=ROUND_HALF_UP)
+            return value
+
+        event.listen(prop.class_attribute, "set", _round, retval=True)
+
+
+def get_db(request: Request):
     """Dependency for getting database session.
 
+    Args:
+        request: Current request; GET and HEAD requests read from a
+            replica when one is configured and available
+
     Yields:
         Database session that automatically closes after use
     """
-    db = SessionLocal()
+    # Objects stay loaded after commit, so responses need no refresh query
+    db = SessionLocal(expire_on_commit=False)
+    replicas.route(db, request.method, replicas.primary_until(
+        request.headers.get(replicas.STICKY_HEADER) or request.cookies.get(replicas.STICKY_COOKIE)
+    ))
     try:
         yield db
     finally:
@@ -0,0 +1,84 @@
+"""Session events for reacting to committed data changes."""
+
+from typing import Callable, List, Optional, Set
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import cache
+
+_CHANGED_TABLES_KEY = "changed_tables"
+_CACHE_VERSION_KEY = "cache_version"
+
+_listeners: List[Callable[[Set[str]], None]] = []
+
+
+def on_tables_changed(callback: Callable[[Set[str]], None]) -> None:
+    """Register a callback run after a commit that touched ORM tables.
+
+    Args:
+        callback: Called with the set of table names that had rows
+            inserted, updated or deleted in the committed transaction
+    """
+    _listeners.append(callback)
+
+
+def cache_version(session: Session) -> Optional[int]:
+    """Cache version held since the session's transaction began.
+
+    Values loaded in the transaction are stored only if their key was not
+    invalidated after it began: on SQLite the transaction reads a snapshot
+    taken at its first statement, possibly well before the load.
+
+    Args:
+        session: Session the value is loaded with
+
+    Returns:
+        Held version, or None outside a transaction
+    """
+    return session.info.get(_CACHE_VERSION_KEY)
+
+
+def mark_tables_changed(session: Session, *tables: str) -> None:
+    """Record tables changed through Core statements (bulk insert/update).
+
+    Args:
+        session: Session the statements were executed on
+        tables: Names of the tables that were modified
+    """
+    session.info.setdefault(_CHANGED_TABLES_KEY, set()).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_tables(session, flush_context):
+    changed = session.info.setdefault(_CHANGED_TABLES_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            changed.add(table)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_changed_tables(session):
+    changed = session.info.pop(_CHANGED_TABLES_KEY, None)
+    if not changed:
+        return
+    for callback in _listeners:
+        callback(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_tables(session):
+    session.info.pop(_CHANGED_TABLES_KEY, None)
+
+
+@event.listens_for(Session, "after_begin")
+def _hold_cache_version(session, transaction, connection):
+    # Once per transaction, before the first connection reads anything
+    if _CACHE_VERSION_KEY not in session.info:
+        session.info[_CACHE_VERSION_KEY] = cache.hold_version()
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _release_cache_version(session, transaction):
+    if transaction.parent is None and _CACHE_VERSION_KEY in session.info:
+        cache.release_version(session.info.pop(_CACHE_VERSION_KEY))
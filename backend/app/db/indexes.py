@@ -0,0 +1,26 @@
+"""Index helpers shared by the models."""
+
+from sqlalchemy import Index, text
+
+# Predicate every list endpoint applies before sorting
+LIVE_ROWS = "deleted_at IS NULL"
+
+
+def live_index(name: str, *expressions, **kwargs) -> Index:
+    """Build a partial index covering only rows that are not soft-deleted.
+
+    Args:
+        name: Index name
+        *expressions: Indexed columns, e.g. ``name, id`` or ``created_at.desc()``
+        **kwargs: Extra ``Index`` options
+
+    Returns:
+        Index limited to ``deleted_at IS NULL`` on PostgreSQL and SQLite
+    """
+    return Index(
+        name,
+        *expressions,
+        postgresql_where=text(LIVE_ROWS),
+        sqlite_where=text(LIVE_ROWS),
+        **kwargs,
+    )
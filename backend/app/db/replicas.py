@@ -0,0 +1,285 @@
+"""Read replica routing.
+
+With ``DATABASE_REPLICA_URLS`` set, sessions opened for GET and HEAD
+requests (lists, details, exports, reports) read from a replica, chosen
+round-robin, while every other request uses the primary. A read session
+that starts writing switches to the primary for the rest of its life.
+
+For an SQLite file database, reads instead go to a local pool of
+read-only connections on the same file (see ``app.db.sqlite``), which
+always sees committed writes, so there is no stickiness or lag check.
+Sessions of every request read there until their first flush or DML
+statement, so the single writer connection (and the database write lock)
+is only held from the first write until commit. Reads that decide what
+gets written, such as allocating the next document number, call
+``use_primary`` first.
+
+A request stays on the primary when:
+
+* the client committed a write within ``REPLICA_STICKY_SECONDS``, so it
+  reads its own writes. ``StickinessMiddleware`` answers a request that
+  wrote with a ``primary_until`` cookie (and an ``X-Primary-Until``
+  header, for clients without cookies to send back), so any worker
+  process can tell
+* no replica is available: each replica is pinged at most every
+  ``REPLICA_CHECK_SECONDS``; one that fails, drops its connection or lags
+  more than ``REPLICA_MAX_LAG_SECONDS`` behind is skipped until a later
+  check succeeds
+
+Values cached for all clients are computed inside ``primary_reads``, so a
+lagging replica never refills a cache right after a write invalidated it.
+"""
+
+import itertools
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.core.config import settings
+from app.core.metrics import DB_SESSION_ROUTES
+
+logger = logging.getLogger(__name__)
+
+READ_METHODS = ("GET", "HEAD")
+
+# Seconds since the last replayed transaction, 0 when fully caught up
+POSTGRES_LAG_SQL = """
+SELECT COALESCE(
+    CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+         ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END,
+    0)
+"""
+
+# Where a client that wrote sends back until when it must read the primary
+STICKY_COOKIE = "primary_until"
+STICKY_HEADER = "x-primary-until"
+
+
+class Replica:
+    """A read replica engine and its last known health.
+
+    Args:
+        url: Database URL of the replica
+    """
+
+    def __init__(self, url: str):
+        connect_args = {"connect_timeout": 2} if url.startswith("postgresql") else {}
+        self.engine = create_engine(url, pool_pre_ping=True, echo=settings.DEBUG, connect_args=connect_args)
+        self.lag_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self.checked_at = -math.inf
+        self._lock = threading.Lock()
+        event.listen(self.engine, "handle_error", self._on_error)
+
+    @property
+    def name(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+    @property
+    def available(self) -> bool:
+        return self.error is None and self.lag_seconds is not None \
+            and self.lag_seconds <= settings.REPLICA_MAX_LAG_SECONDS
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect:
+            self.error = "disconnected"
+            self.checked_at = time.monotonic()
+
+    def check(self) -> None:
+        """Measure replication lag if the last check is older than ``REPLICA_CHECK_SECONDS``."""
+        if time.monotonic() - self.checked_at < settings.REPLICA_CHECK_SECONDS:
+            return
+        # One thread checks; the others keep using the previous result
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            with self.engine.connect() as conn:
+                if conn.dialect.name == "postgresql":
+                    lag = conn.exec_driver_sql(POSTGRES_LAG_SQL).scalar()
+                else:
+                    conn.exec_driver_sql("SELECT 1")
+                    lag = 0
+            self.lag_seconds = float(lag)
+            self.error = None
+            if self.lag_seconds > settings.REPLICA_MAX_LAG_SECONDS:
+                logger.warning("Replica %s lags %.1f s behind, reading from primary", self.name, self.lag_seconds)
+        except SQLAlchemyError as exc:
+            self.lag_seconds = None
+            self.error = type(exc).__name__
+            logger.warning("Replica %s unavailable, reading from primary: %s", self.name, exc)
+        finally:
+            self.checked_at = time.monotonic()
+            self._lock.release()
+
+    def status(self) -> Dict[str, object]:
+        return {
+            "replica": self.name,
+            "available": self.available,
+            "lag_seconds": self.lag_seconds,
+            "error": self.error,
+        }
+
+
+replicas: List[Replica] = [Replica(url) for url in settings.DATABASE_REPLICA_URLS]
+_local_reader: Optional[Engine] = None
+_round_robin = itertools.count()
+
+# Per request: set by StickinessMiddleware, "primary_until" filled in when
+# one of the request's sessions commits a write
+_request_writes: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_writes", default=None)
+
+
+def use_local_reader(engine: Engine) -> None:
+    """Send reads to ``engine``, a read-only pool on the primary database itself."""
+    global _local_reader
+    _local_reader = engine
+
+
+def choose_replica() -> Optional[Engine]:
+    """Engine of the next available replica, or None to use the primary."""
+    for replica in replicas:
+        replica.check()
+    available = [replica for replica in replicas if replica.available]
+    if not available:
+        return None
+    return available[next(_round_robin) % len(available)].engine
+
+
+def primary_until(value: Optional[str]) -> float:
+    """Parse a client's ``primary_until`` cookie or header (0 if absent or invalid)."""
+    try:
+        until = float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+    return until if math.isfinite(until) else 0.0
+
+
+def is_sticky(until: float) -> bool:
+    """Whether a client's ``primary_until`` still sends it to the primary.
+
+    Values further ahead than ``REPLICA_STICKY_SECONDS`` are not ones this
+    application issued and are ignored.
+    """
+    now = time.time()
+    return now < until <= now + settings.REPLICA_STICKY_SECONDS
+
+
+def route(session: Session, method: str, until: float = 0.0) -> None:
+    """Pick the engine a request's session reads from.
+
+    Args:
+        session: Newly created request session
+        method: HTTP method of the request
+        until: The client's ``primary_until`` (see ``primary_until``)
+    """
+    if _local_reader is not None:
+        session.info["replica"] = _local_reader
+        return
+    if method not in READ_METHODS:
+        session.info["writes"] = True
+    if not replicas:
+        return
+    if session.info.get("writes"):
+        DB_SESSION_ROUTES.labels("primary", "write").inc()
+        return
+    if is_sticky(until):
+        DB_SESSION_ROUTES.labels("primary", "sticky").inc()
+        return
+    replica = choose_replica()
+    if replica is None:
+        DB_SESSION_ROUTES.labels("primary", "unavailable").inc()
+        return
+    session.info["replica"] = replica
+    DB_SESSION_ROUTES.labels("replica", "read").inc()
+
+
+@contextmanager
+def primary_reads(session: Session) -> Iterator[None]:
+    """Read from the primary inside the block, e.g. to fill a shared cache.
+
+    The local SQLite reader always sees the latest commit and is kept.
+    """
+    replica = session.info.get("replica")
+    if replica is None or replica is _local_reader:
+        yield
+        return
+    session.info["replica"] = None
+    try:
+        yield
+    finally:
+        session.info["replica"] = replica
+
+
+def use_primary(session: Session) -> None:
+    """Send the rest of a session's statements to the primary.
+
+    For SQLite the next statement begins the writer transaction, so the
+    write lock is held from that read until commit.
+    """
+    session.info["writes"] = True
+
+
+class RoutingSession(Session):
+    """Session that reads from ``info["replica"]`` until it writes."""
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["writes"] = True
+        elif not self.info.get("writes") and self.info.get("replica") is not None:
+            return self.info["replica"]
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _stick_after_write(session):
+    writes = _request_writes.get()
+    if replicas and writes is not None and session.info.get("writes"):
+        writes["primary_until"] = time.time() + settings.REPLICA_STICKY_SECONDS
+
+
+class StickinessMiddleware:
+    """ASGI middleware sending clients that just wrote to the primary.
+
+    A response to a request that committed a write sets the
+    ``primary_until`` cookie and ``X-Primary-Until`` header to the time
+    until which the client's reads go to the primary.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        writes: Dict[str, float] = {}
+        token = _request_writes.set(writes)
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and "primary_until" in writes:
+                value = f"{writes['primary_until']:.3f}"
+                max_age = math.ceil(settings.REPLICA_STICKY_SECONDS)
+                headers = list(message.get("headers", []))
+                headers.append((STICKY_HEADER.encode(), value.encode()))
+                headers.append((
+                    b"set-cookie",
+                    f"{STICKY_COOKIE}={value}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax".encode(),
+                ))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            _request_writes.reset(token)
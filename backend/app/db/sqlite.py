@@ -0,0 +1,69 @@
+"""SQLite as a production backend for single-box deployments.
+
+For a file database the application opens two engines on the same file:
+
+* the writer (``app.db.engine``): one connection per process. Its
+  transactions start with ``BEGIN IMMEDIATE``, so they take the write lock
+  up front instead of failing when a read transaction tries to upgrade;
+  writers from other worker processes wait up to ``SQLITE_BUSY_TIMEOUT_MS``
+* the reader (``app.db.read_engine``): a pool of ``SQLITE_READER_POOL_SIZE``
+  ``query_only`` connections. Request sessions read here until they first
+  write (see ``app.db.replicas``), so the writer is not held through
+  lookups, validation or password hashing. In WAL mode readers never
+  block the writer and always see the latest committed data
+
+Every connection gets the ``journal_mode``, ``synchronous``, ``mmap_size``,
+``busy_timeout`` and ``foreign_keys`` pragmas.
+"""
+
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+from app.core.config import settings
+
+
+def is_file_database(url: str) -> bool:
+    """Whether ``url`` points at an SQLite database file (not ``:memory:``)."""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+
+def engine_options(read_only: bool) -> Dict[str, Any]:
+    """Keyword arguments for ``create_engine`` of the writer or reader engine."""
+    return {
+        "pool_size": settings.SQLITE_READER_POOL_SIZE if read_only else 1,
+        "max_overflow": 0,
+        "connect_args": {
+            "check_same_thread": False,
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+        },
+    }
+
+
+def configure(engine: Engine, read_only: bool) -> None:
+    """Apply the pragmas on connect and take over transaction control.
+
+    Args:
+        engine: Writer or reader engine of an SQLite file database
+        read_only: Reject writes on this engine's connections
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself (see below) instead of pysqlite
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN" if read_only else "BEGIN IMMEDIATE")
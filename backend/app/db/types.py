@@ -0,0 +1,85 @@
+"""Column types that work on both PostgreSQL and SQLite, and key generation."""
+
+import os
+import threading
+import time
+import uuid
+from typing import Optional, Union
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+
+class UUID(TypeDecorator):
+    """UUID column: native ``uuid`` on PostgreSQL, a 16-byte blob elsewhere.
+
+    Values are always ``uuid.UUID`` objects in Python; strings are accepted
+    as bind parameters. ``as_uuid`` is accepted for compatibility with
+    ``sqlalchemy.dialects.postgresql.UUID`` and must be true.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def __init__(self, as_uuid: bool = True):
+        if not as_uuid:
+            raise ValueError("UUID columns always return uuid.UUID values")
+        super().__init__()
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value: Optional[Union[uuid.UUID, str]], dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        if dialect.name == "postgresql":
+            return value
+        return value.bytes
+
+    def process_result_value(self, value, dialect) -> Optional[uuid.UUID]:
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        if isinstance(value, (bytes, memoryview)):
+            return uuid.UUID(bytes=bytes(value))
+        return uuid.UUID(str(value))
+
+
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, so new keys sort
+    after existing ones and inserts append to the end of the primary key
+    index. Within a millisecond a 12-bit counter (started at a random
+    value) keeps keys from this process strictly increasing; the
+    remaining 62 bits are random.
+
+    Returns:
+        New UUID, usable as a column default
+    """
+    global _uuid7_last_ms, _uuid7_counter
+    with _uuid7_lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _uuid7_last_ms:
+            _uuid7_last_ms = now_ms
+            # Leave room to count up within the same millisecond
+            _uuid7_counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Same millisecond (or the clock went back): count on from the last key
+            _uuid7_counter += 1
+            if _uuid7_counter > 0xFFF:
+                _uuid7_last_ms += 1
+                _uuid7_counter = 0
+        timestamp_ms, counter = _uuid7_last_ms, _uuid7_counter
+    random_bits = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    return uuid.UUID(int=(
+        timestamp_ms << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | random_bits
+    ))
@@ -3,6 +3,36 @@
 # Import all models here for Alembic to detect them
 from app.db.base import Base
 from app.models.user import User
-from app.models.part import Part
+from app.models.part import Part, PartSpecValue
+from app.models.supplier import Supplier
+from app.models.customer import Customer
+from app.models.build import Build, build_parts
+from app.models.delivery import Delivery
+from app.models.invoice import Invoice
+from app.models.invoice_reminder import InvoiceReminder
+from app.models.revenue_rollup import RevenueRollupDaily, RevenueRollupMonthly
+from app.models.job import JobLock, JobRun
+from app.models.outbound_email import OutboundEmail
+from app.models.archive import ARCHIVE_TABLES
+from app.models.slow_query import SlowQuery
 
-__all__ = ["Base", "User", "Part"]
+__all__ = [
+    "Base",
+    "User",
+    "Part",
+    "PartSpecValue",
+    "Supplier",
+    "Customer",
+    "Build",
+    "build_parts",
+    "Delivery",
+    "Invoice",
+    "InvoiceReminder",
+    "RevenueRollupDaily",
+    "RevenueRollupMonthly",
+    "JobLock",
+    "JobRun",
+    "OutboundEmail",
+    "ARCHIVE_TABLES",
+    "SlowQuery",
+]
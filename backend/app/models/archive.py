@@ -0,0 +1,59 @@
+"""Cold archive tables for soft-deleted rows.
+
+Each ``<table>_archive`` mirrors the columns of its hot table, without
+foreign keys, unique constraints, defaults or generated columns, plus an
+``archived_at`` timestamp. Dependent rows that have no soft delete of their own
+(``build_parts``, ``invoice_reminders``) are archived with their parent.
+"""
+
+from typing import Dict
+from sqlalchemy import Column, DateTime, Table
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+from app.models.build import Build, build_parts
+from app.models.customer import Customer
+from app.models.delivery import Delivery
+from app.models.invoice import Invoice
+from app.models.invoice_reminder import InvoiceReminder
+from app.models.part import Part
+from app.models.supplier import Supplier
+
+
+def _archive_table(source: Table) -> Table:
+    """Create the archive table mirroring ``source``."""
+    columns = [
+        Column(
+            column.name,
+            column.type,
+            primary_key=column.primary_key,
+            nullable=column.nullable,
+            # Restores look rows up by their parent
+            index=bool(column.foreign_keys),
+        )
+        for column in source.columns
+        # Generated columns are recomputed when a row is restored
+        if column.computed is None
+    ]
+    return Table(
+        f"{source.name}_archive",
+        Base.metadata,
+        *columns,
+        Column("archived_at", DateTime(timezone=True), server_default=func.now(),
+               nullable=False, index=True),
+    )
+
+
+ARCHIVE_TABLES: Dict[str, Table] = {
+    source.name: _archive_table(source)
+    for source in (
+        Supplier.__table__,
+        Customer.__table__,
+        Part.__table__,
+        Build.__table__,
+        build_parts,
+        Delivery.__table__,
+        Invoice.__table__,
+        InvoiceReminder.__table__,
+    )
+}
@@ -1,18 +1,17 @@
 """Build model for printer configurations."""
 
-import uuid
 from sqlalchemy import Column, String, Text, DateTime, Integer, Boolean, Numeric, ForeignKey, Table
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.db import Base
+from app.db import Base, live_index
+from app.db.types import UUID, uuid7
 
 
 # Junction table for many-to-many relationship between builds and parts
 build_parts = Table(
     'build_parts',
     Base.metadata,
-    Column('id', UUID(as_uuid=True), primary_key=True, default=uuid.uuid4),
+    Column('id', UUID(as_uuid=True), primary_key=True, default=uuid7),
     Column('build_id', UUID(as_uuid=True), ForeignKey('builds.id', ondelete='CASCADE'), nullable=False, index=True),
     Column('part_id', UUID(as_uuid=True), ForeignKey('parts.id', ondelete='CASCADE'), nullable=False, index=True),
     Column('quantity', Integer, nullable=False, default=1),
@@ -26,7 +25,7 @@ class Build(Base):
     __tablename__ = "builds"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
 
     # Basic information
     name = Column(String(255), nullable=False, index=True)
@@ -60,5 +59,11 @@ class Build(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Partial indexes serving the soft-delete filter and sort of list queries
+    __table_args__ = (
+        live_index("ix_builds_live_name", name, id),
+        live_index("ix_builds_live_status_name", status, name, id),
+    )
+
     def __repr__(self):
         return f"<Build {self.name} ({self.model_number})>"
@@ -1,10 +1,9 @@
 """Customer model."""
 
-import uuid
 from sqlalchemy import Column, String, Boolean, Text, DateTime
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
-from app.db import Base
+from app.db import Base, live_index
+from app.db.types import UUID, uuid7
 
 
 class Customer(Base):
@@ -13,7 +12,7 @@ class Customer(Base):
     __tablename__ = "customers"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
 
     # Basic information
     name = Column(String(255), nullable=False, index=True)
@@ -48,5 +47,11 @@ class Customer(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Partial indexes serving the soft-delete filter and sort of list queries
+    __table_args__ = (
+        live_index("ix_customers_live_name", name, id),
+        live_index("ix_customers_live_type_name", customer_type, name, id),
+    )
+
     def __repr__(self):
         return f"<Customer {self.name}>"
@@ -1,11 +1,10 @@
 """Delivery model for tracking shipments."""
 
-import uuid
 from sqlalchemy import Column, String, Text, DateTime, Numeric, ForeignKey, Boolean
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.db import Base
+from app.db import Base, live_index
+from app.db.types import UUID, uuid7
 
 
 class Delivery(Base):
@@ -14,7 +13,7 @@ class Delivery(Base):
     __tablename__ = "deliveries"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
 
     # Delivery number (auto-generated unique identifier)
     delivery_number = Column(String(50), nullable=False, unique=True, index=True)
@@ -63,5 +62,12 @@ class Delivery(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Partial indexes serving the soft-delete filter and sort of list queries
+    __table_args__ = (
+        live_index("ix_deliveries_live_created", created_at.desc(), id.desc()),
+        live_index("ix_deliveries_live_status_created", status, created_at.desc(), id.desc()),
+        live_index("ix_deliveries_live_customer_created", customer_id, created_at.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<Delivery {self.delivery_number}>"
@@ -1,11 +1,10 @@
 """Invoice model for billing management."""
 
-import uuid
-from sqlalchemy import Column, String, Text, DateTime, Numeric, ForeignKey, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, DateTime, Numeric, ForeignKey, Boolean, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.db import Base
+from app.db import Base, live_index
+from app.db.types import UUID, uuid7
 
 
 class Invoice(Base):
@@ -14,7 +13,7 @@ class Invoice(Base):
     __tablename__ = "invoices"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
 
     # Invoice number (auto-generated unique identifier)
     invoice_number = Column(String(50), nullable=False, unique=True, index=True)
@@ -67,5 +66,23 @@ class Invoice(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Partial index covering only open receivables (aging report, dunning)
+    __table_args__ = (
+        Index(
+            "ix_invoices_unpaid_due",
+            "customer_id",
+            "due_date",
+            postgresql_where=text("deleted_at IS NULL AND status IN ('sent', 'overdue')"),
+            postgresql_include=["total_amount"],
+            sqlite_where=text("deleted_at IS NULL AND status IN ('sent', 'overdue')"),
+        ),
+        # Partial indexes serving the soft-delete filter and sort of list queries
+        live_index("ix_invoices_live_created", created_at.desc(), id.desc()),
+        live_index("ix_invoices_live_status_created", status, created_at.desc(), id.desc()),
+        live_index("ix_invoices_live_customer_created", customer_id, created_at.desc(), id.desc()),
+        # A delivery is billed by at most one live invoice
+        live_index("ux_invoices_live_delivery", delivery_id, unique=True),
+    )
+
     def __repr__(self):
         return f"<Invoice {self.invoice_number}>"
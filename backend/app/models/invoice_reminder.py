@@ -0,0 +1,30 @@
+"""Invoice reminder model for dunning."""
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.db import Base
+from app.db.types import UUID, uuid7
+
+
+class InvoiceReminder(Base):
+    """Payment reminder queued for an overdue invoice."""
+
+    __tablename__ = "invoice_reminders"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    invoice_id = Column(UUID(as_uuid=True), ForeignKey('invoices.id'), nullable=False, index=True)
+
+    # Dunning level (1 = first reminder)
+    level = Column(Integer, nullable=False)
+
+    # Set once the reminder has been delivered to the customer
+    sent_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+    # Relationships
+    invoice = relationship("Invoice", backref="reminders")
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<InvoiceReminder {self.invoice_id} level {self.level}>"
@@ -0,0 +1,43 @@
+"""Background job bookkeeping models."""
+
+from sqlalchemy import Column, String, Text, DateTime, Integer, JSON
+from sqlalchemy.sql import func
+from app.db import Base
+from app.db.types import UUID, uuid7
+
+
+class JobLock(Base):
+    """Lease that lets only one worker process run a job at a time."""
+
+    __tablename__ = "job_locks"
+
+    name = Column(String(100), primary_key=True)
+    owner = Column(String(255), nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<JobLock {self.name} ({self.owner})>"
+
+
+class JobRun(Base):
+    """One execution of a scheduled background job."""
+
+    __tablename__ = "job_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    job_name = Column(String(100), nullable=False, index=True)
+
+    # Possible values: success, failed
+    status = Column(String(20), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=False)
+    duration_ms = Column(Integer, nullable=False)
+
+    # Job-specific counters (e.g. invoices_marked_overdue)
+    stats = Column(JSON, nullable=True, default=dict)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<JobRun {self.job_name} {self.status}>"
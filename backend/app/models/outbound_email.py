@@ -0,0 +1,46 @@
+"""Outbound email queue model."""
+
+from sqlalchemy import Column, String, Text, DateTime, Integer, Index, text
+from sqlalchemy.sql import func
+from app.db import Base
+from app.db.types import UUID, uuid7
+
+
+class OutboundEmail(Base):
+    """Email waiting to be delivered by the outbox worker."""
+
+    __tablename__ = "outbound_emails"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+
+    # Message
+    to_address = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+
+    # What the message is about (invoice, delivery_note, invoice_reminder)
+    kind = Column(String(50), nullable=True, index=True)
+    reference_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+
+    # Delivery state
+    # Possible values: pending, sent, dead
+    status = Column(String(20), nullable=False, default='pending')
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # The worker only ever polls pending messages
+    __table_args__ = (
+        Index(
+            "ix_outbound_emails_pending",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
+
+    def __repr__(self):
+        return f"<OutboundEmail {self.to_address}: {self.subject}>"
@@ -1,10 +1,11 @@
 """Part model for inventory management."""
 
-from sqlalchemy import Column, String, Integer, Numeric, Text, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, Computed, String, Integer, Numeric, Text, DateTime, Float, ForeignKey, Index, JSON, text
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
-import uuid
 from app.db.base import Base
+from app.db.types import UUID, uuid7
+from app.db.indexes import LIVE_ROWS, live_index
 
 
 class Part(Base):
@@ -12,20 +13,30 @@ class Part(Base):
 
     __tablename__ = "parts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     sku = Column(String(100), unique=True, index=True, nullable=False)
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     category = Column(String(100), nullable=True, index=True)
 
-    # Specifications stored as JSON for flexibility
-    specifications = Column(JSON, nullable=True, default=dict)
+    # Specifications stored as JSON for flexibility (JSONB on PostgreSQL);
+    # top-level scalar values are also indexed in part_spec_values
+    specifications = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True, default=dict)
 
     # Inventory tracking
     current_stock = Column(Integer, default=0, nullable=False)
     minimum_stock = Column(Integer, default=0, nullable=False)
     unit_price = Column(Numeric(10, 2), nullable=True)
 
+    # Stock level computed by the database (stored on PostgreSQL, virtual on
+    # SQLite), so low-stock filters and counts can use an index
+    is_low_stock = Column(Boolean, Computed("current_stock < minimum_stock"))
+    stock_status = Column(String(20), Computed(
+        "CASE WHEN current_stock = 0 THEN 'out_of_stock' "
+        "WHEN current_stock < minimum_stock THEN 'low_stock' "
+        "ELSE 'in_stock' END"
+    ))
+
     # Audit fields
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(
@@ -36,20 +47,46 @@ class Part(Base):
     )
     deleted_at = Column(DateTime, nullable=True)
 
+    # Partial indexes serving the soft-delete filter and sort of list queries
+    __table_args__ = (
+        live_index("ix_parts_live_name", name, id),
+        live_index("ix_parts_live_category_name", category, name, id),
+        # Low-stock list (low_stock_only), sorted like the other lists; the
+        # predicate matches how a bare boolean filter renders per dialect
+        Index(
+            "ix_parts_live_low_stock", name, id,
+            postgresql_where=text(f"{LIVE_ROWS} AND is_low_stock"),
+            sqlite_where=text(f"{LIVE_ROWS} AND is_low_stock = 1"),
+        ),
+        # Containment (@>) lookups for spec.<key>=<value> filters
+        Index(
+            "ix_parts_specifications", specifications,
+            postgresql_using="gin", postgresql_ops={"specifications": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __repr__(self):
         return f"<Part {self.sku}: {self.name}>"
 
-    @property
-    def is_low_stock(self) -> bool:
-        """Check if part is below minimum stock level."""
-        return self.current_stock < self.minimum_stock
-
-    @property
-    def stock_status(self) -> str:
-        """Get stock status string."""
-        if self.current_stock == 0:
-            return "out_of_stock"
-        elif self.is_low_stock:
-            return "low_stock"
-        else:
-            return "in_stock"
+
+class PartSpecValue(Base):
+    """One top-level scalar of a part's specifications, typed for range filters.
+
+    Derived from ``Part.specifications`` by ``app.services.part_specs``;
+    rows are removed with their part.
+    """
+
+    __tablename__ = "part_spec_values"
+
+    part_id = Column(UUID(as_uuid=True), ForeignKey("parts.id", ondelete="CASCADE"), primary_key=True)
+    key = Column(String(100), primary_key=True)
+    # JSON numbers only (not booleans)
+    num_value = Column(Float, nullable=True)
+    # Strings as they are, numbers and booleans in their JSON spelling;
+    # NULL for strings longer than 255 characters
+    text_value = Column(String(255), nullable=True)
+
+    __table_args__ = (
+        Index("ix_part_spec_values_key_num", key, num_value, part_id),
+        Index("ix_part_spec_values_key_text", key, text_value, part_id),
+    )
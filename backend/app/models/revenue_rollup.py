@@ -0,0 +1,42 @@
+"""Revenue rollup models for invoice reporting."""
+
+from sqlalchemy import Column, String, Date, Integer, Numeric
+from app.db import Base
+from app.db.types import UUID
+
+
+class RevenueRollupMixin:
+    """Aggregated invoice amounts for one period, status and customer.
+
+    Rows are derived data maintained by ``app.services.revenue_rollups``.
+    ``customer_id`` intentionally carries no foreign key so rollups never
+    block customer maintenance.
+    """
+
+    period = Column(Date, primary_key=True)
+    status = Column(String(50), primary_key=True)
+    customer_id = Column(UUID(as_uuid=True), primary_key=True, index=True)
+
+    invoice_count = Column(Integer, nullable=False, default=0)
+    subtotal = Column(Numeric(14, 2), nullable=False, default=0)
+    tax_amount = Column(Numeric(14, 2), nullable=False, default=0)
+    discount_amount = Column(Numeric(14, 2), nullable=False, default=0)
+    total_amount = Column(Numeric(14, 2), nullable=False, default=0)
+
+
+class RevenueRollupDaily(RevenueRollupMixin, Base):
+    """Invoice totals per invoice day."""
+
+    __tablename__ = "revenue_rollup_daily"
+
+    def __repr__(self):
+        return f"<RevenueRollupDaily {self.period} {self.status}>"
+
+
+class RevenueRollupMonthly(RevenueRollupMixin, Base):
+    """Invoice totals per invoice month (period is the first of the month)."""
+
+    __tablename__ = "revenue_rollup_monthly"
+
+    def __repr__(self):
+        return f"<RevenueRollupMonthly {self.period} {self.status}>"
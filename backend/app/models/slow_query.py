@@ -0,0 +1,30 @@
+"""Slow query log model."""
+
+from sqlalchemy import Column, String, Text, DateTime, Integer, Float, JSON
+from sqlalchemy.sql import func
+from app.db import Base
+
+
+class SlowQuery(Base):
+    """Aggregated statistics for one slow statement fingerprint."""
+
+    __tablename__ = "slow_queries"
+
+    # Hash of the normalized statement (literals and parameters replaced by ?)
+    fingerprint = Column(String(16), primary_key=True)
+    statement = Column(Text, nullable=False)
+
+    # Parameter types of the latest occurrence, never the values
+    parameter_shape = Column(JSON, nullable=True)
+    endpoint = Column(String(255), nullable=True)
+    plan = Column(Text, nullable=True)
+
+    calls = Column(Integer, nullable=False, default=1)
+    total_ms = Column(Float, nullable=False, default=0)
+    max_ms = Column(Float, nullable=False, default=0)
+
+    first_seen = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_seen = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<SlowQuery {self.fingerprint} x{self.calls}>"
@@ -1,10 +1,9 @@
 """User model for authentication and authorization."""
 
 from sqlalchemy import Boolean, Column, String, DateTime
-from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
-import uuid
 from app.db.base import Base
+from app.db.types import UUID, uuid7
 
 
 class User(Base):
@@ -12,7 +11,7 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     full_name = Column(String, nullable=True)
@@ -0,0 +1,13 @@
+"""Archive schemas for response validation."""
+
+from pydantic import BaseModel
+from uuid import UUID
+from typing import Dict
+
+
+class ArchiveRestoreResult(BaseModel):
+    """Schema for the outcome of restoring an archived record."""
+
+    table: str
+    id: UUID
+    restored: Dict[str, int]
@@ -0,0 +1,43 @@
+"""Dashboard schemas for response validation."""
+
+from pydantic import BaseModel
+from decimal import Decimal
+
+
+class PartsSummary(BaseModel):
+    """Stock level aggregates over active parts."""
+
+    total: int
+    low_stock: int
+    out_of_stock: int
+    inventory_value: Decimal
+
+
+class DeliveriesSummary(BaseModel):
+    """Delivery status aggregates over active deliveries."""
+
+    total: int
+    open: int
+    pending: int
+    in_transit: int
+    late: int
+
+
+class InvoicesSummary(BaseModel):
+    """Invoice status and revenue aggregates over active invoices."""
+
+    total: int
+    draft: int
+    outstanding: int
+    overdue: int
+    outstanding_revenue: Decimal
+    overdue_revenue: Decimal
+    paid_revenue: Decimal
+
+
+class DashboardSummary(BaseModel):
+    """Schema for the dashboard landing page summary."""
+
+    parts: PartsSummary
+    deliveries: DeliveriesSummary
+    invoices: InvoicesSummary
@@ -76,6 +76,6 @@ class DeliveryList(BaseModel):
 
     items: list[Delivery]
     total: int
-    page: int
+    page: Optional[int] = Field(None, description="Page number (not set for 'after' cursor pages)")
     per_page: int
-    total_pages: int
+    total_pages: Optional[int] = Field(None, description="Number of pages (not set for 'after' cursor pages)")
@@ -0,0 +1,44 @@
+"""Diagnostics schemas for response validation."""
+
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from typing import Any, Optional
+
+
+class SlowQuery(BaseModel):
+    """Schema for an aggregated slow statement."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    fingerprint: str
+    statement: str
+    parameter_shape: Optional[Any] = None
+    endpoint: Optional[str] = None
+    plan: Optional[str] = None
+    calls: int
+    total_ms: float
+    max_ms: float
+    mean_ms: float
+    first_seen: datetime
+    last_seen: datetime
+
+
+class SlowQueryList(BaseModel):
+    """Schema for paginated slow query list response."""
+
+    items: list[SlowQuery]
+    total: int
+    page: int
+    per_page: int
+    total_pages: int
+
+
+class ProfileSummary(BaseModel):
+    """Schema for a stored request profile (without its samples)."""
+
+    id: str
+    endpoint: str
+    started_at: datetime
+    duration_ms: float
+    status_code: Optional[int] = None
+    samples: int
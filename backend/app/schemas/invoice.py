@@ -2,8 +2,8 @@
 
 from pydantic import BaseModel, Field, field_validator
 from uuid import UUID
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional
 from decimal import Decimal
 
 
@@ -83,6 +83,29 @@ class InvoiceList(BaseModel):
 
     items: list[Invoice]
     total: int
-    page: int
+    page: Optional[int] = Field(None, description="Page number (not set for 'after' cursor pages)")
     per_page: int
-    total_pages: int
+    total_pages: Optional[int] = Field(None, description="Number of pages (not set for 'after' cursor pages)")
+
+
+class BillingRunRequest(BaseModel):
+    """Schema for a batch billing run over delivered deliveries."""
+
+    start: date = Field(..., description="First delivery day (inclusive)")
+    end: date = Field(..., description="Last delivery day (inclusive)")
+    due_in_days: int = Field(default=14, ge=0, le=365, description="Payment term in days")
+    tax_rate: Decimal = Field(default=Decimal('19.0'), ge=0, le=100, description="Tax rate percentage")
+    dry_run: bool = Field(default=False, description="Preview without creating invoices")
+
+
+class BillingRunResult(BaseModel):
+    """Schema for the outcome of a billing run."""
+
+    dry_run: bool
+    invoices_created: int
+    invoice_numbers: List[str]
+    skipped_already_billed: int
+    skipped_unpriced: List[str]
+    subtotal: Decimal
+    tax_amount: Decimal
+    total_amount: Decimal
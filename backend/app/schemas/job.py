@@ -0,0 +1,31 @@
+"""Background job schemas for response validation."""
+
+from pydantic import BaseModel, ConfigDict
+from uuid import UUID
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class JobRun(BaseModel):
+    """Schema for a recorded background job run."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    job_name: str
+    status: str
+    started_at: datetime
+    finished_at: datetime
+    duration_ms: int
+    stats: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class JobRunList(BaseModel):
+    """Schema for paginated job run list response."""
+
+    items: list[JobRun]
+    total: int
+    page: int
+    per_page: int
+    total_pages: int
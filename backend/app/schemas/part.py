@@ -67,6 +67,21 @@ class PartList(BaseModel):
     total_pages: int
 
 
+class FacetValue(BaseModel):
+    """Number of parts with one value of a facet."""
+
+    value: Optional[str]
+    count: int
+
+
+class PartFacets(BaseModel):
+    """Schema for facet counts of a (filtered) parts query."""
+
+    total: int
+    category: list[FacetValue]
+    stock_status: list[FacetValue]
+
+
 class StockAdjustment(BaseModel):
     """Schema for adjusting stock levels."""
 
@@ -0,0 +1,52 @@
+"""Report schemas for response validation."""
+
+from pydantic import BaseModel
+from datetime import date
+from typing import Optional
+from uuid import UUID
+from decimal import Decimal
+
+
+class RevenuePeriod(BaseModel):
+    """Revenue totals for one reporting period."""
+
+    period: date
+    status: Optional[str] = None
+    invoice_count: int
+    subtotal: Decimal
+    tax_amount: Decimal
+    discount_amount: Decimal
+    total_amount: Decimal
+
+
+class RevenueReport(BaseModel):
+    """Schema for revenue report response."""
+
+    granularity: str
+    items: list[RevenuePeriod]
+
+
+class AgingBuckets(BaseModel):
+    """Unpaid amounts by days past due date."""
+
+    days_0_30: Decimal
+    days_31_60: Decimal
+    days_61_90: Decimal
+    days_over_90: Decimal
+    total: Decimal
+    invoice_count: int
+
+
+class CustomerAging(AgingBuckets):
+    """Aging buckets for a single customer."""
+
+    customer_id: UUID
+    customer_name: str
+
+
+class AgingReport(BaseModel):
+    """Schema for accounts-receivable aging report response."""
+
+    as_of: date
+    items: list[CustomerAging]
+    totals: AgingBuckets
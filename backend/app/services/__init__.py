@@ -0,0 +1,3 @@
+"""Business logic services package."""
+
+__all__ = []
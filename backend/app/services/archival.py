@@ -0,0 +1,205 @@
+"""Archival of long soft-deleted rows into cold ``*_archive`` tables.
+
+Rows whose ``deleted_at`` is older than ``ARCHIVE_AFTER_DAYS`` are moved
+in batches: one transaction per batch copies them with ``INSERT ... SELECT``
+and removes them from the hot table with ``DELETE``. Tables are processed
+dependents first, and a row is only moved once no remaining hot row
+references it, so foreign keys always hold. Dependent rows without a soft
+delete of their own (build parts, invoice reminders) move with their parent.
+Rows derived from their parent (part specification values) are dropped
+with it instead and recomputed on restore.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import Table, and_, delete, exists, func, insert, null, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import Base, mark_tables_changed
+from app.models.archive import ARCHIVE_TABLES
+from app.models.invoice import Invoice
+from app.models.part import Part
+from app.services import part_facets, part_specs, revenue_rollups
+
+# Soft-deletable tables, referencing tables before the tables they reference
+ARCHIVE_ORDER = ["invoices", "deliveries", "builds", "parts", "customers", "suppliers"]
+
+# Rows archived and restored together with their parent: (table, parent FK column)
+DEPENDENTS: Dict[str, List[Tuple[str, str]]] = {
+    "invoices": [("invoice_reminders", "invoice_id")],
+    "builds": [("build_parts", "build_id")],
+}
+
+# Rows computed from their parent: deleted with it instead of archived and
+# recomputed on restore: (table, parent FK column)
+DERIVED: Dict[str, List[Tuple[str, str]]] = {
+    "parts": [("part_spec_values", "part_id")],
+}
+
+
+class ArchiveConflict(Exception):
+    """An archived row cannot be restored into the hot table."""
+
+
+def _hot(name: str) -> Table:
+    return Base.metadata.tables[name]
+
+
+def _unreferenced(table: Table) -> List[Any]:
+    """Conditions that no hot row (other than moving dependents) references ``table``."""
+    moving = {child for child, _ in DEPENDENTS.get(table.name, [])}
+    moving.update(child for child, _ in DERIVED.get(table.name, []))
+    conditions = []
+    for other in Base.metadata.sorted_tables:
+        if other.name in moving:
+            continue
+        for fk in other.foreign_keys:
+            if fk.column.table is table:
+                conditions.append(~exists().where(fk.parent == fk.column))
+    return conditions
+
+
+def _copy(db: Session, source: Table, target: Table, where, overrides=None) -> int:
+    """``INSERT INTO target SELECT ... FROM source WHERE ...``; returns the row count."""
+    overrides = overrides or {}
+    names = [column.name for column in target.columns if column.name in source.c]
+    columns = [overrides.get(name, source.c[name]) for name in names]
+    result = db.execute(insert(target).from_select(names, select(*columns).where(where)))
+    return result.rowcount
+
+
+def archive_table(db: Session, name: str, cutoff: datetime, batch_size: int) -> Dict[str, int]:
+    """Move soft-deleted rows of one table (and their dependents) to the archive.
+
+    Args:
+        db: Database session (committed once per batch)
+        name: Hot table name, one of ARCHIVE_ORDER
+        cutoff: Only rows deleted before this moment are moved
+        batch_size: Rows per transaction
+
+    Returns:
+        Number of rows moved per table
+    """
+    table = _hot(name)
+    dependents = DEPENDENTS.get(name, [])
+    candidates = (
+        select(table.c.id)
+        .where(
+            table.c.deleted_at.isnot(None),
+            table.c.deleted_at < cutoff,
+            *_unreferenced(table),
+        )
+        .order_by(table.c.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+    moved = {name: 0, **{child: 0 for child, _ in dependents}}
+    while True:
+        ids = db.execute(candidates).scalars().all()
+        if not ids:
+            return moved
+        for child_name, fk_column in dependents:
+            child = _hot(child_name)
+            moved[child_name] += _copy(
+                db, child, ARCHIVE_TABLES[child_name], child.c[fk_column].in_(ids)
+            )
+            db.execute(delete(child).where(child.c[fk_column].in_(ids)))
+        for child_name, fk_column in DERIVED.get(name, []):
+            child = _hot(child_name)
+            db.execute(delete(child).where(child.c[fk_column].in_(ids)))
+        moved[name] += _copy(db, table, ARCHIVE_TABLES[name], table.c.id.in_(ids))
+        db.execute(delete(table).where(table.c.id.in_(ids)))
+        mark_tables_changed(db, name, *(child for child, _ in dependents))
+        db.commit()
+
+
+def restore(db: Session, name: str, record_id: UUID) -> Optional[Dict[str, int]]:
+    """Bring an archived row (and its archived dependents) back as a live record.
+
+    Args:
+        db: Database session (committed by this function)
+        name: Hot table name, one of ARCHIVE_ORDER
+        record_id: ID of the archived row
+
+    Returns:
+        Number of rows restored per table, or None if the row is not archived
+
+    Raises:
+        ArchiveConflict: A referenced row is not in the hot table, or a
+            unique value (number, SKU) has been reused in the meantime
+    """
+    table = _hot(name)
+    archive = ARCHIVE_TABLES[name]
+    row = db.execute(select(archive).where(archive.c.id == record_id)).first()
+    if row is None:
+        return None
+
+    for fk in table.foreign_keys:
+        value = row._mapping[fk.parent.name]
+        if value is not None and db.execute(
+            select(fk.column).where(fk.column == value)
+        ).first() is None:
+            raise ArchiveConflict(
+                f"Referenced {fk.column.table.name} record {value} is archived; restore it first"
+            )
+
+    try:
+        restored = {name: _copy(
+            db, archive, table, archive.c.id == record_id,
+            overrides={"deleted_at": null(), "updated_at": func.now()},
+        )}
+        db.execute(delete(archive).where(archive.c.id == record_id))
+
+        for child_name, fk_column in DEPENDENTS.get(name, []):
+            child = _hot(child_name)
+            child_archive = ARCHIVE_TABLES[child_name]
+            # Dependents whose other parents are gone stay archived
+            condition = and_(
+                child_archive.c[fk_column] == record_id,
+                *(
+                    exists().where(fk.column == child_archive.c[fk.parent.name])
+                    for fk in child.foreign_keys
+                    if fk.parent.name != fk_column
+                ),
+            )
+            restored[child_name] = _copy(db, child_archive, child, condition)
+            db.execute(delete(child_archive).where(condition))
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise ArchiveConflict(
+            f"{name} record {record_id} conflicts with an existing record"
+        )
+
+    if name == "invoices":
+        invoice = db.get(Invoice, record_id)
+        revenue_rollups.record_change(db, None, revenue_rollups.contribution_of(invoice))
+    elif name == "parts":
+        part = db.get(Part, record_id)
+        part_specs.sync(db, part, created=True)
+        part_facets.record_change(db, None, part_facets.contribution_of(part))
+
+    mark_tables_changed(db, name, *(child for child, _ in DEPENDENTS.get(name, [])))
+    db.commit()
+    return restored
+
+
+def run(db: Session) -> Dict[str, Any]:
+    """Scheduled job entry point: archive every table in dependency order.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Run counters recorded in job_runs
+    """
+    cutoff = datetime.utcnow() - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+    totals: Dict[str, int] = {}
+    for name in ARCHIVE_ORDER:
+        for table_name, count in archive_table(db, name, cutoff, settings.ARCHIVE_BATCH_SIZE).items():
+            totals[f"{table_name}_archived"] = totals.get(f"{table_name}_archived", 0) + count
+    return totals
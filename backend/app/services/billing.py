@@ -0,0 +1,170 @@
+"""Invoice numbering and the batch month-end billing run."""
+
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List
+from sqlalchemy import exists, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.db import mark_tables_changed, replicas
+from app.models.build import Build
+from app.models.delivery import Delivery
+from app.models.invoice import Invoice
+from app.services import revenue_rollups
+
+INVOICE_PREFIX = "INV-"
+
+# Arbitrary constant identifying the invoice-number advisory lock
+INVOICE_NUMBER_LOCK_KEY = 4_720_001
+
+CENT = Decimal("0.01")
+
+
+def lock_invoicing(db: Session) -> None:
+    """Serialize invoice creation until the caller's transaction ends.
+
+    Takes a transaction-scoped advisory lock on PostgreSQL (re-entrant
+    within a transaction). On SQLite the session moves to the writer, whose
+    transaction holds the database write lock.
+
+    Args:
+        db: Database session
+    """
+    replicas.use_primary(db)
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(INVOICE_NUMBER_LOCK_KEY)))
+
+
+def allocate_invoice_numbers(db: Session, count: int) -> List[str]:
+    """Reserve ``count`` consecutive invoice numbers.
+
+    Allocation holds ``lock_invoicing`` until the caller commits, so
+    concurrent requests cannot hand out the same numbers.
+
+    Args:
+        db: Database session
+        count: Number of invoice numbers needed
+
+    Returns:
+        Invoice numbers in ascending order
+    """
+    lock_invoicing(db)
+
+    # Numbers are zero-padded, so the string maximum is the numeric maximum
+    last_number = db.query(func.max(Invoice.invoice_number)).filter(
+        Invoice.invoice_number.like(f"{INVOICE_PREFIX}%")
+    ).scalar()
+    try:
+        last = int(last_number[len(INVOICE_PREFIX):]) if last_number else 0
+    except ValueError:
+        last = 0
+
+    return [f"{INVOICE_PREFIX}{last + offset:06d}" for offset in range(1, count + 1)]
+
+
+def run_billing(
+    db: Session,
+    start: date,
+    end: date,
+    due_in_days: int,
+    tax_rate: Decimal,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Invoice every delivered, not yet invoiced delivery in a date range.
+
+    Each delivery is priced as its build's ``base_price`` plus the
+    delivery's ``shipping_cost``. All invoices are inserted with a single
+    multi-row INSERT in one transaction. The run holds ``lock_invoicing``
+    from before it selects the deliveries, so concurrent runs (or invoice
+    creation) cannot bill the same delivery twice.
+
+    Args:
+        db: Database session (committed unless dry_run)
+        start: First delivery day (inclusive)
+        end: Last delivery day (inclusive)
+        due_in_days: Payment term for the new invoices
+        tax_rate: VAT percentage applied to every invoice
+        dry_run: Compute the result without writing anything
+
+    Returns:
+        Summary with created invoices, skipped deliveries and totals
+    """
+    lock_invoicing(db)
+
+    delivered_on = func.coalesce(Delivery.delivery_date, Delivery.updated_at)
+    already_billed = exists().where(
+        Invoice.delivery_id == Delivery.id,
+        Invoice.deleted_at.is_(None),
+    )
+    in_range = [
+        Delivery.deleted_at.is_(None),
+        Delivery.status == "delivered",
+        delivered_on >= datetime.combine(start, time.min),
+        delivered_on <= datetime.combine(end, time.max),
+    ]
+
+    rows = db.execute(
+        select(
+            Delivery.id,
+            Delivery.delivery_number,
+            Delivery.customer_id,
+            Delivery.shipping_cost,
+            Build.base_price,
+        )
+        .outerjoin(Build, Build.id == Delivery.build_id)
+        .where(*in_range, ~already_billed)
+        .order_by(delivered_on, Delivery.delivery_number)
+    ).all()
+    already_billed_count = db.query(func.count(Delivery.id)).filter(
+        *in_range, already_billed
+    ).scalar()
+
+    billable = []
+    unpriced = []
+    for row in rows:
+        subtotal = (row.base_price or Decimal("0")) + (row.shipping_cost or Decimal("0"))
+        if subtotal <= 0:
+            unpriced.append(row.delivery_number)
+        else:
+            billable.append((row, subtotal.quantize(CENT)))
+
+    now = datetime.now(timezone.utc)
+    due_date = now + timedelta(days=due_in_days)
+    numbers = allocate_invoice_numbers(db, len(billable)) if billable else []
+
+    invoices = []
+    for (row, subtotal), number in zip(billable, numbers):
+        tax_amount = (subtotal * tax_rate / Decimal("100")).quantize(CENT)
+        invoices.append({
+            "invoice_number": number,
+            "customer_id": row.customer_id,
+            "delivery_id": row.id,
+            "invoice_date": now,
+            "due_date": due_date,
+            "subtotal": subtotal,
+            "tax_rate": tax_rate,
+            "tax_amount": tax_amount,
+            "discount_amount": Decimal("0"),
+            "total_amount": subtotal + tax_amount,
+            "status": "draft",
+            "notes": f"Delivery {row.delivery_number}",
+        })
+
+    if invoices and not dry_run:
+        db.execute(insert(Invoice), invoices)
+        revenue_rollups.refresh_periods(db, {now.date()})
+        mark_tables_changed(db, "invoices")
+        db.commit()
+    else:
+        db.rollback()
+
+    return {
+        "dry_run": dry_run,
+        "invoices_created": 0 if dry_run else len(invoices),
+        "invoice_numbers": [invoice["invoice_number"] for invoice in invoices],
+        "skipped_already_billed": already_billed_count,
+        "skipped_unpriced": unpriced,
+        "subtotal": sum((i["subtotal"] for i in invoices), Decimal("0")),
+        "tax_amount": sum((i["tax_amount"] for i in invoices), Decimal("0")),
+        "total_amount": sum((i["total_amount"] for i in invoices), Decimal("0")),
+    }
@@ -0,0 +1,119 @@
+"""Dashboard aggregates computed with grouped SQL and cached per section."""
+
+from typing import Any, Callable, Dict, Set
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.db import cache_version, on_tables_changed
+from app.db.replicas import primary_reads
+from app.models.delivery import Delivery
+from app.models.invoice import Invoice
+from app.models.part import Part
+
+CACHE_PREFIX = "dashboard:"
+
+OPEN_DELIVERY_STATUSES = ("pending", "in_transit")
+OUTSTANDING_INVOICE_STATUSES = ("sent", "overdue")
+
+
+def _parts_section(db: Session) -> Dict[str, Any]:
+    """Count stock levels and inventory value in one pass over parts."""
+    row = db.query(
+        func.count(Part.id).label("total"),
+        func.count(Part.id).filter(Part.is_low_stock).label("low_stock"),
+        func.count(Part.id).filter(
+            Part.stock_status == "out_of_stock"
+        ).label("out_of_stock"),
+        func.coalesce(
+            func.sum(Part.current_stock * Part.unit_price), 0
+        ).label("inventory_value"),
+    ).filter(Part.deleted_at.is_(None)).one()
+    return dict(row._mapping)
+
+
+def _deliveries_section(db: Session) -> Dict[str, Any]:
+    """Count deliveries by status in one pass."""
+    is_open = Delivery.status.in_(OPEN_DELIVERY_STATUSES)
+    row = db.query(
+        func.count(Delivery.id).label("total"),
+        func.count(Delivery.id).filter(is_open).label("open"),
+        func.count(Delivery.id).filter(Delivery.status == "pending").label("pending"),
+        func.count(Delivery.id).filter(
+            Delivery.status == "in_transit"
+        ).label("in_transit"),
+        func.count(Delivery.id).filter(
+            and_(is_open, Delivery.expected_delivery_date < func.now())
+        ).label("late"),
+    ).filter(Delivery.deleted_at.is_(None)).one()
+    return dict(row._mapping)
+
+
+def _invoices_section(db: Session) -> Dict[str, Any]:
+    """Count invoices and sum revenue by payment state in one pass."""
+    is_outstanding = Invoice.status.in_(OUTSTANDING_INVOICE_STATUSES)
+    is_overdue = or_(
+        Invoice.status == "overdue",
+        and_(Invoice.status == "sent", Invoice.due_date < func.now()),
+    )
+    row = db.query(
+        func.count(Invoice.id).label("total"),
+        func.count(Invoice.id).filter(Invoice.status == "draft").label("draft"),
+        func.count(Invoice.id).filter(is_outstanding).label("outstanding"),
+        func.count(Invoice.id).filter(is_overdue).label("overdue"),
+        func.coalesce(
+            func.sum(Invoice.total_amount).filter(is_outstanding), 0
+        ).label("outstanding_revenue"),
+        func.coalesce(
+            func.sum(Invoice.total_amount).filter(is_overdue), 0
+        ).label("overdue_revenue"),
+        func.coalesce(
+            func.sum(Invoice.total_amount).filter(Invoice.status == "paid"), 0
+        ).label("paid_revenue"),
+    ).filter(Invoice.deleted_at.is_(None)).one()
+    return dict(row._mapping)
+
+
+# Section name (identical to its source table name) -> loader
+SECTIONS: Dict[str, Callable[[Session], Dict[str, Any]]] = {
+    "parts": _parts_section,
+    "deliveries": _deliveries_section,
+    "invoices": _invoices_section,
+}
+
+
+def _load(db: Session, loader: Callable[[Session], Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute a section for the shared cache from the primary."""
+    with primary_reads(db):
+        return loader(db)
+
+
+def get_summary(db: Session) -> Dict[str, Dict[str, Any]]:
+    """Return all dashboard sections, recomputing only stale ones.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Mapping of section name to its aggregate values
+    """
+    return {
+        name: cache.get_or_set(
+            CACHE_PREFIX + name,
+            lambda loader=loader: _load(db, loader),
+            settings.DASHBOARD_CACHE_TTL_SECONDS,
+            version=cache_version(db),
+        )
+        for name, loader in SECTIONS.items()
+    }
+
+
+def _invalidate_sections(tables: Set[str]) -> None:
+    """Drop cached sections whose source table was written to."""
+    for name in SECTIONS:
+        if name in tables:
+            cache.invalidate(CACHE_PREFIX + name)
+
+
+on_tables_changed(_invalidate_sections)
@@ -0,0 +1,289 @@
+"""Invoice and delivery-note PDF rendering.
+
+Rendering runs in a process pool so it never competes with request
+handling for the GIL. Each worker compiles the document templates once at
+start-up. Rendered files are stored in a content-addressed cache keyed by
+the template version and the full document payload, so a document is only
+rendered again when something printed on it (including customer or
+company details) changed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.core.config import settings
+from app.models.delivery import Delivery
+from app.models.invoice import Invoice
+from app.services.pdf import render_text_pdf
+
+# Bump whenever a template changes to invalidate cached documents
+TEMPLATE_VERSION = "1"
+
+TEMPLATE_SOURCES: Dict[str, str] = {
+    "invoice": """\
+# $company_name
+Invoice $invoice_number
+
+Invoice date: $invoice_date
+Due date:     $due_date
+Delivery:     $delivery_number
+
+# Bill to
+$billing_address
+
+# Amounts (EUR)
+Subtotal:             $subtotal
+Discount:             $discount_amount
+VAT ($tax_rate %):    $tax_amount
+# Total:              $total_amount
+
+$notes
+$terms_and_conditions""",
+    "delivery_note": """\
+# $company_name
+Delivery note $delivery_number
+
+Delivery date:          $delivery_date
+Expected delivery date: $expected_delivery_date
+Carrier:                $carrier
+Tracking number:        $tracking_number
+
+# Ship to
+$shipping_address
+
+# Contents
+$build
+
+$notes
+
+Received by: ______________________________   Date: ______________""",
+}
+
+# Compiled templates, populated once per worker process
+_templates: Dict[str, Template] = {}
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _compile_templates() -> None:
+    """Process pool initializer: compile every template once."""
+    _templates.update({kind: Template(source) for kind, source in TEMPLATE_SOURCES.items()})
+
+
+def _render(kind: str, payload: Dict[str, str]) -> bytes:
+    """Render one document; runs inside a pool worker."""
+    if not _templates:
+        _compile_templates()
+    text = _templates[kind].safe_substitute(payload)
+    return render_text_pdf(text.splitlines(), title=payload.get("title", ""))
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Return the shared render pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.DOCUMENT_RENDER_WORKERS,
+                initializer=_compile_templates,
+            )
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the render pool (called on application shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+
+
+def _format_date(value: Optional[datetime]) -> str:
+    return value.strftime("%d.%m.%Y") if value else "-"
+
+
+def _address(*parts: Optional[str]) -> str:
+    return "\n".join(part for part in parts if part) or "-"
+
+
+def invoice_payload(invoice: Invoice) -> Dict[str, Any]:
+    """Extract everything the invoice template needs from the ORM object."""
+    customer = invoice.customer
+    return {
+        "kind": "invoice",
+        "id": str(invoice.id),
+        "updated_at": invoice.updated_at.isoformat(),
+        "filename": f"{invoice.invoice_number}.pdf",
+        "title": f"Invoice {invoice.invoice_number}",
+        "company_name": settings.COMPANY_NAME,
+        "invoice_number": invoice.invoice_number,
+        "invoice_date": _format_date(invoice.invoice_date),
+        "due_date": _format_date(invoice.due_date),
+        "delivery_number": invoice.delivery.delivery_number if invoice.delivery else "-",
+        "billing_address": _address(
+            customer.company_name or customer.name,
+            invoice.billing_address_line1 or customer.address_line1,
+            invoice.billing_address_line2 or customer.address_line2,
+            " ".join(filter(None, [
+                invoice.billing_postal_code or customer.postal_code,
+                invoice.billing_city or customer.city,
+            ])),
+            invoice.billing_country or customer.country,
+        ),
+        "subtotal": f"{invoice.subtotal:.2f}",
+        "discount_amount": f"{invoice.discount_amount or 0:.2f}",
+        "tax_rate": f"{invoice.tax_rate:.2f}",
+        "tax_amount": f"{invoice.tax_amount:.2f}",
+        "total_amount": f"{invoice.total_amount:.2f}",
+        "notes": invoice.notes or "",
+        "terms_and_conditions": invoice.terms_and_conditions or "",
+    }
+
+
+def delivery_payload(delivery: Delivery) -> Dict[str, Any]:
+    """Extract everything the delivery note template needs from the ORM object."""
+    customer = delivery.customer
+    build = delivery.build
+    return {
+        "kind": "delivery_note",
+        "id": str(delivery.id),
+        "updated_at": delivery.updated_at.isoformat(),
+        "filename": f"{delivery.delivery_number}.pdf",
+        "title": f"Delivery note {delivery.delivery_number}",
+        "company_name": settings.COMPANY_NAME,
+        "delivery_number": delivery.delivery_number,
+        "delivery_date": _format_date(delivery.delivery_date),
+        "expected_delivery_date": _format_date(delivery.expected_delivery_date),
+        "carrier": delivery.carrier or "-",
+        "tracking_number": delivery.tracking_number or "-",
+        "shipping_address": _address(
+            customer.company_name or customer.name,
+            delivery.shipping_address_line1 or customer.address_line1,
+            delivery.shipping_address_line2 or customer.address_line2,
+            " ".join(filter(None, [
+                delivery.shipping_postal_code or customer.postal_code,
+                delivery.shipping_city or customer.city,
+            ])),
+            delivery.shipping_country or customer.country,
+        ),
+        "build": f"1 x {build.name} ({build.model_number or '-'})" if build else "-",
+        "notes": delivery.notes or "",
+    }
+
+
+def _cache_path(payload: Dict[str, Any]) -> Path:
+    """Content-addressed cache location for a document payload."""
+    content = json.dumps(payload, sort_keys=True, default=str)
+    key = hashlib.sha256(f"{TEMPLATE_VERSION}|{content}".encode()).hexdigest()
+    return Path(settings.DOCUMENT_CACHE_DIR) / key[:2] / f"{key}.pdf"
+
+
+def _store(path: Path, data: bytes) -> None:
+    """Write a cache file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def get_document(payload: Dict[str, Any]) -> bytes:
+    """Return the rendered PDF for a payload, rendering it if not cached.
+
+    Args:
+        payload: Output of ``invoice_payload`` or ``delivery_payload``
+
+    Returns:
+        PDF file contents
+    """
+    path = _cache_path(payload)
+    if path.exists():
+        return path.read_bytes()
+    data = get_pool().submit(_render, payload["kind"], payload).result()
+    _store(path, data)
+    return data
+
+
+class _ZipStream:
+    """Write-only file object that hands out what was written so far.
+
+    It has ``tell`` but no ``seek``, so ``zipfile`` writes a streamable
+    archive (data descriptors instead of rewriting local headers).
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(payloads: List[Dict[str, Any]]) -> Iterator[bytes]:
+    """Render many documents in parallel and stream them as a ZIP archive.
+
+    Cached documents are read from disk; the rest are rendered across the
+    pool, at most a few per worker ahead of the document being written. ZIP
+    data is yielded after every document so the response starts immediately
+    and memory stays bounded.
+
+    Args:
+        payloads: Document payloads to include
+
+    Yields:
+        Chunks of the ZIP file
+    """
+    pool = get_pool()
+    # Renders queued ahead of the archive writer; keeps the pool busy
+    # without holding every rendered document in memory at once
+    window = 4 * settings.DOCUMENT_RENDER_WORKERS
+    remaining = iter(payloads)
+    pending: deque = deque()
+
+    def submit_next() -> None:
+        payload = next(remaining, None)
+        if payload is None:
+            return
+        path = _cache_path(payload)
+        future = None if path.exists() else pool.submit(_render, payload["kind"], payload)
+        pending.append((payload, path, future))
+
+    for _ in range(window):
+        submit_next()
+
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        while pending:
+            payload, path, future = pending.popleft()
+            submit_next()
+            if future is None:
+                data = path.read_bytes()
+            else:
+                data = future.result()
+                _store(path, data)
+            archive.writestr(payload["filename"], data)
+            yield stream.drain()
+    yield stream.drain()
@@ -0,0 +1,155 @@
+"""Overdue-invoice sweeper and dunning reminders.
+
+Invoices are processed in keyset-paginated batches (``WHERE id > :last``)
+and changed with set-based UPDATEs, one transaction per batch, so the job
+never holds long locks on ``invoices``.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from sqlalchemy import func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import mark_tables_changed
+from app.db.types import uuid7
+from app.models.customer import Customer
+from app.models.invoice import Invoice
+from app.models.invoice_reminder import InvoiceReminder
+from app.models.outbound_email import OutboundEmail
+from app.services import revenue_rollups
+from app.services.notifications import reminder_email_values
+
+
+def _keyset_batches(db: Session, query, batch_size: int):
+    """Yield successive batches of rows ordered by invoice id."""
+    last_id = None
+    while True:
+        batch_query = query
+        if last_id is not None:
+            batch_query = batch_query.where(Invoice.id > last_id)
+        rows = db.execute(batch_query.order_by(Invoice.id).limit(batch_size)).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def mark_overdue(db: Session, batch_size: int) -> int:
+    """Flip sent invoices past their due date to ``overdue``.
+
+    Args:
+        db: Database session (committed once per batch)
+        batch_size: Invoices per batch
+
+    Returns:
+        Number of invoices marked overdue
+    """
+    query = select(Invoice.id, Invoice.invoice_date).where(
+        Invoice.deleted_at.is_(None),
+        Invoice.status == "sent",
+        Invoice.due_date < func.now(),
+    )
+    marked = 0
+    for rows in _keyset_batches(db, query, batch_size):
+        ids = [row.id for row in rows]
+        result = db.execute(
+            update(Invoice)
+            .where(Invoice.id.in_(ids), Invoice.status == "sent")
+            .values(status="overdue", updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        revenue_rollups.refresh_periods(db, {row.invoice_date.date() for row in rows})
+        mark_tables_changed(db, "invoices")
+        db.commit()
+        marked += result.rowcount
+    return marked
+
+
+def queue_reminders(db: Session, batch_size: int) -> int:
+    """Advance the dunning level of overdue invoices and queue reminders.
+
+    An invoice gets its next reminder once ``DUNNING_REMINDER_INTERVAL_DAYS``
+    have passed since the previous one, up to ``DUNNING_MAX_REMINDERS``.
+    Reminders for customers with an email address are put on the outbox.
+
+    Args:
+        db: Database session (committed once per batch)
+        batch_size: Invoices per batch
+
+    Returns:
+        Number of reminders queued
+    """
+    now = datetime.now(timezone.utc)
+    threshold = now - timedelta(days=settings.DUNNING_REMINDER_INTERVAL_DAYS)
+    reminder_count = func.coalesce(Invoice.reminder_count, 0)
+    query = select(
+        Invoice.id,
+        Invoice.invoice_number,
+        Invoice.total_amount,
+        Invoice.due_date,
+        reminder_count.label("reminder_count"),
+        Customer.email,
+    ).join(Customer, Customer.id == Invoice.customer_id).where(
+        Invoice.deleted_at.is_(None),
+        Invoice.status == "overdue",
+        reminder_count < settings.DUNNING_MAX_REMINDERS,
+        or_(
+            Invoice.last_reminder_date.is_(None),
+            Invoice.last_reminder_date < threshold,
+        ),
+    )
+    queued = 0
+    for rows in _keyset_batches(db, query, batch_size):
+        ids = [row.id for row in rows]
+        db.execute(
+            update(Invoice)
+            .where(Invoice.id.in_(ids))
+            .values(
+                reminder_sent=True,
+                reminder_count=reminder_count + 1,
+                last_reminder_date=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        reminders: List[Dict[str, Any]] = []
+        emails: List[Dict[str, Any]] = []
+        for row in rows:
+            reminder = {
+                "id": uuid7(),
+                "invoice_id": row.id,
+                "level": int(row.reminder_count) + 1,
+            }
+            reminders.append(reminder)
+            if row.email:
+                emails.append(reminder_email_values(
+                    reminder["id"],
+                    row.email,
+                    row.invoice_number,
+                    reminder["level"],
+                    row.total_amount,
+                    row.due_date,
+                ))
+        db.execute(insert(InvoiceReminder), reminders)
+        if emails:
+            db.execute(insert(OutboundEmail), emails)
+        mark_tables_changed(db, "invoices", "invoice_reminders")
+        db.commit()
+        queued += len(reminders)
+    return queued
+
+
+def run(db: Session) -> Dict[str, Any]:
+    """Scheduled job entry point: sweep overdue invoices, then dun them.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Run counters recorded in job_runs
+    """
+    batch_size = settings.DUNNING_BATCH_SIZE
+    return {
+        "invoices_marked_overdue": mark_overdue(db, batch_size),
+        "reminders_queued": queue_reminders(db, batch_size),
+    }
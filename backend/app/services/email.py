@@ -0,0 +1,201 @@
+"""Outbound email queue and SMTP delivery worker.
+
+Request handlers only insert rows into ``outbound_emails`` (inside their
+own transaction) and return immediately. The ``email_outbox`` job drains
+the queue in batches, delivering each batch over a single authenticated
+SMTP connection. Failed messages are retried with exponential backoff and
+moved to ``dead`` after ``EMAIL_MAX_ATTEMPTS``.
+
+For local testing run a debugging SMTP server, e.g.
+``python -m aiosmtpd -n -l localhost:1025``, and set ``SMTP_HOST=localhost``,
+``SMTP_PORT=1025``, ``SMTP_USE_TLS=False`` and an empty ``SMTP_PASSWORD``.
+"""
+
+import logging
+import smtplib
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.invoice_reminder import InvoiceReminder
+from app.models.outbound_email import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_email(
+    db: Session,
+    to_address: str,
+    subject: str,
+    body: str,
+    kind: Optional[str] = None,
+    reference_id: Optional[UUID] = None,
+) -> OutboundEmail:
+    """Queue an email for delivery; committed with the caller's transaction.
+
+    Args:
+        db: Database session
+        to_address: Recipient address
+        subject: Subject line
+        body: Plain-text body
+        kind: What the email is about (invoice, delivery_note, invoice_reminder)
+        reference_id: ID of the record the email is about
+
+    Returns:
+        Queued email
+    """
+    email = OutboundEmail(
+        to_address=to_address,
+        subject=subject,
+        body=body,
+        kind=kind,
+        reference_id=reference_id,
+    )
+    db.add(email)
+    return email
+
+
+def _build_message(email: OutboundEmail) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = formataddr((settings.SMTP_FROM_NAME, settings.SMTP_FROM))
+    message["To"] = email.to_address
+    message["Subject"] = email.subject
+    message.set_content(email.body)
+    return message
+
+
+def _connect() -> smtplib.SMTP:
+    """Open and authenticate one SMTP connection."""
+    smtp = smtplib.SMTP(
+        settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT_SECONDS
+    )
+    if settings.SMTP_USE_TLS:
+        smtp.starttls()
+    if settings.SMTP_PASSWORD:
+        smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+    return smtp
+
+
+def _disconnect(smtp: smtplib.SMTP) -> None:
+    """Say QUIT if the connection still works; always close the socket."""
+    try:
+        smtp.quit()
+    except OSError:
+        pass
+    finally:
+        smtp.close()
+
+
+def _record_failure(email: OutboundEmail, error: str, now: datetime) -> str:
+    """Schedule a retry with exponential backoff, or dead-letter the email.
+
+    Returns:
+        The stats counter to increment ("failed" or "dead")
+    """
+    email.attempts += 1
+    email.last_error = error
+    if email.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+        email.status = "dead"
+        logger.error("Email %s dead-lettered: %s", email.id, error)
+        return "dead"
+    delay = settings.EMAIL_RETRY_BASE_SECONDS * 2 ** (email.attempts - 1)
+    email.next_attempt_at = now + timedelta(seconds=delay)
+    return "failed"
+
+
+def send_batch(db: Session, batch_size: int) -> Dict[str, int]:
+    """Deliver up to ``batch_size`` due emails over one SMTP connection.
+
+    Args:
+        db: Database session (committed by this function)
+        batch_size: Maximum number of emails to send
+
+    Returns:
+        Counters for sent, failed and dead-lettered emails
+    """
+    now = datetime.now(timezone.utc)
+    batch: List[OutboundEmail] = (
+        db.query(OutboundEmail)
+        .filter(
+            OutboundEmail.status == "pending",
+            OutboundEmail.next_attempt_at <= func.now(),
+        )
+        .order_by(OutboundEmail.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    stats = {"sent": 0, "failed": 0, "dead": 0}
+    if not batch:
+        return stats
+
+    try:
+        smtp = _connect()
+    except (OSError, smtplib.SMTPException) as exc:
+        for email in batch:
+            stats[_record_failure(email, f"connect: {exc!r}", now)] += 1
+    else:
+        try:
+            for email in batch:
+                try:
+                    smtp.send_message(_build_message(email))
+                except smtplib.SMTPServerDisconnected as exc:
+                    # Remaining emails stay pending for the next batch
+                    stats[_record_failure(email, repr(exc), now)] += 1
+                    break
+                except smtplib.SMTPException as exc:
+                    stats[_record_failure(email, repr(exc), now)] += 1
+                except OSError as exc:
+                    # Socket error or timeout: the connection is as good as gone
+                    stats[_record_failure(email, repr(exc), now)] += 1
+                    break
+                else:
+                    email.status = "sent"
+                    email.attempts += 1
+                    email.sent_at = now
+                    stats["sent"] += 1
+        finally:
+            _disconnect(smtp)
+
+    reminder_ids = [
+        email.reference_id
+        for email in batch
+        if email.status == "sent" and email.kind == "invoice_reminder"
+    ]
+    if reminder_ids:
+        db.execute(
+            update(InvoiceReminder)
+            .where(InvoiceReminder.id.in_(reminder_ids))
+            .values(sent_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+    db.commit()
+    return stats
+
+
+def run(db: Session) -> Dict[str, Any]:
+    """Scheduled job entry point: drain the outbox batch by batch.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Run counters recorded in job_runs
+    """
+    totals = {"sent": 0, "failed": 0, "dead": 0, "batches": 0}
+    while True:
+        stats = send_batch(db, settings.EMAIL_BATCH_SIZE)
+        if not any(stats.values()):
+            return totals
+        totals["batches"] += 1
+        for key, value in stats.items():
+            totals[key] += value
+        if stats["sent"] == 0:
+            # Server is failing; leave the rest for the next run
+            return totals
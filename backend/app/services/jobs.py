@@ -0,0 +1,16 @@
+"""Registration of periodic background jobs."""
+
+from app.core.config import settings
+from app.services import archival, dunning, email
+from app.services.scheduler import Scheduler
+
+
+def register_jobs(scheduler: Scheduler) -> None:
+    """Add all periodic jobs to ``scheduler``.
+
+    Args:
+        scheduler: Scheduler to register jobs with
+    """
+    scheduler.add_job("invoice_dunning", dunning.run, settings.DUNNING_INTERVAL_SECONDS)
+    scheduler.add_job("email_outbox", email.run, settings.EMAIL_QUEUE_INTERVAL_SECONDS)
+    scheduler.add_job("soft_delete_archival", archival.run, settings.ARCHIVE_INTERVAL_SECONDS)
@@ -0,0 +1,91 @@
+"""Customer notifications composed from CRM records and queued as email."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from app.models.delivery import Delivery
+from app.models.invoice import Invoice
+from app.services.email import enqueue_email
+
+
+def _format_date(value: Optional[datetime]) -> str:
+    return value.strftime("%d.%m.%Y") if value else "-"
+
+
+def queue_invoice_email(db: Session, invoice: Invoice) -> None:
+    """Queue the invoice notification for the invoice's customer.
+
+    Args:
+        db: Database session
+        invoice: Invoice with its customer loaded (customer must have an email)
+    """
+    body = (
+        f"Dear {invoice.customer.contact_person or invoice.customer.name},\n\n"
+        f"please find below the details of invoice {invoice.invoice_number}.\n\n"
+        f"Invoice date: {_format_date(invoice.invoice_date)}\n"
+        f"Due date:     {_format_date(invoice.due_date)}\n"
+        f"Total:        {invoice.total_amount} EUR\n"
+    )
+    enqueue_email(
+        db,
+        invoice.customer.email,
+        f"Invoice {invoice.invoice_number}",
+        body,
+        kind="invoice",
+        reference_id=invoice.id,
+    )
+
+
+def queue_delivery_note_email(db: Session, delivery: Delivery) -> None:
+    """Queue the delivery note for the delivery's customer.
+
+    Args:
+        db: Database session
+        delivery: Delivery with its customer loaded (customer must have an email)
+    """
+    body = (
+        f"Dear {delivery.customer.contact_person or delivery.customer.name},\n\n"
+        f"your delivery {delivery.delivery_number} is {delivery.status.replace('_', ' ')}.\n\n"
+        f"Expected delivery: {_format_date(delivery.expected_delivery_date)}\n"
+        f"Carrier:           {delivery.carrier or '-'}\n"
+        f"Tracking number:   {delivery.tracking_number or '-'}\n"
+    )
+    enqueue_email(
+        db,
+        delivery.customer.email,
+        f"Delivery note {delivery.delivery_number}",
+        body,
+        kind="delivery_note",
+        reference_id=delivery.id,
+    )
+
+
+def reminder_email_values(
+    reminder_id: UUID,
+    to_address: str,
+    invoice_number: str,
+    level: int,
+    total_amount: Decimal,
+    due_date: datetime,
+) -> Dict[str, Any]:
+    """Build an ``outbound_emails`` row for a payment reminder.
+
+    Returned as plain values so the dunning job can bulk-insert a batch.
+    """
+    body = (
+        f"Dear customer,\n\n"
+        f"according to our records invoice {invoice_number} over "
+        f"{total_amount} EUR, due on {_format_date(due_date)}, is still unpaid.\n"
+        f"This is reminder no. {level}. Please transfer the outstanding amount "
+        f"at your earliest convenience.\n"
+    )
+    return {
+        "to_address": to_address,
+        "subject": f"Payment reminder {level}: invoice {invoice_number}",
+        "body": body,
+        "kind": "invoice_reminder",
+        "reference_id": reminder_id,
+    }
@@ -0,0 +1,195 @@
+"""Facet counts (category, stock status) for the parts catalog.
+
+All facets of a filtered parts query come from one ``GROUP BY category,
+stock_status`` over the matching rows; each facet is summed from those
+groups in Python.
+
+The unfiltered groups are cached per worker and kept current
+incrementally rather than invalidated: every part flush records the
+change of its ``(category, stock_status)`` group, and the difference is
+applied to the cached counts once the transaction commits. Core writes
+that make a part live again (archive restores) call ``record_change``
+themselves. Writes from other worker processes show up when the entry
+expires after ``PART_FACETS_CACHE_TTL_SECONDS``.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.base import NO_VALUE
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.db import cache_version
+from app.db.replicas import primary_reads
+from app.models.part import Part
+
+CACHE_KEY = "part_facets:all"
+FACETS = ("category", "stock_status")
+
+_DELTAS_KEY = "part_facet_deltas"
+_STALE_KEY = "part_facets_stale"
+_STATE_COLUMNS = ("category", "current_stock", "minimum_stock", "deleted_at")
+
+class Group(NamedTuple):
+    """The facet values of one part."""
+
+    category: Optional[str]
+    stock_status: str
+
+
+def contribution_of(part: Part) -> Optional[Group]:
+    """Facet group a part currently counts towards.
+
+    Args:
+        part: Part instance
+
+    Returns:
+        Group, or None for soft-deleted parts
+    """
+    if part.deleted_at is not None:
+        return None
+    return Group(part.category, part.stock_status)
+
+
+def _committed_contribution(part: Part) -> Optional[Group]:
+    """Facet group of a part as last flushed; ``NO_VALUE`` if not loaded.
+
+    ``stock_status`` is computed by the database, so its previous value is
+    derived from the previous stock levels with the same rules.
+    """
+    committed = inspect(part).committed_state
+    values = {name: committed.get(name, getattr(part, name)) for name in _STATE_COLUMNS}
+    if any(value is NO_VALUE for value in values.values()):
+        return NO_VALUE
+    if values["deleted_at"] is not None:
+        return None
+    if values["current_stock"] == 0:
+        status = "out_of_stock"
+    elif values["current_stock"] < values["minimum_stock"]:
+        status = "low_stock"
+    else:
+        status = "in_stock"
+    return Group(values["category"], status)
+
+
+def record_change(db: Session, before: Optional[Group], after: Optional[Group]) -> None:
+    """Queue a part's move between facet groups until the session commits.
+
+    Args:
+        db: Session the change is written on
+        before: Group before the change (None if the part was not live)
+        after: Group after the change (None if the part is no longer live)
+    """
+    if before == after:
+        return
+    deltas = db.info.setdefault(_DELTAS_KEY, Counter())
+    if before is not None:
+        deltas[before] -= 1
+    if after is not None:
+        deltas[after] += 1
+
+
+def grouped_counts(db: Session, conditions: List[Any]) -> Counter:
+    """Count live parts per ``(category, stock_status)`` in one query.
+
+    Args:
+        db: Database session
+        conditions: Filters on ``Part`` (the soft-delete filter is added)
+
+    Returns:
+        Counter of parts per Group
+    """
+    rows = db.execute(
+        select(Part.category, Part.stock_status, func.count())
+        .where(Part.deleted_at.is_(None), *conditions)
+        .group_by(Part.category, Part.stock_status)
+    ).all()
+    return Counter({Group(category, status): count for category, status, count in rows})
+
+
+def _unfiltered_counts(db: Session) -> Counter:
+    """Cached groups of all live parts (shared, do not modify)."""
+
+    def load() -> Counter:
+        with primary_reads(db):
+            return grouped_counts(db, [])
+
+    return cache.get_or_set(
+        CACHE_KEY, load, settings.PART_FACETS_CACHE_TTL_SECONDS, version=cache_version(db)
+    )
+
+
+def get_facets(db: Session, conditions: List[Any]) -> Dict[str, Any]:
+    """Counts per value of every facet for the parts matching ``conditions``.
+
+    Args:
+        db: Database session
+        conditions: Filters on ``Part``; none means the whole (cached) catalog
+
+    Returns:
+        Total and, per facet, values with their counts (largest first)
+    """
+    groups = grouped_counts(db, conditions) if conditions else _unfiltered_counts(db)
+    result: Dict[str, Any] = {"total": sum(groups.values())}
+    for index, facet in enumerate(FACETS):
+        counts: Counter = Counter()
+        for group, count in groups.items():
+            counts[group[index]] += count
+        result[facet] = [
+            {"value": value, "count": count}
+            for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0] or ""))
+        ]
+    return result
+
+
+def categories(db: Session) -> List[str]:
+    """Names of the categories that have live parts, from the cached counts."""
+    return sorted({group.category for group in _unfiltered_counts(db) if group.category})
+
+
+def _add(groups: Counter, deltas: Counter) -> Counter:
+    """New counts with ``deltas`` applied (cached values are never mutated)."""
+    result = Counter(groups)
+    result.update(deltas)
+    return Counter({group: count for group, count in result.items() if count > 0})
+
+
+# After the flush, so new parts have their column defaults; the state as
+# of the previous flush is still available until after_flush_postexec
+@event.listens_for(Session, "after_flush")
+def _collect_part_changes(session, flush_context):
+    for part in session.new:
+        if isinstance(part, Part):
+            record_change(session, None, contribution_of(part))
+    for part in session.dirty:
+        if isinstance(part, Part) and session.is_modified(part):
+            before = _committed_contribution(part)
+            if before is NO_VALUE:
+                session.info[_STALE_KEY] = True
+            else:
+                record_change(session, before, contribution_of(part))
+    for part in session.deleted:
+        if isinstance(part, Part):
+            before = _committed_contribution(part)
+            if before is NO_VALUE:
+                session.info[_STALE_KEY] = True
+            else:
+                record_change(session, before, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_part_changes(session):
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if session.info.pop(_STALE_KEY, False):
+        cache.invalidate(CACHE_KEY)
+    elif deltas:
+        cache.update(CACHE_KEY, lambda groups: _add(groups, deltas))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_part_changes(session):
+    session.info.pop(_DELTAS_KEY, None)
+    session.info.pop(_STALE_KEY, None)
@@ -0,0 +1,212 @@
+"""Parametric search over ``Part.specifications``.
+
+List filters are written as query parameters ``spec.<key><op><value>``,
+e.g. ``spec.material=brass`` or ``spec.length_mm>=100``; ``op`` is one of
+``=``, ``>``, ``>=``, ``<``, ``<=``, and several filters combine with AND.
+Only top-level keys are searchable.
+
+* Equality on PostgreSQL is a JSONB containment test
+  (``specifications @> '{"key": value}'``) served by the GIN index
+  ``ix_parts_specifications``; the value matches as a string and, when it
+  parses as one, as a number or boolean
+* Ranges (and equality on other databases) use ``part_spec_values``, a
+  typed key/value copy of every top-level scalar, indexed on
+  ``(key, num_value)`` and ``(key, text_value)``
+
+``sync`` keeps a part's ``part_spec_values`` rows in step with its
+specifications and must be called whenever they are written; ``rebuild``
+recomputes the whole table in one statement after bulk loads.
+"""
+
+import json
+import math
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+from urllib.parse import unquote_plus
+from uuid import UUID
+
+from sqlalchemy import delete, insert, or_, select, text, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from app.models.part import Part, PartSpecValue
+
+MAX_TEXT_LENGTH = 255
+
+_FILTER_PATTERN = re.compile(r"^spec\.([A-Za-z0-9_\-]{1,100})(>=|<=|>|<|=)(.*)$", re.DOTALL)
+
+_RANGE_OPERATORS = {
+    ">": lambda column, value: column > value,
+    ">=": lambda column, value: column >= value,
+    "<": lambda column, value: column < value,
+    "<=": lambda column, value: column <= value,
+}
+
+# One statement recomputing part_spec_values from parts, per dialect
+REBUILD_SQL = {
+    "postgresql": """
+        INSERT INTO part_spec_values (part_id, key, num_value, text_value)
+        SELECT p.id, e.key,
+               CASE WHEN jsonb_typeof(e.value) = 'number' THEN (e.value #>> '{}')::float8 END,
+               CASE WHEN length(e.value #>> '{}') <= 255 THEN e.value #>> '{}' END
+        FROM parts p, jsonb_each(p.specifications) e
+        WHERE jsonb_typeof(p.specifications) = 'object'
+          AND jsonb_typeof(e.value) IN ('string', 'number', 'boolean')
+          AND length(e.key) <= 100
+    """,
+    "sqlite": """
+        INSERT INTO part_spec_values (part_id, key, num_value, text_value)
+        SELECT p.id, e.key,
+               CASE WHEN e.type IN ('integer', 'real') THEN e.value END,
+               CASE WHEN e.type = 'true' THEN 'true'
+                    WHEN e.type = 'false' THEN 'false'
+                    WHEN length(CAST(e.value AS TEXT)) <= 255 THEN CAST(e.value AS TEXT) END
+        FROM parts p, json_each(p.specifications) e
+        WHERE json_type(p.specifications) = 'object'
+          AND e.type IN ('text', 'integer', 'real', 'true', 'false')
+          AND length(e.key) <= 100
+    """,
+}
+
+
+class SpecFilter(NamedTuple):
+    """A parsed ``spec.<key><op><value>`` filter."""
+
+    key: str
+    operator: str
+    value: str
+
+
+def parse_filters(query_string: str) -> List[SpecFilter]:
+    """Extract the ``spec.`` filters from a raw query string.
+
+    The raw string is parsed because ``spec.length_mm>=100`` reaches the
+    application as the parameter ``spec.length_mm>`` with value ``100``.
+
+    Args:
+        query_string: Undecoded query string of the request
+
+    Returns:
+        Filters in the order given
+
+    Raises:
+        ValueError: If a ``spec.`` parameter is malformed
+    """
+    filters = []
+    for pair in query_string.split("&"):
+        parameter = unquote_plus(pair)
+        if not parameter.startswith("spec."):
+            continue
+        match = _FILTER_PATTERN.match(parameter)
+        if not match:
+            raise ValueError(f"Invalid specification filter '{parameter}'")
+        key, operator, value = match.groups()
+        if operator in _RANGE_OPERATORS and _number(value) is None:
+            raise ValueError(f"Specification filter '{parameter}' needs a numeric value")
+        filters.append(SpecFilter(key, operator, value))
+    return filters
+
+
+def _number(value: str) -> Optional[float]:
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _json_candidates(value: str) -> List[Any]:
+    """JSON values a filter string can stand for: the string, plus a number or boolean."""
+    candidates: List[Any] = [value]
+    if value in ("true", "false"):
+        candidates.append(value == "true")
+    number = _number(value)
+    if number is not None:
+        candidates.append(int(number) if number.is_integer() else number)
+    return candidates
+
+
+def filter_clause(spec_filter: SpecFilter, dialect: str):
+    """SQL condition on ``parts`` for one filter.
+
+    Args:
+        spec_filter: Parsed filter
+        dialect: Name of the database dialect the query runs on
+
+    Returns:
+        Boolean clause for ``Query.filter``
+    """
+    key, operator, value = spec_filter
+    if operator == "=" and dialect == "postgresql":
+        specifications = type_coerce(Part.specifications, JSONB)
+        return or_(*(
+            specifications.contains({key: candidate}) for candidate in _json_candidates(value)
+        ))
+
+    if operator == "=":
+        number = _number(value)
+        match = PartSpecValue.text_value == value
+        if number is not None:
+            match = or_(match, PartSpecValue.num_value == number)
+    else:
+        match = _RANGE_OPERATORS[operator](PartSpecValue.num_value, _number(value))
+    # A range scan of (key, value, part_id), not a lookup per part
+    return Part.id.in_(
+        select(PartSpecValue.part_id).where(PartSpecValue.key == key, match)
+    )
+
+
+def spec_rows(part_id: UUID, specifications: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """``part_spec_values`` rows for a part's specifications.
+
+    Args:
+        part_id: Part UUID
+        specifications: The part's specifications (may be None)
+
+    Returns:
+        One row per top-level string, number or boolean
+    """
+    rows = []
+    for key, value in (specifications or {}).items():
+        if value is None or isinstance(value, (dict, list)) or len(key) > 100:
+            continue
+        if isinstance(value, str):
+            text_value = value
+        else:
+            text_value = json.dumps(value)
+        is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        rows.append({
+            "part_id": part_id,
+            "key": key,
+            "num_value": float(value) if is_number and math.isfinite(value) else None,
+            "text_value": text_value if len(text_value) <= MAX_TEXT_LENGTH else None,
+        })
+    return rows
+
+
+def sync(db: Session, part: Part, created: bool = False) -> None:
+    """Replace a part's ``part_spec_values`` rows with its current specifications.
+
+    Args:
+        db: Database session (the part must be flushed)
+        part: Part whose specifications were created or changed
+        created: The part is new, so there are no rows to delete
+    """
+    if not created:
+        db.execute(delete(PartSpecValue).where(PartSpecValue.part_id == part.id))
+    rows = spec_rows(part.id, part.specifications)
+    if rows:
+        db.execute(insert(PartSpecValue), rows)
+
+
+def rebuild(db: Session) -> int:
+    """Recompute ``part_spec_values`` for every part.
+
+    Args:
+        db: Database session (not committed)
+
+    Returns:
+        Number of rows written
+    """
+    db.execute(delete(PartSpecValue))
+    return db.execute(text(REBUILD_SQL[db.get_bind().dialect.name])).rowcount
@@ -0,0 +1,109 @@
+"""Minimal PDF writer for text documents (invoices, delivery notes).
+
+Produces A4 pages using the standard Helvetica fonts, so no font embedding
+or third-party dependency is needed. Lines starting with ``# `` are set in
+bold; long lines are wrapped and overflowing text continues on a new page.
+"""
+
+import textwrap
+from typing import Iterable, List, Tuple
+
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+MARGIN = 56
+FONT_SIZE = 10
+LINE_HEIGHT = 14
+WRAP_WIDTH = 95
+
+LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT
+
+
+def _escape(text: str) -> bytes:
+    """Encode text as a PDF literal string in WinAnsi (cp1252)."""
+    raw = text.encode("cp1252", errors="replace")
+    return raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _layout(lines: Iterable[str]) -> List[List[Tuple[bool, str]]]:
+    """Wrap lines and split them into pages of (bold, text) tuples."""
+    flat: List[Tuple[bool, str]] = []
+    for line in lines:
+        bold = line.startswith("# ")
+        text = line[2:] if bold else line
+        wrapped = textwrap.wrap(text, WRAP_WIDTH, replace_whitespace=False) or [""]
+        flat.extend((bold, part) for part in wrapped)
+    return [
+        flat[start:start + LINES_PER_PAGE]
+        for start in range(0, max(len(flat), 1), LINES_PER_PAGE)
+    ]
+
+
+def _content_stream(page: List[Tuple[bool, str]]) -> bytes:
+    parts = [b"BT", b"%d TL" % LINE_HEIGHT, b"%d %d Td" % (MARGIN, PAGE_HEIGHT - MARGIN)]
+    current_font = None
+    for bold, text in page:
+        font = b"/F2" if bold else b"/F1"
+        if font != current_font:
+            parts.append(font + b" %d Tf" % FONT_SIZE)
+            current_font = font
+        parts.append(b"(" + _escape(text) + b") Tj T*")
+    parts.append(b"ET")
+    return b"\n".join(parts)
+
+
+def render_text_pdf(lines: Iterable[str], title: str = "") -> bytes:
+    """Render lines of text into a PDF document.
+
+    Args:
+        lines: Text lines; a ``# `` prefix marks a bold line
+        title: Document title stored in the PDF metadata
+
+    Returns:
+        PDF file contents
+    """
+    pages = _layout(lines)
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b"")  # filled in once the page tree exists
+    pages_obj = add(b"")
+    regular = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+                  b"/Encoding /WinAnsiEncoding >>")
+    bold = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold "
+               b"/Encoding /WinAnsiEncoding >>")
+    info = add(b"<< /Title (" + _escape(title) + b") /Producer (GM-TC CRM) >>")
+
+    page_ids = []
+    for page in pages:
+        stream = _content_stream(page)
+        content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 %d 0 R /F2 %d 0 R >> >> /Contents %d 0 R >>"
+            % (pages_obj, PAGE_WIDTH, PAGE_HEIGHT, regular, bold, content)
+        ))
+
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_obj
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[pages_obj - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        kids, len(page_ids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += (
+        b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, catalog, info, xref)
+    )
+    return bytes(out)
@@ -0,0 +1,105 @@
+"""Accounts-receivable aging computed in the database."""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Set
+from sqlalchemy import Date, and_, cast, func
+from sqlalchemy.orm import Session
+
+from app.core.cache import cache
+from app.db import cache_version, on_tables_changed
+from app.db.replicas import primary_reads
+from app.models.customer import Customer
+from app.models.invoice import Invoice
+
+CACHE_PREFIX = "reports:aging:"
+
+# Statuses of invoices that have been issued and not yet settled. Keep in
+# sync with the ix_invoices_unpaid_due partial index predicate.
+UNPAID_STATUSES = ("sent", "overdue")
+
+BUCKETS = ("days_0_30", "days_31_60", "days_61_90", "days_over_90")
+
+
+def _days_past_due(db: Session):
+    """SQL expression for whole days between due_date and today."""
+    if db.get_bind().dialect.name == "sqlite":
+        return func.julianday(func.date("now")) - func.julianday(
+            func.date(Invoice.due_date)
+        )
+    return func.current_date() - cast(Invoice.due_date, Date)
+
+
+def _compute_aging(db: Session) -> List[Dict[str, Any]]:
+    """Bucket unpaid invoice totals per customer in one grouped query."""
+    days = _days_past_due(db)
+    amount = Invoice.total_amount
+    rows = (
+        db.query(
+            Invoice.customer_id,
+            Customer.name.label("customer_name"),
+            func.coalesce(func.sum(amount).filter(days <= 30), 0).label("days_0_30"),
+            func.coalesce(
+                func.sum(amount).filter(and_(days > 30, days <= 60)), 0
+            ).label("days_31_60"),
+            func.coalesce(
+                func.sum(amount).filter(and_(days > 60, days <= 90)), 0
+            ).label("days_61_90"),
+            func.coalesce(func.sum(amount).filter(days > 90), 0).label("days_over_90"),
+            func.sum(amount).label("total"),
+            func.count(Invoice.id).label("invoice_count"),
+        )
+        .join(Customer, Customer.id == Invoice.customer_id)
+        .filter(
+            Invoice.deleted_at.is_(None),
+            Invoice.status.in_(UNPAID_STATUSES),
+        )
+        .group_by(Invoice.customer_id, Customer.name)
+        .order_by(func.sum(amount).desc())
+        .all()
+    )
+    return [dict(row._mapping) for row in rows]
+
+
+def _seconds_until_end_of_day() -> float:
+    """Seconds left in the current (server-local) business day."""
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max((midnight - now).total_seconds(), 1.0)
+
+
+def get_aging(db: Session) -> Dict[str, Any]:
+    """Return the aging report for today, cached until the day ends.
+
+    Ages only move at midnight, so the result is reused for the rest of the
+    day unless an invoice is written in the meantime.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Report with per-customer rows and bucket totals
+    """
+    today = date.today()
+
+    def load():
+        with primary_reads(db):
+            items = _compute_aging(db)
+        totals = {
+            name: sum(item[name] for item in items)
+            for name in (*BUCKETS, "total", "invoice_count")
+        }
+        return {"as_of": today, "items": items, "totals": totals}
+
+    return cache.get_or_set(
+        f"{CACHE_PREFIX}{today.isoformat()}", load, _seconds_until_end_of_day(),
+        version=cache_version(db),
+    )
+
+
+def _invalidate_aging(tables: Set[str]) -> None:
+    """Drop cached aging reports after invoice or customer writes."""
+    if tables & {"invoices", "customers"}:
+        cache.invalidate_prefix(CACHE_PREFIX)
+
+
+on_tables_changed(_invalidate_aging)
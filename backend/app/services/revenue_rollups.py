@@ -0,0 +1,188 @@
+"""Incremental maintenance of the daily/monthly revenue rollup tables.
+
+Every invoice write records its contribution before and after the change;
+the difference is applied to the rollups with an upsert so reporting never
+has to scan ``invoices``. ``rebuild`` and ``refresh_periods`` recompute
+rollups in bulk with ``INSERT ... SELECT`` for repairs and set-based jobs.
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, NamedTuple, Optional
+from uuid import UUID
+from sqlalchemy import Date, cast, delete, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.invoice import Invoice
+from app.models.revenue_rollup import RevenueRollupDaily, RevenueRollupMonthly
+
+AMOUNT_COLUMNS = ("subtotal", "tax_amount", "discount_amount", "total_amount")
+CENT = Decimal("0.01")
+
+
+class Contribution(NamedTuple):
+    """What a single invoice adds to the rollups."""
+
+    day: date
+    status: str
+    customer_id: UUID
+    subtotal: Decimal
+    tax_amount: Decimal
+    discount_amount: Decimal
+    total_amount: Decimal
+
+    @property
+    def month(self) -> date:
+        return self.day.replace(day=1)
+
+
+def contribution_of(invoice: Invoice) -> Optional[Contribution]:
+    """Capture an invoice's current rollup contribution.
+
+    Args:
+        invoice: Invoice instance (its invoice_date must be loaded)
+
+    Returns:
+        Contribution, or None for soft-deleted invoices
+    """
+    if invoice.deleted_at is not None:
+        return None
+    amounts = [
+        Decimal(getattr(invoice, name) or 0).quantize(CENT)
+        for name in AMOUNT_COLUMNS
+    ]
+    return Contribution(
+        invoice.invoice_date.date(), invoice.status, invoice.customer_id, *amounts
+    )
+
+
+def _upsert(db: Session, model, period: date, item: Contribution, sign: int) -> None:
+    """Add ``sign`` times the contribution to one rollup row."""
+    dialect = db.get_bind().dialect.name
+    insert_fn = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    values = {name: sign * getattr(item, name) for name in AMOUNT_COLUMNS}
+    stmt = insert_fn(model).values(
+        period=period,
+        status=item.status,
+        customer_id=item.customer_id,
+        invoice_count=sign,
+        **values,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["period", "status", "customer_id"],
+        set_={
+            name: getattr(model, name) + getattr(stmt.excluded, name)
+            for name in ("invoice_count", *AMOUNT_COLUMNS)
+        },
+    )
+    db.execute(stmt)
+
+    if sign < 0:
+        db.execute(
+            delete(model).where(
+                model.period == period,
+                model.status == item.status,
+                model.customer_id == item.customer_id,
+                model.invoice_count <= 0,
+            )
+        )
+
+
+def record_change(
+    db: Session,
+    before: Optional[Contribution],
+    after: Optional[Contribution],
+) -> None:
+    """Move an invoice's contribution from ``before`` to ``after``.
+
+    Runs inside the caller's transaction so rollups commit together with
+    the invoice write.
+
+    Args:
+        db: Database session
+        before: Contribution prior to the write (None for new invoices)
+        after: Contribution after the write (None for deleted invoices)
+    """
+    if before == after:
+        return
+    for item, sign in ((before, -1), (after, 1)):
+        if item is None:
+            continue
+        _upsert(db, RevenueRollupDaily, item.day, item, sign)
+        _upsert(db, RevenueRollupMonthly, item.month, item, sign)
+
+
+def _period_expressions(db: Session):
+    """Return SQL expressions truncating invoice_date to day and month."""
+    if db.get_bind().dialect.name == "sqlite":
+        return (
+            func.date(Invoice.invoice_date, type_=Date),
+            func.date(Invoice.invoice_date, "start of month", type_=Date),
+        )
+    return (
+        cast(func.date_trunc("day", Invoice.invoice_date), Date),
+        cast(func.date_trunc("month", Invoice.invoice_date), Date),
+    )
+
+
+def _insert_from_invoices(db: Session, model, period_expr, period_filter=None) -> None:
+    """Aggregate invoices into ``model`` with a single INSERT ... SELECT."""
+    query = (
+        select(
+            period_expr.label("period"),
+            Invoice.status,
+            Invoice.customer_id,
+            func.count(Invoice.id),
+            *[
+                func.sum(func.coalesce(getattr(Invoice, name), literal(0)))
+                for name in AMOUNT_COLUMNS
+            ],
+        )
+        .where(Invoice.deleted_at.is_(None))
+        .group_by(period_expr, Invoice.status, Invoice.customer_id)
+    )
+    if period_filter is not None:
+        query = query.where(period_filter)
+    db.execute(
+        insert(model).from_select(
+            ["period", "status", "customer_id", "invoice_count", *AMOUNT_COLUMNS],
+            query,
+        )
+    )
+
+
+def refresh_periods(db: Session, days: Iterable[date]) -> None:
+    """Recompute the rollup rows for specific days and their months.
+
+    Used by set-based jobs that change many invoices at once.
+
+    Args:
+        db: Database session
+        days: Invoice days whose rollups may be stale
+    """
+    days = set(days)
+    if not days:
+        return
+    months = {day.replace(day=1) for day in days}
+    day_expr, month_expr = _period_expressions(db)
+
+    db.execute(delete(RevenueRollupDaily).where(RevenueRollupDaily.period.in_(days)))
+    db.execute(
+        delete(RevenueRollupMonthly).where(RevenueRollupMonthly.period.in_(months))
+    )
+    _insert_from_invoices(db, RevenueRollupDaily, day_expr, day_expr.in_(days))
+    _insert_from_invoices(db, RevenueRollupMonthly, month_expr, month_expr.in_(months))
+
+
+def rebuild(db: Session) -> None:
+    """Recompute all rollup tables from scratch.
+
+    Args:
+        db: Database session
+    """
+    day_expr, month_expr = _period_expressions(db)
+    db.execute(delete(RevenueRollupDaily))
+    db.execute(delete(RevenueRollupMonthly))
+    _insert_from_invoices(db, RevenueRollupDaily, day_expr)
+    _insert_from_invoices(db, RevenueRollupMonthly, month_expr)
@@ -0,0 +1,258 @@
+"""In-process scheduler for periodic background jobs.
+
+Each worker process runs one scheduler thread. Before a job executes, the
+scheduler takes a lease row in ``job_locks`` so that when several uvicorn
+workers are running only one of them performs the job. Every execution is
+recorded in ``job_runs`` with its duration and job-specific counters.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import event, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import JOB_DURATION
+from app.db import SessionLocal
+from app.models.job import JobLock, JobRun
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+# Identifies this worker process as a lease owner
+WORKER_ID = _worker_id()
+
+
+def _reset_worker_id() -> None:
+    global WORKER_ID
+    WORKER_ID = _worker_id()
+
+
+# Workers forked from a preloaded master must not share the master's identity
+os.register_at_fork(after_in_child=_reset_worker_id)
+
+
+@dataclass
+class Job:
+    """A periodic job: ``func`` receives a session and returns counters."""
+
+    name: str
+    func: Callable[[Session], Dict[str, Any]]
+    interval_seconds: float
+    next_run: float = 0.0
+
+
+def acquire_lock(db: Session, name: str, ttl_seconds: float) -> bool:
+    """Try to take the named lease for ``ttl_seconds``.
+
+    Args:
+        db: Database session (committed by this function)
+        name: Lock name, usually the job name
+        ttl_seconds: Lease duration; a crashed owner's lease expires after it
+
+    Returns:
+        True if this worker now holds the lease
+    """
+    now = datetime.now(timezone.utc)
+    if db.get(JobLock, name) is None:
+        try:
+            db.add(JobLock(name=name))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+
+    result = db.execute(
+        update(JobLock)
+        .where(
+            JobLock.name == name,
+            or_(
+                JobLock.locked_until.is_(None),
+                JobLock.locked_until < now,
+                JobLock.owner == WORKER_ID,
+            ),
+        )
+        .values(owner=WORKER_ID, locked_until=now + timedelta(seconds=ttl_seconds))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+class LeaseLost(RuntimeError):
+    """The job's lease expired and was taken over by another worker."""
+
+
+def renew_lock(db: Session, name: str, ttl_seconds: float) -> bool:
+    """Extend the named lease held by this worker (not committed).
+
+    Args:
+        db: Database session; the renewal commits with its transaction
+        name: Lock name
+        ttl_seconds: New lease duration from now
+
+    Returns:
+        True if this worker still held the lease
+    """
+    result = db.execute(
+        update(JobLock)
+        .where(JobLock.name == name, JobLock.owner == WORKER_ID)
+        .values(locked_until=datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def _renew_on_commit(db: Session, name: str, ttl_seconds: float):
+    """Listener renewing the lease with every batch the job commits.
+
+    Renewals are spaced at least a quarter of the TTL apart. A job that
+    lost its lease has its batch rolled back instead of committed.
+    """
+    renewed = time.monotonic()
+
+    def renew(session):
+        nonlocal renewed
+        if time.monotonic() - renewed < ttl_seconds / 4:
+            return
+        if not renew_lock(session, name, ttl_seconds):
+            raise LeaseLost(f"Lease on {name} expired while the job was running")
+        renewed = time.monotonic()
+
+    event.listen(db, "before_commit", renew)
+    return renew
+
+
+def release_lock(db: Session, name: str) -> None:
+    """Release the named lease if this worker holds it."""
+    db.execute(
+        update(JobLock)
+        .where(JobLock.name == name, JobLock.owner == WORKER_ID)
+        .values(owner=None, locked_until=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def run_job(job: Job) -> Optional[JobRun]:
+    """Run a job once under its lease and record the outcome.
+
+    Args:
+        job: Job to execute
+
+    Returns:
+        The recorded run, or None if another worker holds the lease
+    """
+    db = SessionLocal()
+    try:
+        if not acquire_lock(db, job.name, settings.JOB_LOCK_TTL_SECONDS):
+            logger.debug("Job %s is running elsewhere, skipping", job.name)
+            return None
+
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        stats: Dict[str, Any] = {}
+        error = None
+        # Long jobs keep the lease alive as long as they keep committing
+        renew = _renew_on_commit(db, job.name, settings.JOB_LOCK_TTL_SECONDS)
+        try:
+            stats = job.func(db) or {}
+            db.commit()
+        except Exception as exc:  # recorded in job_runs
+            db.rollback()
+            error = repr(exc)
+            logger.exception("Job %s failed", job.name)
+        finally:
+            event.remove(db, "before_commit", renew)
+
+        status = "failed" if error else "success"
+        JOB_DURATION.labels(job.name, status).observe(time.perf_counter() - started)
+        run = JobRun(
+            job_name=job.name,
+            status=status,
+            started_at=started_at,
+            finished_at=datetime.now(timezone.utc),
+            duration_ms=int((time.perf_counter() - started) * 1000),
+            stats=stats,
+            error=error,
+        )
+        db.add(run)
+        db.commit()
+        release_lock(db, job.name)
+
+        # Detach a loaded copy so callers can read it after the session closes
+        db.refresh(run)
+        db.expunge(run)
+        return run
+    finally:
+        db.close()
+
+
+class Scheduler:
+    """Runs registered jobs on fixed intervals in a daemon thread."""
+
+    def __init__(self):
+        self.jobs: List[Job] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[Session], Dict[str, Any]],
+        interval_seconds: float,
+    ) -> None:
+        """Register a periodic job (first run happens on the next tick)."""
+        self.jobs.append(Job(name, func, interval_seconds))
+
+    def get_job(self, name: str) -> Job:
+        """Look up a registered job by name."""
+        for job in self.jobs:
+            if job.name == name:
+                return job
+        raise KeyError(name)
+
+    def start(self) -> None:
+        """Start the scheduler thread if it is not running."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Signal the thread to stop and wait for the current job."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            now = time.monotonic()
+            for job in self.jobs:
+                if self._stop.is_set():
+                    break
+                if job.next_run <= now:
+                    job.next_run = now + job.interval_seconds
+                    try:
+                        run_job(job)
+                    except Exception:  # keep the loop alive
+                        logger.exception("Scheduler could not run %s", job.name)
+            self._stop.wait(settings.SCHEDULER_TICK_SECONDS)
+
+
+# Global scheduler instance
+scheduler = Scheduler()
@@ -0,0 +1,204 @@
+"""Slow query log with automatic EXPLAIN capture.
+
+Statements slower than ``SLOW_QUERY_THRESHOLD_MS`` are handed to a
+background thread, so the request that ran them never waits for logging.
+The thread normalizes the SQL (literals and parameters become ``?``),
+records the parameter types (never their values), the calling endpoint
+and the ``EXPLAIN`` plan (without ANALYZE, so nothing is re-executed), and
+upserts everything into ``slow_queries`` keyed by the statement's
+fingerprint. ``GET /diagnostics/slow-queries`` lists the worst offenders.
+"""
+
+import hashlib
+import logging
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional, Set
+
+from sqlalchemy import case, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+from app.core.instrumentation import add_statement_observer, current_query_stats
+from app.db import engine
+from app.models.slow_query import SlowQuery
+
+logger = logging.getLogger(__name__)
+
+# Execution option that keeps the logger's own statements out of the log
+SKIP_OPTION = "slow_query_log"
+
+EXPLAINABLE = ("select", "with", "insert", "update", "delete")
+
+_NORMALIZE = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),                # string literals
+    (re.compile(r"%\(\w+\)s|%s|(?<![:\w]):\w+|\$\d+"), "?"),  # bound parameters
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),             # numeric literals
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(?, ...)"),  # expanded IN lists
+    (re.compile(r"\s+"), " "),
+]
+
+
+@dataclass
+class SlowStatement:
+    engine: Engine
+    statement: str
+    parameters: Any
+    executemany: bool
+    elapsed_ms: float
+    endpoint: Optional[str]
+    seen_at: datetime
+
+
+_queue: "queue.Queue[Optional[SlowStatement]]" = queue.Queue(maxsize=1000)
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+_explained: Set[str] = set()
+
+
+def normalize(statement: str) -> str:
+    """Reduce a statement to its shape: literals, parameters and IN lists become ``?``."""
+    for pattern, replacement in _NORMALIZE:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+def fingerprint(normalized: str) -> str:
+    """Stable short hash identifying a normalized statement."""
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16]
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """Describe parameters by type only, e.g. ``{"id_1": "UUID", "param_1": "int"}``."""
+    if executemany:
+        return {"executemany": len(parameters)}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return None
+
+
+def _explain(conn: Connection, item: SlowStatement) -> Optional[str]:
+    """EXPLAIN the statement with its original parameters (plan only, no ANALYZE)."""
+    if item.executemany or not item.statement.lstrip().lower().startswith(EXPLAINABLE):
+        return None
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {item.statement}", item.parameters)
+        return "\n".join(row[-1] for row in rows)
+    rows = conn.exec_driver_sql(f"EXPLAIN {item.statement}", item.parameters)
+    return "\n".join(row[0] for row in rows)
+
+
+def _record(item: SlowStatement) -> None:
+    """Upsert one slow statement into ``slow_queries``."""
+    normalized = normalize(item.statement)
+    key = fingerprint(normalized)
+    plan = None
+    if key not in _explained:
+        # Explain on the engine that ran the statement (it may be a read replica)
+        with item.engine.connect() as conn:
+            conn.execution_options(**{SKIP_OPTION: False})
+            try:
+                plan = _explain(conn, item)
+            except Exception as exc:  # the plan is best effort
+                plan = f"EXPLAIN failed: {exc}"
+            conn.rollback()
+        _explained.add(key)
+
+    with engine.connect() as conn:
+        conn.execution_options(**{SKIP_OPTION: False})
+        insert_fn = postgresql.insert if conn.dialect.name == "postgresql" else sqlite.insert
+        stmt = insert_fn(SlowQuery).values(
+            fingerprint=key,
+            statement=normalized,
+            parameter_shape=parameter_shape(item.parameters, item.executemany),
+            endpoint=item.endpoint,
+            plan=plan,
+            calls=1,
+            total_ms=item.elapsed_ms,
+            max_ms=item.elapsed_ms,
+            first_seen=item.seen_at,
+            last_seen=item.seen_at,
+        )
+        table = SlowQuery.__table__.c
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["fingerprint"],
+            set_={
+                "parameter_shape": stmt.excluded.parameter_shape,
+                "endpoint": stmt.excluded.endpoint,
+                "plan": func.coalesce(stmt.excluded.plan, table.plan),
+                "calls": table.calls + 1,
+                "total_ms": table.total_ms + stmt.excluded.total_ms,
+                "max_ms": case(
+                    (stmt.excluded.max_ms > table.max_ms, stmt.excluded.max_ms),
+                    else_=table.max_ms,
+                ),
+                "last_seen": stmt.excluded.last_seen,
+            },
+        )
+        conn.execute(stmt)
+        conn.commit()
+
+
+def _run_worker() -> None:
+    while True:
+        item = _queue.get()
+        if item is None:
+            return
+        try:
+            _record(item)
+        except Exception:
+            logger.exception("Could not record slow query")
+        finally:
+            _queue.task_done()
+
+
+def _ensure_worker() -> None:
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run_worker, name="slow-query-log", daemon=True)
+            _worker.start()
+
+
+def _observe(conn: Connection, statement: str, parameters: Any,
+             executemany: bool, elapsed_ms: float) -> None:
+    """Statement observer: queue statements over the threshold."""
+    if elapsed_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+    if not conn.get_execution_options().get(SKIP_OPTION, True):
+        return
+    stats = current_query_stats()
+    endpoint = stats.endpoint if stats else f"thread:{threading.current_thread().name}"
+    try:
+        _queue.put_nowait(SlowStatement(
+            engine=conn.engine,
+            statement=statement,
+            parameters=parameters,
+            executemany=executemany,
+            elapsed_ms=elapsed_ms,
+            endpoint=endpoint,
+            seen_at=datetime.now(timezone.utc),
+        ))
+    except queue.Full:
+        return
+    _ensure_worker()
+
+
+def install() -> None:
+    """Start observing statements (no-op when the log is disabled)."""
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        add_statement_observer(_observe)
+
+
+def flush(timeout: float = 5.0) -> None:
+    """Wait until queued slow statements have been written."""
+    deadline = time.monotonic() + timeout
+    while _queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
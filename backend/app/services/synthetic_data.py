@@ -0,0 +1,402 @@
+"""Deterministic synthetic data for scale and load testing.
+
+Row counts are given for ``scale=1.0``; larger scales produce millions of
+rows:
+
+    =============  =========  ==========================================
+    table          rows       notes
+    =============  =========  ==========================================
+    suppliers          1 000
+    parts            100 000  ``specifications`` JSON per category
+    builds             5 000  50 parts each (250 000 ``build_parts``)
+    customers         50 000
+    deliveries       100 000  linked to a customer and a build
+    invoices         500 000  one per delivered delivery, rest stand-alone
+    =============  =========  ==========================================
+
+Creation dates lean towards the recent past (a growing business), and
+statuses follow from a row's age: recent deliveries are still pending or
+in transit, old unpaid invoices are overdue. About 2 % of rows are
+soft-deleted.
+
+Every table draws from its own random stream derived from the seed, and
+all timestamps are relative to ``anchor``, so the same seed and anchor
+always produce the same rows, IDs included. Rows skip the API and ORM:
+PostgreSQL loads them with ``COPY ... FROM STDIN``, other databases with
+batched ``executemany`` inserts. Revenue rollups and the part
+specification index are rebuilt at the end.
+"""
+
+import csv
+import heapq
+import io
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Table, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.models.build import Build, build_parts
+from app.models.customer import Customer
+from app.models.delivery import Delivery
+from app.models.invoice import Invoice
+from app.models.part import Part
+from app.models.supplier import Supplier
+from app.services import part_specs, revenue_rollups
+
+SIZES = {
+    "suppliers": 1_000,
+    "parts": 100_000,
+    "builds": 5_000,
+    "customers": 50_000,
+    "deliveries": 100_000,
+    "invoices": 500_000,
+}
+PARTS_PER_BUILD = 50
+BATCH_SIZE = 10_000
+HISTORY_DAYS = 3 * 365
+DELETED_SHARE = 0.02
+
+CITIES = ["Berlin", "Hamburg", "München", "Köln", "Frankfurt", "Stuttgart", "Leipzig",
+          "Dresden", "Hannover", "Nürnberg", "Wien", "Zürich"]
+FIRST_NAMES = ["Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta", "Hannes", "Ida",
+               "Jonas", "Lena", "Max", "Mia", "Noah", "Paul", "Sophie"]
+LAST_NAMES = ["Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker",
+              "Schulz", "Hoffmann", "Koch", "Richter", "Wolf", "Klein"]
+COMPANY_SUFFIXES = ["GmbH", "AG", "KG", "UG", "e.K."]
+CARRIERS = ["DHL", "DPD", "UPS", "GLS", "Hermes"]
+
+# Category -> specification generator; keys are what parametric search filters on
+SPECIFICATIONS: Dict[str, Callable[[random.Random], Dict[str, Any]]] = {
+    "Electronics": lambda rng: {
+        "voltage_v": rng.choice([5, 12, 24, 48]),
+        "current_a": round(rng.uniform(0.1, 10), 1),
+        "connector": rng.choice(["JST-XH", "JST-PH", "Molex", "XT60", "screw"]),
+    },
+    "Mechanical": lambda rng: {
+        "length_mm": rng.choice([6, 8, 10, 12, 16, 20, 25, 30, 40, 50, 100]),
+        "diameter_mm": rng.choice([2, 2.5, 3, 4, 5, 6, 8]),
+        "material": rng.choice(["steel", "stainless", "brass", "nylon"]),
+        "thread": rng.choice(["M2", "M2.5", "M3", "M4", "M5", "M6", "M8"]),
+    },
+    "Hotend": lambda rng: {
+        "max_temp_c": rng.choice([240, 260, 285, 300, 450]),
+        "nozzle_mm": rng.choice([0.2, 0.4, 0.6, 0.8, 1.0]),
+        "voltage_v": rng.choice([12, 24]),
+        "filament_mm": rng.choice([1.75, 2.85]),
+    },
+    "Frame": lambda rng: {
+        "length_mm": rng.randrange(100, 1500, 50),
+        "profile": rng.choice(["2020", "2040", "3030", "4040"]),
+        "color": rng.choice(["black", "silver"]),
+    },
+    "Motion": lambda rng: {
+        "travel_mm": rng.randrange(100, 1000, 50),
+        "step_angle_deg": rng.choice([0.9, 1.8]),
+        "holding_torque_ncm": rng.choice([26, 40, 45, 59, 76]),
+        "type": rng.choice(["stepper", "linear_rail", "lead_screw", "belt"]),
+    },
+    "Misc": lambda rng: {
+        "weight_g": rng.randint(1, 5000),
+    },
+}
+CATEGORY_WEIGHTS = {"Electronics": 25, "Mechanical": 35, "Hotend": 8, "Frame": 10, "Motion": 12, "Misc": 10}
+
+BUILD_STATUSES = {"draft": 15, "ready_for_production": 30, "in_production": 45, "discontinued": 10}
+
+
+def scaled_sizes(scale: float) -> Dict[str, int]:
+    """Row counts per table for a scale factor (at least one row each)."""
+    return {name: max(int(rows * scale), 1) for name, rows in SIZES.items()}
+
+
+class _Stream:
+    """Deterministic random source for one table."""
+
+    def __init__(self, seed: int, table: str, anchor: datetime):
+        self.rng = random.Random(f"{seed}:{table}")
+        self.anchor = anchor
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def age(self) -> int:
+        """Seconds before the anchor, denser towards the anchor (a growing business)."""
+        return int(HISTORY_DAYS * 86400 * self.rng.random() ** 2)
+
+    def created(self) -> datetime:
+        return self.anchor - timedelta(seconds=self.age())
+
+    def deleted(self, created: datetime) -> Optional[datetime]:
+        if self.rng.random() >= DELETED_SHARE:
+            return None
+        return min(created + timedelta(days=self.rng.randint(1, 120)), self.anchor)
+
+    def money(self, low: int, high: int) -> Decimal:
+        return Decimal(self.rng.randrange(low * 100, high * 100)) / 100
+
+    def person(self) -> str:
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    def code(self) -> str:
+        return f"{self.rng.choice('ABCDEFGHJKLMNPQRSTUVWXYZ')}{self.rng.randrange(10 ** 5):05d}"
+
+
+def _ids(seed: int, table: str, count: int) -> List[uuid.UUID]:
+    """IDs of a table, drawn from a stream of their own so row data can change freely."""
+    stream = _Stream(seed, f"{table}.id", datetime.min)
+    return [stream.uuid() for _ in range(count)]
+
+
+def _batches(rows: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, dict):
+        return json.dumps(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _copy(conn: Connection, table: Table, batch: List[Dict[str, Any]]) -> None:
+    """Load a batch with PostgreSQL ``COPY`` (CSV; empty unquoted fields are NULL)."""
+    columns = list(batch[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in batch:
+        writer.writerow([_csv_value(row[column]) for column in columns])
+    buffer.seek(0)
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f'COPY {table.name} ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)', buffer
+        )
+    finally:
+        cursor.close()
+
+
+def is_empty(engine: Engine) -> bool:
+    """Whether the database has no parts yet (nothing generated)."""
+    with engine.connect() as conn:
+        return not conn.execute(select(func.count()).select_from(Part)).scalar()
+
+
+def generate(
+    engine: Engine,
+    scale: float = 1.0,
+    seed: int = 1,
+    anchor: Optional[datetime] = None,
+    out: Callable[[str], None] = print,
+) -> Dict[str, int]:
+    """Bulk-load the synthetic dataset, committing once per table.
+
+    Args:
+        engine: Target database (must not contain parts yet)
+        scale: Multiple of the base dataset sizes
+        seed: Random seed
+        anchor: Newest timestamp of the generated history (default: midnight UTC today)
+        out: Progress output
+
+    Returns:
+        Rows inserted per table
+    """
+    anchor = anchor or datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    sizes = scaled_sizes(scale)
+    part_ids = _ids(seed, "parts", sizes["parts"])
+    build_ids = _ids(seed, "builds", sizes["builds"])
+    customer_ids = _ids(seed, "customers", sizes["customers"])
+    build_created: Dict[uuid.UUID, datetime] = {}
+    # (delivery id, customer id, delivery date) of delivered deliveries, in order
+    delivered: List[Tuple[uuid.UUID, uuid.UUID, datetime]] = []
+
+    def stream(table: str) -> _Stream:
+        return _Stream(seed, table, anchor)
+
+    def number_width(count: int) -> int:
+        # Same width for all numbers, so the string maximum is the numeric one
+        return max(6, len(str(count)))
+
+    def suppliers() -> Iterator[Dict[str, Any]]:
+        s = stream("suppliers")
+        for supplier_id in _ids(seed, "suppliers", sizes["suppliers"]):
+            created = s.created()
+            name = f"{s.rng.choice(LAST_NAMES)} {s.code()} {s.rng.choice(COMPANY_SUFFIXES)}"
+            yield {"id": supplier_id, "name": name, "contact_person": s.person(),
+                   "email": f"sales@{name.split()[1].lower()}.example.com",
+                   "city": s.rng.choice(CITIES), "country": "Germany", "rating": s.rng.randint(1, 5),
+                   "is_active": s.rng.random() < 0.95, "created_at": created, "updated_at": created,
+                   "deleted_at": s.deleted(created)}
+
+    def parts() -> Iterator[Dict[str, Any]]:
+        s = stream("parts")
+        categories, weights = zip(*CATEGORY_WEIGHTS.items())
+        for n, part_id in enumerate(part_ids, start=1):
+            created = s.created().replace(tzinfo=None)
+            category = s.rng.choices(categories, weights)[0]
+            minimum = s.rng.choice([0, 0, 5, 10, 20, 50])
+            # Most parts are stocked well, some run low, a few are out
+            stock = s.rng.choices([s.rng.randint(minimum, minimum * 4 + 50), s.rng.randint(1, max(minimum, 1)), 0],
+                                  [80, 15, 5])[0]
+            yield {"id": part_id, "sku": f"P-{n:0{number_width(len(part_ids))}d}",
+                   "name": f"{category} {s.code()}", "category": category,
+                   "specifications": SPECIFICATIONS[category](s.rng),
+                   "current_stock": stock, "minimum_stock": minimum,
+                   "unit_price": s.money(1, 400), "created_at": created, "updated_at": created,
+                   "deleted_at": None}
+
+    def builds() -> Iterator[Dict[str, Any]]:
+        s = stream("builds")
+        statuses, weights = zip(*BUILD_STATUSES.items())
+        for n, build_id in enumerate(build_ids, start=1):
+            created = s.created()
+            build_created[build_id] = created
+            yield {"id": build_id, "name": f"Build {s.code()}", "model_number": f"B-{n:06d}",
+                   "base_price": s.money(500, 8000), "status": s.rng.choices(statuses, weights)[0],
+                   "build_time_hours": Decimal(s.rng.randint(4, 80)), "is_active": True,
+                   "created_at": created, "updated_at": created, "deleted_at": None}
+
+    def bill_of_materials() -> Iterator[Dict[str, Any]]:
+        s = stream("build_parts")
+        per_build = min(PARTS_PER_BUILD, len(part_ids))
+        for build_id in build_ids:
+            for part_id in s.rng.sample(part_ids, per_build):
+                yield {"id": s.uuid(), "build_id": build_id, "part_id": part_id,
+                       "quantity": s.rng.choices([1, 2, 4, 8], [60, 20, 15, 5])[0],
+                       "created_at": build_created[build_id]}
+
+    def customers() -> Iterator[Dict[str, Any]]:
+        s = stream("customers")
+        for customer_id in customer_ids:
+            created = s.created()
+            person = s.person()
+            business = s.rng.random() < 0.4
+            company = f"{person.split()[1]} {s.code()} {s.rng.choice(COMPANY_SUFFIXES)}" if business else None
+            yield {"id": customer_id, "name": company or person, "contact_person": person,
+                   "email": f"{person.lower().replace(' ', '.')}.{s.rng.randrange(10 ** 6)}@example.com",
+                   "company_name": company, "city": s.rng.choice(CITIES), "country": "Germany",
+                   "customer_type": "business" if business else "private",
+                   "is_active": s.rng.random() < 0.97, "created_at": created, "updated_at": created,
+                   "deleted_at": s.deleted(created)}
+
+    def deliveries() -> Iterator[Dict[str, Any]]:
+        s = stream("deliveries")
+        count = sizes["deliveries"]
+        # Numbered in creation order, like the API does
+        created_at = sorted(s.created() for _ in range(count))
+        for n, (delivery_id, created) in enumerate(zip(_ids(seed, "deliveries", count), created_at), start=1):
+            age_days = (anchor - created).days
+            if age_days < 2:
+                status = "pending"
+            elif age_days < 7:
+                status = s.rng.choices(["pending", "in_transit", "delivered"], [20, 50, 30])[0]
+            else:
+                status = s.rng.choices(["delivered", "cancelled", "returned"], [94, 4, 2])[0]
+            delivery_date = (min(created + timedelta(days=s.rng.randint(1, 6)), anchor)
+                             if status in ("delivered", "returned") else None)
+            customer_id = s.rng.choice(customer_ids)
+            if status == "delivered":
+                delivered.append((delivery_id, customer_id, delivery_date))
+            yield {"id": delivery_id, "delivery_number": f"DEL-{n:0{number_width(count)}d}",
+                   "customer_id": customer_id, "build_id": s.rng.choice(build_ids),
+                   "status": status, "delivery_date": delivery_date,
+                   "expected_delivery_date": created + timedelta(days=5),
+                   "carrier": s.rng.choice(CARRIERS) if status != "pending" else None,
+                   "tracking_number": f"{s.rng.randrange(10 ** 12):012d}" if status != "pending" else None,
+                   "shipping_cost": s.money(5, 80), "created_at": created, "updated_at": created,
+                   "deleted_at": None}
+
+    def invoices() -> Iterator[Dict[str, Any]]:
+        s = stream("invoices")
+        count = sizes["invoices"]
+        # Invoices for delivered deliveries plus stand-alone ones, numbered in
+        # date order; stand-alone invoices only keep their age until written
+        billed = sorted(
+            ((date, customer_id, delivery_id) for delivery_id, customer_id, date in delivered[:count]),
+            key=lambda item: item[0],
+        )
+        standalone_ages = sorted((s.age() for _ in range(count - len(billed))), reverse=True)
+        dated = heapq.merge(
+            billed,
+            ((anchor - timedelta(seconds=age), None, None) for age in standalone_ages),
+            key=lambda item: item[0],
+        )
+        for n, (invoice_id, (invoice_date, customer_id, delivery_id)) in enumerate(
+            zip(_ids(seed, "invoices", count), dated), start=1
+        ):
+            customer_id = customer_id or s.rng.choice(customer_ids)
+            due_date = invoice_date + timedelta(days=14)
+            overdue_days = (anchor - due_date).days
+            roll = s.rng.random()
+            if roll < 0.02:
+                status = "cancelled"
+            elif (anchor - invoice_date).days < 1:
+                status = "draft"
+            elif overdue_days < 0:
+                status = "paid" if roll < 0.4 else "sent"
+            else:
+                status = "paid" if roll < 0.93 else "overdue"
+            subtotal = s.money(80, 8000)
+            discount = (subtotal * Decimal("0.05")).quantize(Decimal("0.01")) if s.rng.random() < 0.1 else Decimal("0")
+            tax_amount = ((subtotal - discount) * Decimal("0.19")).quantize(Decimal("0.01"))
+            paid_date = (min(invoice_date + timedelta(days=s.rng.randint(1, 45)), anchor)
+                         if status == "paid" else None)
+            yield {"id": invoice_id, "invoice_number": f"INV-{n:0{number_width(count)}d}",
+                   "customer_id": customer_id, "delivery_id": delivery_id,
+                   "invoice_date": invoice_date, "due_date": due_date, "paid_date": paid_date,
+                   "subtotal": subtotal, "tax_rate": Decimal("19.00"), "tax_amount": tax_amount,
+                   "discount_amount": discount, "total_amount": subtotal - discount + tax_amount,
+                   "status": status, "payment_method": "bank_transfer" if paid_date else None,
+                   "created_at": invoice_date, "updated_at": paid_date or invoice_date,
+                   "deleted_at": None}
+
+    tables = [
+        (Supplier.__table__, suppliers),
+        (Part.__table__, parts),
+        (Build.__table__, builds),
+        (build_parts, bill_of_materials),
+        (Customer.__table__, customers),
+        (Delivery.__table__, deliveries),
+        (Invoice.__table__, invoices),
+    ]
+    counts: Dict[str, int] = {}
+    for table, rows in tables:
+        started = time.perf_counter()
+        counts[table.name] = 0
+        with engine.begin() as conn:
+            use_copy = conn.dialect.name == "postgresql"
+            for batch in _batches(rows(), BATCH_SIZE):
+                if use_copy:
+                    _copy(conn, table, batch)
+                else:
+                    conn.execute(insert(table), batch)
+                counts[table.name] += len(batch)
+        elapsed = time.perf_counter() - started
+        out(f"  {table.name:<12} {counts[table.name]:>10,} rows in {elapsed:6.1f} s "
+            f"({counts[table.name] / elapsed:,.0f} rows/s)")
+
+    with Session(engine) as db:
+        revenue_rollups.rebuild(db)
+        part_specs.rebuild(db)
+        db.commit()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    return counts
@@ -0,0 +1,136 @@
+"""Measure worker cold start with and without ``FAST_START``.
+
+Each run starts a fresh interpreter that imports ``main``, runs the
+start-up events and sends its first requests. It reports, as medians over
+``--runs``:
+
+* ``import``: importing ``main`` (routers, schemas, models)
+* ``ready``: process spawn until start-up events have finished
+* ``first_api``: first request to an API router (in fast-start mode this
+  includes importing that router)
+* ``openapi``: first ``/openapi.json`` (cached on disk in fast-start mode)
+* ``total``: wall time of the whole process as seen from outside
+
+Fast-start runs share a temporary OpenAPI cache that is warmed before
+measuring, like after the first worker of a deploy. ``--profile`` adds a
+start-up profile: the modules that take longest to import, from
+``python -X importtime``.
+
+    python -m benchmarks.cold_start --runs 5 --profile
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+PROBE = """
+import json, os, time
+spawned = float(os.environ["COLD_START_SPAWNED"])
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    ready = time.perf_counter()
+    ready_since_spawn = time.time() - spawned
+    client.get(main.settings.API_PREFIX + "/parts/")
+    first_api = time.perf_counter()
+    client.get(main.app.openapi_url)
+    openapi = time.perf_counter()
+print(json.dumps({
+    "import": imported - started,
+    "ready": ready_since_spawn,
+    "first_api": first_api - ready,
+    "openapi": openapi - first_api,
+}))
+"""
+
+def _env(fast_start: bool, cache_dir: str) -> Dict[str, str]:
+    return {
+        **os.environ,
+        "FAST_START": str(fast_start),
+        "OPENAPI_CACHE_DIR": cache_dir,
+        "SCHEDULER_ENABLED": "False",
+    }
+
+
+def _probe(env: Dict[str, str]) -> Dict[str, float]:
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=BACKEND_DIR, env={**env, "COLD_START_SPAWNED": str(time.time())},
+        capture_output=True, text=True, check=True,
+    )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["total"] = time.perf_counter() - started
+    return timings
+
+
+def measure(fast_start: bool, runs: int, cache_dir: str) -> Dict[str, float]:
+    """Median timings (seconds) over several fresh processes."""
+    env = _env(fast_start, cache_dir)
+    _probe(env)  # warm the OS file cache, bytecode and (in fast-start mode) the OpenAPI cache
+    samples: List[Dict[str, float]] = [_probe(env) for _ in range(runs)]
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def import_profile(fast_start: bool, cache_dir: str, top: int) -> List[Tuple[str, float, float]]:
+    """Slowest imports of ``main``: (module, cumulative ms, self ms)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"], cwd=BACKEND_DIR,
+        env=_env(fast_start, cache_dir), capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if own.strip().isdigit():
+            modules.append((name.strip(), int(cumulative) / 1000, int(own) / 1000))
+    return sorted(modules, key=lambda module: module[1], reverse=True)[:top]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Processes per mode")
+    parser.add_argument("--profile", action="store_true", help="Show the slowest imports")
+    parser.add_argument("--top", type=int, default=25, help="Modules in the import profile")
+    parser.add_argument("--output", type=Path, help="Save the medians as JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        results = {
+            "standard": measure(False, args.runs, cache_dir),
+            "fast_start": measure(True, args.runs, cache_dir),
+        }
+
+        keys = ["import", "ready", "first_api", "openapi", "total"]
+        print(f"{'mode':<12}" + "".join(f"{key:>11}" for key in keys))
+        for mode, timings in results.items():
+            print(f"{mode:<12}" + "".join(f"{timings[key] * 1000:>9.0f}ms" for key in keys))
+        saved = results["standard"]["ready"] - results["fast_start"]["ready"]
+        print(f"\nFast start is ready {saved * 1000:.0f} ms "
+              f"({saved / results['standard']['ready'] * 100:.0f} %) sooner")
+
+        if args.profile:
+            for mode, fast_start in (("standard", False), ("fast_start", True)):
+                print(f"\nSlowest imports ({mode}):")
+                print(f"  {'cumulative':>10} {'self':>8}  module")
+                for name, cumulative, own in import_profile(fast_start, cache_dir, args.top):
+                    print(f"  {cumulative:>8.1f}ms {own:>6.1f}ms  {name}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,194 @@
+"""Show how the soft-delete list indexes change list-endpoint query plans.
+
+Seeds synthetic rows (a share of them soft-deleted), then runs the exact
+WHERE/ORDER BY/LIMIT of every list endpoint twice: once with the
+``*_live_*`` partial indexes dropped and once with them in place. For each
+query it prints the plan (``EXPLAIN`` on PostgreSQL, ``EXPLAIN QUERY PLAN``
+on SQLite) and the median execution time.
+
+Everything happens inside one transaction that is rolled back, so the
+database is left unchanged. Dropping indexes takes exclusive locks on
+PostgreSQL though, so run this against a development or staging database:
+
+    python -m benchmarks.list_query_plans --rows 50000
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.engine import Connection
+
+import app.models  # noqa: F401  (register all mappers)
+from app.db import Base, engine
+from app.models.build import Build
+from app.models.customer import Customer
+from app.models.delivery import Delivery
+from app.models.invoice import Invoice
+from app.models.part import Part
+from app.models.supplier import Supplier
+
+CATEGORIES = ["Electronics", "Mechanical", "Hotend", "Frame", "Motion", "Misc"]
+STATUSES = ["draft", "sent", "paid", "overdue", "cancelled"]
+DELIVERY_STATUSES = ["pending", "shipped", "in_transit", "delivered"]
+BUILD_STATUSES = ["draft", "active", "archived"]
+CUSTOMER_TYPES = ["business", "private"]
+DELETED_SHARE = 0.2
+PAGE_SIZE = 50
+
+
+def _live_indexes():
+    """All partial ``deleted_at IS NULL`` list indexes declared on the models."""
+    return [
+        index
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+        if "_live_" in index.name
+    ]
+
+
+def _seed(conn: Connection, rows: int, rng: random.Random) -> Dict[str, List[uuid.UUID]]:
+    """Bulk-insert synthetic rows into every list table."""
+    now = datetime.now(timezone.utc)
+
+    def stamp() -> Dict[str, object]:
+        created = now - timedelta(seconds=rng.randrange(365 * 86400))
+        deleted = created if rng.random() < DELETED_SHARE else None
+        return {"created_at": created, "updated_at": created, "deleted_at": deleted}
+
+    def words() -> str:
+        return f"{rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{rng.randrange(10 ** 8):08d}"
+
+    customer_ids = [uuid.uuid4() for _ in range(max(rows // 10, 1))]
+    conn.execute(insert(Customer), [
+        {"id": cid, "name": words(), "customer_type": rng.choice(CUSTOMER_TYPES),
+         "is_active": True, **stamp()}
+        for cid in customer_ids
+    ])
+    conn.execute(insert(Supplier), [
+        {"name": words(), "is_active": True, **stamp()} for _ in range(rows // 10 or 1)
+    ])
+    run_id = uuid.uuid4().hex[:8]
+    conn.execute(insert(Part), [
+        {"sku": f"BENCH-{run_id}-{n}", "name": words(), "category": rng.choice(CATEGORIES),
+         "current_stock": rng.randrange(100), "minimum_stock": rng.randrange(20), **stamp()}
+        for n in range(rows)
+    ])
+    conn.execute(insert(Build), [
+        {"name": words(), "status": rng.choice(BUILD_STATUSES), "is_active": True, **stamp()}
+        for _ in range(rows // 10 or 1)
+    ])
+    conn.execute(insert(Delivery), [
+        {"delivery_number": f"BENCH-{run_id}-{n}", "customer_id": rng.choice(customer_ids),
+         "status": rng.choice(DELIVERY_STATUSES), **stamp()}
+        for n in range(rows)
+    ])
+    conn.execute(insert(Invoice), [
+        {"invoice_number": f"BENCH-{run_id}-{n}", "customer_id": rng.choice(customer_ids),
+         "due_date": now, "invoice_date": now, "subtotal": 100, "tax_rate": 19,
+         "tax_amount": 19, "total_amount": 119, "status": rng.choice(STATUSES), **stamp()}
+        for n in range(rows)
+    ])
+    return {"customer_ids": customer_ids}
+
+
+def _cases(customer_id: uuid.UUID) -> List[Tuple[str, object]]:
+    """The list-endpoint queries, with the routers' filters and sort order."""
+    def by_name(model, *criteria):
+        return (select(model.id).where(model.deleted_at.is_(None), *criteria)
+                .order_by(model.name, model.id).limit(PAGE_SIZE))
+
+    def newest(model, *criteria):
+        return (select(model.id).where(model.deleted_at.is_(None), *criteria)
+                .order_by(model.created_at.desc(), model.id.desc()).limit(PAGE_SIZE))
+
+    return [
+        ("parts", by_name(Part)),
+        ("parts?category", by_name(Part, Part.category == "Hotend")),
+        ("builds", by_name(Build)),
+        ("builds?status", by_name(Build, Build.status == "active")),
+        ("customers", by_name(Customer)),
+        ("customers?customer_type", by_name(Customer, Customer.customer_type == "business")),
+        ("suppliers", by_name(Supplier)),
+        ("deliveries", newest(Delivery)),
+        ("deliveries?status", newest(Delivery, Delivery.status == "shipped")),
+        ("deliveries?customer_id", newest(Delivery, Delivery.customer_id == customer_id)),
+        ("invoices", newest(Invoice)),
+        ("invoices?status", newest(Invoice, Invoice.status == "sent")),
+        ("invoices?customer_id", newest(Invoice, Invoice.customer_id == customer_id)),
+    ]
+
+
+def _explain(conn: Connection, query) -> str:
+    """Return a one-line plan summary for a query."""
+    if conn.dialect.name == "postgresql":
+        lines = conn.exec_driver_sql(
+            "EXPLAIN " + str(query.compile(conn, compile_kwargs={"literal_binds": True}))
+        ).scalars().all()
+        return " / ".join(line.strip() for line in lines[:3])
+    rows = conn.exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + str(query.compile(conn, compile_kwargs={"literal_binds": True}))
+    ).all()
+    return " / ".join(row[-1] for row in rows)
+
+
+def _time(conn: Connection, query, repeat: int) -> float:
+    """Median wall time of a query in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(query).all()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def _measure(conn: Connection, cases, repeat: int) -> Dict[str, Tuple[str, float]]:
+    conn.exec_driver_sql("ANALYZE")
+    return {name: (_explain(conn, query), _time(conn, query, repeat)) for name, query in cases}
+
+
+def run(rows: int, repeat: int, seed: int, out: Callable[[str], None] = print) -> None:
+    """Seed, measure without and with the live indexes, then roll back."""
+    rng = random.Random(seed)
+    indexes = _live_indexes()
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            out(f"Seeding {rows} rows per table ({conn.dialect.name}) ...")
+            seeded = _seed(conn, rows, rng)
+            cases = _cases(seeded["customer_ids"][0])
+
+            for index in indexes:
+                index.drop(conn, checkfirst=True)
+            without = _measure(conn, cases, repeat)
+            for index in indexes:
+                index.create(conn)
+            with_indexes = _measure(conn, cases, repeat)
+        finally:
+            transaction.rollback()
+
+    for name, _ in cases:
+        plan_before, ms_before = without[name]
+        plan_after, ms_after = with_indexes[name]
+        out(f"\n{name}: {ms_before:.2f} ms -> {ms_after:.2f} ms")
+        out(f"  without: {plan_before}")
+        out(f"  with:    {plan_after}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=20000, help="Rows per large table")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per query")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args(argv)
+    run(args.rows, args.repeat, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
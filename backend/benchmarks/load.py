@@ -0,0 +1,338 @@
+"""Load test every router of a running API and record latency percentiles.
+
+Seeds the configured database with ``app.services.synthetic_data`` when
+it is empty, creates a ``loadtest@example.com`` superuser, then lets
+``--concurrency`` client threads send a weighted mix of requests
+(reads of every router plus some writes) to ``--base-url`` for
+``--duration`` seconds. For each scenario it reports p50/p95/p99 latency,
+throughput, errors and SQL queries per request (taken from the
+``Server-Timing`` header), and saves everything as JSON:
+
+    uvicorn main:app --workers 4 &
+    python -m benchmarks.load --scale 0.1 --concurrency 16 --duration 60
+    python -m benchmarks.load --compare benchmarks/results/<previous>.json
+
+Point ``DATABASE_URL`` at a dedicated benchmark database: the seed and
+the write scenarios change its contents.
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import func, select
+
+import app.models  # noqa: F401  (register all mappers)
+from app.core.config import settings
+from app.core.security import hash_password
+from app.db import SessionLocal, engine
+from app.models.build import Build
+from app.models.customer import Customer
+from app.models.delivery import Delivery
+from app.models.invoice import Invoice
+from app.models.part import Part
+from app.models.supplier import Supplier
+from app.models.user import User
+from app.services import synthetic_data
+
+USER_EMAIL = "loadtest@example.com"
+USER_PASSWORD = "loadtest-password"
+SAMPLE_IDS = 1000
+RESULTS_DIR = Path(__file__).parent / "results"
+
+SERVER_TIMING_QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+API = settings.API_PREFIX
+
+# (method, path, JSON body) for one request; IDs are drawn from the seeded data
+Request = Tuple[str, str, Optional[dict]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    weight: int
+    build: Callable[[random.Random, Dict[str, List[str]]], Request]
+
+
+def _get(path: str) -> Callable[[random.Random, Dict[str, List[str]]], Request]:
+    """Scenario builder for a GET; ``{table}`` placeholders take a random seeded ID."""
+    def build(rng: random.Random, ids: Dict[str, List[str]]) -> Request:
+        return "GET", path.format(**{table: rng.choice(values) for table, values in ids.items()}), None
+    return build
+
+
+def _create_customer(rng: random.Random, ids: Dict[str, List[str]]) -> Request:
+    return "POST", f"{API}/customers/", {
+        "name": f"Load test {rng.randrange(10 ** 9)}",
+        "customer_type": "private",
+    }
+
+
+def _adjust_stock(rng: random.Random, ids: Dict[str, List[str]]) -> Request:
+    return "PATCH", f"{API}/parts/{rng.choice(ids['parts'])}/stock", {
+        "quantity": rng.choice([-1, 1]) * rng.randint(1, 3),
+        "reason": "load test",
+    }
+
+
+def _bulk_documents(rng: random.Random, ids: Dict[str, List[str]]) -> Request:
+    # One recent day keeps each archive to a few dozen documents
+    day = date.today() - timedelta(days=rng.randrange(30))
+    kind = rng.choice(["invoice", "delivery_note"])
+    return "GET", f"{API}/documents/bulk?start={day}&end={day}&kind={kind}", None
+
+
+def _login(rng: random.Random, ids: Dict[str, List[str]]) -> Request:
+    return "LOGIN", f"{API}/auth/login", {"username": USER_EMAIL, "password": USER_PASSWORD}
+
+
+SCENARIOS = [
+    Scenario("auth.login", 1, _login),
+    Scenario("parts.list", 8, _get(f"{API}/parts/")),
+    Scenario("parts.list?category", 4, _get(f"{API}/parts/?category=Hotend")),
+    Scenario("parts.list?search", 2, _get(f"{API}/parts/?search=Motion")),
+    Scenario("parts.get", 8, _get(f"{API}/parts/{{parts}}")),
+    Scenario("parts.categories", 2, _get(f"{API}/parts/categories/list")),
+    Scenario("parts.adjust_stock", 2, _adjust_stock),
+    Scenario("suppliers.list", 3, _get(f"{API}/suppliers/")),
+    Scenario("suppliers.get", 2, _get(f"{API}/suppliers/{{suppliers}}")),
+    Scenario("customers.list", 6, _get(f"{API}/customers/")),
+    Scenario("customers.list?search", 2, _get(f"{API}/customers/?search=M%C3%BCller")),
+    Scenario("customers.get", 6, _get(f"{API}/customers/{{customers}}")),
+    Scenario("customers.create", 1, _create_customer),
+    Scenario("builds.list", 4, _get(f"{API}/builds/")),
+    Scenario("builds.get", 4, _get(f"{API}/builds/{{builds}}")),
+    Scenario("deliveries.list", 5, _get(f"{API}/deliveries/")),
+    Scenario("deliveries.list?customer_id", 3, _get(f"{API}/deliveries/?customer_id={{customers}}")),
+    Scenario("deliveries.get", 5, _get(f"{API}/deliveries/{{deliveries}}")),
+    Scenario("invoices.list", 6, _get(f"{API}/invoices/")),
+    Scenario("invoices.list?status", 3, _get(f"{API}/invoices/?status=overdue")),
+    Scenario("invoices.list?customer_id", 3, _get(f"{API}/invoices/?customer_id={{customers}}")),
+    Scenario("invoices.get", 6, _get(f"{API}/invoices/{{invoices}}")),
+    Scenario("invoices.pdf", 2, _get(f"{API}/invoices/{{invoices}}/pdf")),
+    Scenario("deliveries.pdf", 2, _get(f"{API}/deliveries/{{deliveries}}/pdf")),
+    Scenario("documents.bulk", 1, _bulk_documents),
+    Scenario("dashboard.summary", 4, _get(f"{API}/dashboard/summary")),
+    Scenario("reports.revenue", 2, _get(f"{API}/reports/revenue")),
+    Scenario("reports.aging", 2, _get(f"{API}/reports/aging")),
+    Scenario("jobs.runs", 1, _get(f"{API}/jobs/runs")),
+    Scenario("diagnostics.slow_queries", 1, _get(f"{API}/diagnostics/slow-queries")),
+]
+
+
+def _prepare(scale: float, seed: int, skip_seed: bool) -> Dict[str, List[str]]:
+    """Seed if needed, create the load test user and sample IDs to request."""
+    if not skip_seed and synthetic_data.is_empty(engine):
+        print(f"Seeding dataset (scale {scale}, seed {seed}) ...")
+        started = time.perf_counter()
+        counts = synthetic_data.generate(engine, scale=scale, seed=seed)
+        print(f"Seeded {sum(counts.values())} rows in {time.perf_counter() - started:.1f} s")
+
+    db = SessionLocal()
+    try:
+        if db.query(User).filter(User.email == USER_EMAIL).first() is None:
+            db.add(User(email=USER_EMAIL, hashed_password=hash_password(USER_PASSWORD),
+                        full_name="Load test", is_active=True, is_superuser=True))
+            db.commit()
+        ids = {}
+        for name, model in [("parts", Part), ("suppliers", Supplier), ("customers", Customer),
+                            ("builds", Build), ("deliveries", Delivery), ("invoices", Invoice)]:
+            ids[name] = [str(value) for value in db.execute(
+                select(model.id).where(model.deleted_at.is_(None)).order_by(func.random()).limit(SAMPLE_IDS)
+            ).scalars()]
+            if not ids[name]:
+                raise SystemExit(f"No {name} in the database; run without --skip-seed")
+        return ids
+    finally:
+        db.close()
+
+
+def _login_headers(client: httpx.Client) -> Dict[str, str]:
+    response = client.post(f"{API}/auth/login", data={"username": USER_EMAIL, "password": USER_PASSWORD})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(sorted_values)) - 1
+    return sorted_values[min(max(rank, 0), len(sorted_values) - 1)]
+
+
+def _summarize(samples: List[Tuple[float, bool, Optional[int]]], seconds: float) -> Dict[str, float]:
+    latencies = sorted(ms for ms, _, _ in samples)
+    queries = [count for _, _, count in samples if count is not None]
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for _, ok, _ in samples if not ok),
+        "throughput_rps": round(len(samples) / seconds, 2) if seconds else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "p50_ms": round(_percentile(latencies, 50), 2),
+        "p95_ms": round(_percentile(latencies, 95), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+    }
+
+
+def run_load(
+    base_url: str,
+    ids: Dict[str, List[str]],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+) -> Dict[str, object]:
+    """Drive the scenario mix with closed-loop client threads.
+
+    Args:
+        base_url: Server to test
+        ids: Seeded record IDs by table
+        concurrency: Number of client threads
+        duration: Measured seconds
+        warmup: Seconds of unmeasured traffic first
+        seed: Random seed for the scenario sequence
+
+    Returns:
+        Overall and per-scenario statistics
+    """
+    samples: Dict[str, List[Tuple[float, bool, Optional[int]]]] = {s.name: [] for s in SCENARIOS}
+    failures: Dict[str, str] = {}
+    lock = threading.Lock()
+    weights = [scenario.weight for scenario in SCENARIOS]
+    started = time.monotonic()
+    measure_from = started + warmup
+    stop_at = measure_from + duration
+
+    def client_thread(number: int) -> None:
+        rng = random.Random(seed * 1000 + number)
+        with httpx.Client(base_url=base_url, timeout=60) as client:
+            headers = _login_headers(client)
+            while time.monotonic() < stop_at:
+                scenario = rng.choices(SCENARIOS, weights)[0]
+                method, path, body = scenario.build(rng, ids)
+                sent = time.perf_counter()
+                try:
+                    if method == "LOGIN":
+                        response = client.post(path, data=body)
+                    else:
+                        response = client.request(method, path, json=body, headers=headers)
+                    ok = response.status_code < 400
+                    match = SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+                    queries = int(match.group(1)) if match else None
+                    error = None if ok else f"{response.status_code} {response.text[:200]}"
+                except httpx.HTTPError as exc:
+                    ok, queries, error = False, None, repr(exc)
+                elapsed_ms = (time.perf_counter() - sent) * 1000
+                if time.monotonic() >= measure_from:
+                    with lock:
+                        samples[scenario.name].append((elapsed_ms, ok, queries))
+                        if error and scenario.name not in failures:
+                            failures[scenario.name] = error
+
+    threads = [threading.Thread(target=client_thread, args=(n,)) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    measured = min(time.monotonic(), stop_at) - measure_from
+
+    everything = [sample for values in samples.values() for sample in values]
+    return {
+        "overall": _summarize(everything, measured),
+        "scenarios": {name: _summarize(values, measured) for name, values in samples.items() if values},
+        "first_errors": failures,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_report(result: Dict[str, object], baseline: Optional[Dict[str, object]] = None) -> None:
+    def delta(name: str, key: str, value: float) -> str:
+        if baseline is None:
+            return ""
+        before = (baseline["overall"] if name == "overall"
+                  else baseline["scenarios"].get(name, {})).get(key)
+        if not before:
+            return "        "
+        return f" ({(value - before) / before * 100:+5.0f}%)"
+
+    header = f"{'scenario':<30} {'reqs':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'q/req':>6}"
+    print(header)
+    print("-" * len(header))
+    rows = [("overall", result["overall"]), *sorted(result["scenarios"].items())]
+    for name, stats in rows:
+        qpr = stats["queries_per_request"]
+        print(f"{name:<30} {stats['requests']:>7} {stats['errors']:>5} {stats['throughput_rps']:>8.1f} "
+              f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f}{delta(name, 'p95_ms', stats['p95_ms'])} "
+              f"{stats['p99_ms']:>8.1f} {qpr if qpr is not None else '-':>6}")
+    for name, error in result["first_errors"].items():
+        print(f"! {name}: {error}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default=f"http://{settings.API_HOST}:{settings.API_PORT}",
+                        help="Server to test")
+    parser.add_argument("--concurrency", type=int, default=8, help="Client threads")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds first")
+    parser.add_argument("--scale", type=float, default=0.1, help="Dataset size (1.0 = 500k invoices)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for data and requests")
+    parser.add_argument("--skip-seed", action="store_true", help="Use the data already in the database")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/...)")
+    parser.add_argument("--compare", type=Path, help="Earlier result file to compare p95 against")
+    args = parser.parse_args(argv)
+
+    base_url = args.base_url.replace("0.0.0.0", "127.0.0.1")
+    ids = _prepare(args.scale, args.seed, args.skip_seed)
+    print(f"Running {args.concurrency} clients against {base_url} for {args.duration:.0f} s "
+          f"(+{args.warmup:.0f} s warm-up) ...")
+    result = run_load(base_url, ids, args.concurrency, args.duration, args.warmup, args.seed)
+
+    commit = _git_commit()
+    result = {
+        "meta": {
+            "commit": commit,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "base_url": base_url,
+            "database": engine.dialect.name,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "scale": args.scale,
+            "seed": args.seed,
+        },
+        **result,
+    }
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    _print_report(result, baseline)
+
+    output = args.output or RESULTS_DIR / f"{date.today():%Y%m%d}-{commit or 'local'}-c{args.concurrency}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"\nSaved {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
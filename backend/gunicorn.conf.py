@@ -0,0 +1,54 @@
+"""Gunicorn configuration for running the API in production.
+
+    gunicorn -c gunicorn.conf.py main:app
+
+Gunicorn supervises ``SERVER_WORKERS`` uvicorn worker processes. With
+``SERVER_PRELOAD`` the application is imported once in the master and
+forked, so workers start quickly and share memory. On SIGTERM (or SIGHUP
+for a rolling reload) workers stop accepting connections and get
+``SERVER_GRACEFUL_TIMEOUT_SECONDS`` to finish in-flight requests and run
+their shutdown events. Take a worker out of the load balancer first by
+probing ``/health/ready``.
+"""
+
+import glob
+import multiprocessing
+import os
+
+from app.core.config import settings
+
+bind = f"{settings.API_HOST}:{settings.API_PORT}"
+workers = settings.SERVER_WORKERS or multiprocessing.cpu_count()
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = settings.SERVER_PRELOAD
+keepalive = settings.SERVER_KEEPALIVE_SECONDS
+graceful_timeout = settings.SERVER_GRACEFUL_TIMEOUT_SECONDS
+timeout = settings.SERVER_TIMEOUT_SECONDS
+accesslog = "-"
+
+
+def on_starting(server):
+    """Empty the shared metrics directory left by a previous run."""
+    if settings.METRICS_MULTIPROC_DIR:
+        for path in glob.glob(os.path.join(settings.METRICS_MULTIPROC_DIR, "*.db")):
+            os.remove(path)
+
+
+def post_fork(server, worker):
+    """Give each worker its own database connections."""
+    if preload_app:
+        from app.db import engine, read_engine, replicas
+
+        # Connections opened in the master must not be shared across processes
+        engines = [engine, read_engine, *(replica.engine for replica in replicas.replicas)]
+        for each in engines:
+            if each is not None:
+                each.dispose(close=False)
+
+
+def child_exit(server, worker):
+    """Drop an exited worker's live gauges, also after a crash."""
+    if settings.METRICS_ENABLED:
+        from app.core import metrics
+
+        metrics.mark_process_dead(worker.pid)
@@ -1,15 +1,19 @@
 """Main FastAPI application entry point."""
 
-from fastapi import FastAPI
+import importlib
+
+import anyio.to_thread
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.api.auth import router as auth_router
-from app.api.parts import router as parts_router
-from app.api.suppliers import router as suppliers_router
-from app.api.customers import router as customers_router
-from app.api.builds import router as builds_router
-from app.api.deliveries import router as deliveries_router
-from app.api.invoices import router as invoices_router
+from app.core import fast_start, health, metrics
+from app.core.admission import AdmissionMiddleware
+from app.core.instrumentation import SQLInstrumentationMiddleware
+from app.core.profiling import ProfilingMiddleware
+from app.db import replicas
+from app.services import documents, slow_queries
+from app.services.jobs import register_jobs
+from app.services.scheduler import scheduler
 
 # Create FastAPI application
 app = FastAPI(
@@ -20,6 +24,16 @@ app = FastAPI(
     redoc_url="/redoc" if settings.DEBUG else None,
 )
 
+# On-demand and sampled request profiles (innermost, so CORS headers are
+# added to a returned profile as well)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Per route group concurrency limits; overflow gets a fast 503 (inside CORS,
+# so browsers can read the response)
+if settings.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(AdmissionMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -27,8 +41,59 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Profile-Id", "X-Profile-Status", "X-Primary-Until"],
 )
 
+# Read-your-writes across worker processes when reading from replicas
+if replicas.replicas:
+    app.add_middleware(replicas.StickinessMiddleware)
+
+# Per-request SQL statistics (Server-Timing header, N+1 warnings)
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    app.add_middleware(SQLInstrumentationMiddleware)
+
+# Request latency and in-flight metrics (outermost, so it times everything)
+if settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+
+# Record statements slower than SLOW_QUERY_THRESHOLD_MS
+slow_queries.install()
+
+
+# Register background jobs
+register_jobs(scheduler)
+
+
+@app.on_event("startup")
+async def configure_threadpool():
+    """Size the threadpool that runs sync handlers and dependencies."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
+
+@app.on_event("startup")
+def start_scheduler():
+    """Start background jobs in this worker process."""
+    if settings.SCHEDULER_ENABLED:
+        scheduler.start()
+
+
+@app.on_event("shutdown")
+def stop_scheduler():
+    """Stop background jobs, letting a running job finish its batch."""
+    scheduler.stop()
+
+
+@app.on_event("shutdown")
+def stop_document_renderer():
+    """Stop the PDF render worker processes."""
+    documents.shutdown_pool()
+
+
+@app.on_event("shutdown")
+def remove_worker_metrics():
+    """Drop this worker's live gauges from the shared metrics directory."""
+    metrics.mark_process_dead()
+
 
 # Health check endpoint
 @app.get("/health")
@@ -41,6 +106,28 @@ def health_check():
     }
 
 
+# Readiness probe for load balancers and deploys
+@app.get("/health/ready")
+def readiness_check(response: Response):
+    """Readiness check: database reachable and a pooled connection free.
+
+    Returns 503 while the worker should not receive traffic.
+    """
+    result = health.readiness()
+    if not result["ready"]:
+        response.status_code = 503
+    return result
+
+
+# Prometheus scrape endpoint
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics():
+        """Prometheus metrics in the text exposition format."""
+        body, content_type = metrics.render()
+        return Response(content=body, media_type=content_type)
+
+
 # Root endpoint
 @app.get("/")
 def root():
@@ -52,17 +139,34 @@ def root():
     }
 
 
-# Include routers
-app.include_router(auth_router, prefix=settings.API_PREFIX)
-app.include_router(parts_router, prefix=settings.API_PREFIX)
-app.include_router(suppliers_router, prefix=settings.API_PREFIX)
-app.include_router(customers_router, prefix=settings.API_PREFIX)
-app.include_router(builds_router, prefix=settings.API_PREFIX)
-app.include_router(deliveries_router, prefix=settings.API_PREFIX)
-app.include_router(invoices_router, prefix=settings.API_PREFIX)
+# API routers: (module, prefix of its APIRouter)
+ROUTERS = [
+    ("app.api.auth", "/auth"),
+    ("app.api.parts", "/parts"),
+    ("app.api.suppliers", "/suppliers"),
+    ("app.api.customers", "/customers"),
+    ("app.api.builds", "/builds"),
+    ("app.api.deliveries", "/deliveries"),
+    ("app.api.invoices", "/invoices"),
+    ("app.api.dashboard", "/dashboard"),
+    ("app.api.reports", "/reports"),
+    ("app.api.jobs", "/jobs"),
+    ("app.api.documents", "/documents"),
+    ("app.api.archive", "/archive"),
+    ("app.api.diagnostics", "/diagnostics"),
+]
+
+# Include routers; in fast-start mode each is imported on its first request
+if settings.FAST_START:
+    fast_start.include_lazy_routers(app, ROUTERS, prefix=settings.API_PREFIX)
+    fast_start.cache_openapi(app)
+else:
+    for module, _ in ROUTERS:
+        app.include_router(importlib.import_module(module).router, prefix=settings.API_PREFIX)
 
 
 if __name__ == "__main__":
+    # Single-process development server; use gunicorn.conf.py in production
     import uvicorn
     uvicorn.run(
         "main:app",
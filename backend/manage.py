@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Management commands for maintenance tasks.
+
+Usage:
+    python manage.py rebuild-rollups
+    python manage.py run-job invoice_dunning
+    python manage.py billing-run --start 2026-09-01 --end 2026-09-30
+    python manage.py generate-data --scale 10 --seed 42
+"""
+
+import argparse
+import sys
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import app.models  # noqa: F401  (register all mappers)
+from app.db import SessionLocal
+
+
+def rebuild_rollups(args: argparse.Namespace) -> int:
+    """Recompute the revenue rollup tables from invoices."""
+    from app.services import revenue_rollups
+
+    db = SessionLocal()
+    try:
+        revenue_rollups.rebuild(db)
+        db.commit()
+    finally:
+        db.close()
+    print("✓ Revenue rollups rebuilt")
+    return 0
+
+
+def run_job(args: argparse.Namespace) -> int:
+    """Run a registered background job once, outside the scheduler loop."""
+    from app.services.jobs import register_jobs
+    from app.services.scheduler import run_job as execute_job, scheduler
+
+    register_jobs(scheduler)
+    try:
+        job = scheduler.get_job(args.name)
+    except KeyError:
+        names = ", ".join(job.name for job in scheduler.jobs)
+        print(f"✗ Unknown job '{args.name}'. Available: {names}")
+        return 1
+
+    run = execute_job(job)
+    if run is None:
+        print(f"✗ Job '{job.name}' is locked by another worker")
+        return 1
+    print(f"{'✓' if run.status == 'success' else '✗'} {job.name}: {run.status} "
+          f"in {run.duration_ms} ms {run.stats or ''}")
+    return 0 if run.status == "success" else 1
+
+
+def billing_run(args: argparse.Namespace) -> int:
+    """Invoice delivered deliveries in a date range in one transaction."""
+    from app.services.billing import run_billing
+
+    db = SessionLocal()
+    try:
+        result = run_billing(
+            db,
+            args.start,
+            args.end,
+            due_in_days=args.due_in_days,
+            tax_rate=args.tax_rate,
+            dry_run=args.dry_run,
+        )
+    finally:
+        db.close()
+
+    numbers = result["invoice_numbers"]
+    verb = "Would create" if result["dry_run"] else "Created"
+    print(f"✓ {verb} {len(numbers)} invoices"
+          + (f" ({numbers[0]} … {numbers[-1]})" if numbers else ""))
+    print(f"  Subtotal {result['subtotal']:.2f}, tax {result['tax_amount']:.2f}, "
+          f"total {result['total_amount']:.2f}")
+    print(f"  Skipped {result['skipped_already_billed']} already billed")
+    if result["skipped_unpriced"]:
+        print(f"  Skipped without price: {', '.join(result['skipped_unpriced'])}")
+    return 0
+
+
+def generate_data(args: argparse.Namespace) -> int:
+    """Bulk-load a deterministic synthetic dataset, bypassing the API."""
+    from app.db import engine
+    from app.services import synthetic_data
+
+    if not synthetic_data.is_empty(engine):
+        print("✗ The database already contains parts; generate into an empty database")
+        return 1
+
+    sizes = synthetic_data.scaled_sizes(args.scale)
+    print(f"Generating {sizes['invoices']:,} invoices and related rows (scale {args.scale}, seed {args.seed}) "
+          f"into {engine.dialect.name} ...")
+    anchor = (datetime.combine(args.anchor, datetime.min.time(), tzinfo=timezone.utc)
+              if args.anchor else None)
+    counts = synthetic_data.generate(engine, scale=args.scale, seed=args.seed, anchor=anchor)
+    print(f"✓ Generated {sum(counts.values()):,} rows")
+    return 0
+
+
+def main(argv=None) -> int:
+    """Parse arguments and dispatch to a command."""
+    parser = argparse.ArgumentParser(description="GM-TC CRM management commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser(
+        "rebuild-rollups", help="Recompute revenue rollup tables"
+    ).set_defaults(func=rebuild_rollups)
+
+    job_parser = commands.add_parser("run-job", help="Run a background job once")
+    job_parser.add_argument("name", help="Job name, e.g. invoice_dunning")
+    job_parser.set_defaults(func=run_job)
+
+    billing_parser = commands.add_parser(
+        "billing-run", help="Create invoices for delivered deliveries"
+    )
+    billing_parser.add_argument("--start", type=date.fromisoformat, required=True,
+                                help="First delivery day, YYYY-MM-DD")
+    billing_parser.add_argument("--end", type=date.fromisoformat, required=True,
+                                help="Last delivery day, YYYY-MM-DD")
+    billing_parser.add_argument("--due-in-days", type=int, default=14,
+                                help="Payment term in days (default 14)")
+    billing_parser.add_argument("--tax-rate", type=Decimal, default=Decimal("19.0"),
+                                help="VAT percentage (default 19)")
+    billing_parser.add_argument("--dry-run", action="store_true",
+                                help="Show what would be invoiced without writing")
+    billing_parser.set_defaults(func=billing_run)
+
+    generate_parser = commands.add_parser(
+        "generate-data", help="Bulk-load deterministic synthetic data for scale tests"
+    )
+    generate_parser.add_argument("--scale", type=float, default=1.0,
+                                 help="Multiple of the base size (1.0 = 100k parts, 500k invoices)")
+    generate_parser.add_argument("--seed", type=int, default=1,
+                                 help="Random seed; the same seed and anchor give the same data")
+    generate_parser.add_argument("--anchor", type=date.fromisoformat,
+                                 help="Newest date of the generated history, YYYY-MM-DD (default today)")
+    generate_parser.set_defaults(func=generate_data)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
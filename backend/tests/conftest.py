@@ -0,0 +1,93 @@
+"""Shared fixtures: the API on a throwaway SQLite database.
+
+The environment is set before anything from ``app`` is imported, since
+settings and engines are created at import time.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+_DATABASE_DIR = tempfile.mkdtemp(prefix="erp-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DATABASE_DIR}/test.db"
+os.environ["DEBUG"] = "False"
+os.environ["SCHEDULER_ENABLED"] = "False"
+os.environ["DOCUMENT_CACHE_DIR"] = f"{_DATABASE_DIR}/documents"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.core.cache import cache  # noqa: E402
+from app.core.instrumentation import QueryStats, capture_queries  # noqa: E402
+from app.db import Base, engine  # noqa: E402
+from main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Create the schema once for the whole run."""
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clean_tables(database):
+    """Empty every table except users and drop cached values after each test."""
+    yield
+    with database.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            if table.name != "users":
+                connection.execute(table.delete())
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    """Client for the application (startup hooks, e.g. the scheduler, do not run)."""
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client: TestClient) -> dict:
+    """Authorization header of a registered test user."""
+    credentials = {"email": "tester@example.com", "password": "password123"}
+    client.post("/api/v1/auth/register", json=credentials)
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": credentials["email"], "password": credentials["password"]},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def query_budget():
+    """Fail a test when a block of code runs too many SQL statements.
+
+    Usage::
+
+        def test_list_parts(client, auth_headers, query_budget):
+            with query_budget(3):
+                client.get("/api/v1/parts/", headers=auth_headers)
+
+    Probable N+1 queries fail the test as well unless
+    ``allow_n_plus_one=True`` is passed.
+    """
+
+    @contextmanager
+    def budget(max_queries: int, allow_n_plus_one: bool = False) -> Iterator[QueryStats]:
+        with capture_queries() as stats:
+            yield stats
+        statements = "\n".join(" ".join(s.split()) for s in stats.executions)
+        assert stats.count <= max_queries, (
+            f"{stats.count} queries executed, budget is {max_queries}:\n{statements}"
+        )
+        if not allow_n_plus_one:
+            suspects = stats.n_plus_one()
+            assert not suspects, "Probable N+1 queries:\n" + "\n".join(
+                f"{repeats}x {' '.join(statement.split())}" for statement, repeats in suspects
+            )
+
+    return budget
@@ -0,0 +1,46 @@
+"""Versioned invalidation in the in-process cache."""
+
+from sqlalchemy import text
+
+from app.core.cache import TTLCache, cache
+from app.db import SessionLocal, cache_version
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    local = TTLCache()
+
+    def load():
+        local.invalidate("key")
+        return "stale"
+
+    assert local.get_or_set("key", load, 60) == "stale"
+    assert local.get("key") is None
+
+
+def test_stamps_are_dropped_once_no_load_needs_them():
+    local = TTLCache()
+    held = local.hold_version()
+    for index in range(100):
+        local.invalidate(f"key:{index}")
+    local.invalidate_prefix("key:")
+    assert len(local._key_versions) == 100
+
+    local.release_version(held)
+    assert local._key_versions == {}
+    assert local._prefix_versions == {}
+
+
+def test_version_is_held_from_the_start_of_the_transaction(database):
+    with SessionLocal() as db:
+        db.execute(text("SELECT 1"))
+        version = cache_version(db)
+        assert version is not None
+
+        # Written and invalidated after this transaction's snapshot began
+        cache.invalidate("test:key")
+        assert cache.get_or_set("test:key", lambda: "stale", 60, version=version) == "stale"
+        assert cache.get("test:key") is None
+
+        db.commit()
+        assert cache_version(db) is None
+    assert "test:key" not in cache._key_versions
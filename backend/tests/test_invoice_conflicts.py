@@ -0,0 +1,40 @@
+"""Integrity errors raised while writing invoices."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+
+@pytest.fixture
+def delivery(client, auth_headers):
+    customer = client.post("/api/v1/customers/", json={"name": "Customer"}, headers=auth_headers).json()
+    return client.post(
+        "/api/v1/deliveries/", json={"customer_id": customer["id"]}, headers=auth_headers
+    ).json()
+
+
+def _invoice(client, auth_headers, delivery):
+    return client.post("/api/v1/invoices/", json={
+        "customer_id": delivery["customer_id"],
+        "delivery_id": delivery["id"],
+        "due_date": "2030-01-01T00:00:00Z",
+        "subtotal": "100.00",
+    }, headers=auth_headers)
+
+
+def test_second_invoice_for_delivery_conflicts(client, auth_headers, delivery):
+    assert _invoice(client, auth_headers, delivery).status_code == 201
+
+    response = _invoice(client, auth_headers, delivery)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Delivery already has an invoice"
+
+
+def test_other_integrity_errors_are_not_conflicts(client, auth_headers, delivery):
+    invoice = _invoice(client, auth_headers, delivery).json()
+
+    with pytest.raises(IntegrityError, match="FOREIGN KEY"):
+        client.patch(
+            f"/api/v1/invoices/{invoice['id']}", json={"customer_id": str(uuid4())}, headers=auth_headers
+        )
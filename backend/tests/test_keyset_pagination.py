@@ -0,0 +1,47 @@
+"""Keyset (``after`` cursor) pagination of invoices and deliveries."""
+
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.fixture
+def invoice_ids(client, auth_headers):
+    """IDs of five invoices, newest first."""
+    customer = client.post("/api/v1/customers/", json={"name": "Customer"}, headers=auth_headers).json()
+    for _ in range(5):
+        client.post("/api/v1/invoices/", json={
+            "customer_id": customer["id"],
+            "due_date": "2030-01-01T00:00:00Z",
+            "subtotal": "10.00",
+        }, headers=auth_headers)
+    items = client.get("/api/v1/invoices/", headers=auth_headers).json()["items"]
+    return [item["id"] for item in items]
+
+
+def test_pages_follow_the_cursor(client, auth_headers, invoice_ids):
+    first = client.get("/api/v1/invoices/?per_page=2", headers=auth_headers).json()
+    second = client.get(
+        f"/api/v1/invoices/?per_page=2&after={first['items'][-1]['id']}", headers=auth_headers
+    ).json()
+    assert [item["id"] for item in first["items"] + second["items"]] == invoice_ids[:4]
+    assert second["page"] is None and second["total_pages"] is None
+    assert second["total"] == 5
+
+
+def test_soft_deleted_cursor_keeps_its_position(client, auth_headers, invoice_ids):
+    client.delete(f"/api/v1/invoices/{invoice_ids[1]}", headers=auth_headers)
+    page = client.get(f"/api/v1/invoices/?after={invoice_ids[1]}", headers=auth_headers).json()
+    assert [item["id"] for item in page["items"]] == invoice_ids[2:]
+
+
+def test_last_page_is_empty(client, auth_headers, invoice_ids):
+    response = client.get(f"/api/v1/invoices/?after={invoice_ids[-1]}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+
+@pytest.mark.parametrize("path", ["invoices", "deliveries"])
+def test_unknown_cursor_is_rejected(client, auth_headers, path):
+    response = client.get(f"/api/v1/{path}/?after={uuid4()}", headers=auth_headers)
+    assert response.status_code == 400
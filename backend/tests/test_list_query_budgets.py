@@ -0,0 +1,47 @@
+"""Query budgets of the list endpoints.
+
+Each list is filled with several related records first, so a relationship
+loaded per row shows up as an N+1 pattern rather than a single query.
+"""
+
+import pytest
+
+# Enough rows for a per-row query to reach SQL_N_PLUS_ONE_THRESHOLD
+ROWS = 5
+
+
+@pytest.fixture
+def catalog(client, auth_headers):
+    """A few customers, suppliers, parts, builds, deliveries and invoices."""
+    def post(path, body):
+        return client.post(f"/api/v1/{path}/", json=body, headers=auth_headers).json()
+
+    for index in range(ROWS):
+        customer = post("customers", {"name": f"Customer {index}"})
+        post("suppliers", {"name": f"Supplier {index}"})
+        post("parts", {"sku": f"SKU-{index}", "name": f"Part {index}", "category": "bolts"})
+        build = post("builds", {"name": f"Build {index}", "base_price": "50.00"})
+        delivery = post("deliveries", {"customer_id": customer["id"], "build_id": build["id"]})
+        post("invoices", {
+            "customer_id": customer["id"],
+            "delivery_id": delivery["id"],
+            "due_date": "2030-01-01T00:00:00Z",
+            "subtotal": "100.00",
+        })
+
+
+# Statements per request, counting BEGIN and the current-user lookup
+@pytest.mark.parametrize("path, max_queries", [
+    ("parts", 4),
+    ("parts?category=bolts&low_stock_only=true", 4),
+    ("parts/facets", 3),
+    ("builds", 6),
+    ("customers", 4),
+    ("suppliers", 4),
+    ("deliveries", 7),
+    ("invoices", 9),
+])
+def test_list_query_budget(client, auth_headers, catalog, query_budget, path, max_queries):
+    with query_budget(max_queries):
+        response = client.get(f"/api/v1/{path}", headers=auth_headers)
+    assert response.status_code == 200
@@ -0,0 +1,21 @@
+"""Nearest-rank percentiles reported by the load suite."""
+
+import pytest
+
+from benchmarks.load import _percentile
+
+
+@pytest.mark.parametrize("count, percent, expected", [
+    (100, 50, 50),
+    (100, 95, 95),
+    (100, 99, 99),
+    (100, 100, 100),
+    (20, 95, 19),
+    (1, 99, 1),
+])
+def test_nearest_rank(count, percent, expected):
+    assert _percentile([float(value) for value in range(1, count + 1)], percent) == expected
+
+
+def test_empty():
+    assert _percentile([], 95) == 0.0
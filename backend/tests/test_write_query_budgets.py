@@ -0,0 +1,113 @@
+"""Statements per create and update request.
+
+Written rows are returned from the session (server defaults come back with
+``RETURNING``), so no request reloads what it just wrote.
+"""
+
+import pytest
+
+
+def _reads_after_write(stats, table):
+    """SELECTs from ``table`` run after the first INSERT into or UPDATE of it."""
+    statements = [" ".join(statement.split()) for statement in stats.executions]
+    writes = [
+        index for index, statement in enumerate(statements)
+        if statement.startswith((f"INSERT INTO {table} ", f"UPDATE {table} "))
+    ]
+    assert writes, f"no write to {table}"
+    return [
+        statement for statement in statements[writes[0] + 1:]
+        if statement.startswith("SELECT") and f" FROM {table}" in statement
+    ]
+
+
+@pytest.fixture
+def customer(client, auth_headers):
+    return client.post("/api/v1/customers/", json={"name": "Customer"}, headers=auth_headers).json()
+
+
+@pytest.fixture
+def part(client, auth_headers):
+    return client.post(
+        "/api/v1/parts/", json={"sku": "SKU-1", "name": "Part", "category": "bolts"}, headers=auth_headers
+    ).json()
+
+
+@pytest.fixture
+def build(client, auth_headers):
+    return client.post("/api/v1/builds/", json={"name": "Build"}, headers=auth_headers).json()
+
+
+@pytest.fixture
+def invoice(client, auth_headers, customer):
+    return client.post("/api/v1/invoices/", json={
+        "customer_id": customer["id"],
+        "due_date": "2030-01-01T00:00:00Z",
+        "subtotal": "100.00",
+    }, headers=auth_headers).json()
+
+
+def test_create_part(client, auth_headers, query_budget):
+    with query_budget(6) as stats:
+        response = client.post("/api/v1/parts/", json={
+            "sku": "SKU-2", "name": "Part", "specifications": {"length_mm": 20},
+        }, headers=auth_headers)
+    assert response.status_code == 201
+    assert stats.count == 6
+    assert not _reads_after_write(stats, "parts")
+    assert response.json()["created_at"] is not None
+
+
+def test_update_part(client, auth_headers, part, query_budget):
+    with query_budget(5) as stats:
+        response = client.put(
+            f"/api/v1/parts/{part['id']}", json={"current_stock": 3}, headers=auth_headers
+        )
+    assert response.status_code == 200
+    assert stats.count == 5
+    assert not _reads_after_write(stats, "parts")
+    assert response.json()["current_stock"] == 3
+
+
+def test_create_build(client, auth_headers, query_budget):
+    with query_budget(4) as stats:
+        response = client.post("/api/v1/builds/", json={"name": "Build 2"}, headers=auth_headers)
+    assert response.status_code == 201
+    assert stats.count == 4
+    assert not _reads_after_write(stats, "builds")
+
+
+def test_update_build(client, auth_headers, build, query_budget):
+    with query_budget(6) as stats:
+        response = client.patch(
+            f"/api/v1/builds/{build['id']}", json={"status": "active"}, headers=auth_headers
+        )
+    assert response.status_code == 200
+    assert stats.count == 6
+    assert not _reads_after_write(stats, "builds")
+    assert response.json()["status"] == "active"
+
+
+def test_create_invoice(client, auth_headers, customer, query_budget):
+    with query_budget(8) as stats:
+        response = client.post("/api/v1/invoices/", json={
+            "customer_id": customer["id"],
+            "due_date": "2030-01-01T00:00:00Z",
+            "subtotal": "100.00",
+            "tax_rate": "19.00",
+        }, headers=auth_headers)
+    assert response.status_code == 201
+    assert stats.count == 8
+    assert not _reads_after_write(stats, "invoices")
+    assert response.json()["total_amount"] == "119.00"
+
+
+def test_update_invoice(client, auth_headers, invoice, query_budget):
+    with query_budget(12) as stats:
+        response = client.patch(
+            f"/api/v1/invoices/{invoice['id']}", json={"subtotal": "200.00"}, headers=auth_headers
+        )
+    assert response.status_code == 200
+    assert stats.count == 12
+    assert not _reads_after_write(stats, "invoices")
+    assert response.json()["total_amount"] == "238.00"